@@ -3,10 +3,14 @@ from __future__ import annotations
 
 # Music Imports
 from . import api_utils  # noqa: F401
+from . import database_executor  # noqa: F401
 from . import global_db  # noqa: F401
+from . import http_client  # noqa: F401
 from . import interface  # noqa: F401
 from . import local_db  # noqa: F401
 from . import playlist_interface  # noqa: F401
 from . import playlist_wrapper  # noqa: F401
 from . import spotify  # noqa: F401
+from . import upload_queue  # noqa: F401
+from . import write_queue  # noqa: F401
 from . import youtube  # noqa: F401
@@ -2,11 +2,29 @@
 from __future__ import annotations
 
 # Standard Library Imports
-from collections import namedtuple
+from collections import deque, namedtuple, OrderedDict
 from dataclasses import dataclass, field
-from typing import List, MutableMapping, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+import asyncio
+import contextlib
 import datetime
+import functools
 import logging
+import random
+import time
 
 # Dependency Imports
 import discord
@@ -25,11 +43,14 @@ from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import humanize_list
 
 # Music Imports
+from ..audio_logging import debug_exc_log
 from ..errors import InvalidPlaylistScope, MissingAuthor, MissingGuild
-from ..utils import PlaylistScope
+from ..utils import PlaylistScope, task_callback
 
 log = logging.getLogger("red.cogs.Music.api.utils")
 
+T = TypeVar("T")
+
 
 @dataclass
 class YouTubeCacheFetchResult:
@@ -51,6 +72,29 @@ class SpotifyCacheFetchResult:
             self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
 
 
+@dataclass
+class SpotifyCollectionCacheFetchResult:
+    query: Optional[List[MutableMapping]]
+    last_updated: int
+
+    def __post_init__(self):
+        if isinstance(self.last_updated, int):
+            self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
+
+        if isinstance(self.query, str):
+            self.query = json.loads(self.query)
+
+
+@dataclass
+class LyricsCacheFetchResult:
+    query: Optional[List[str]]
+    last_updated: int
+
+    def __post_init__(self):
+        if isinstance(self.query, str):
+            self.query = json.loads(self.query)
+
+
 @dataclass
 class LavalinkCacheFetchResult:
     query: Optional[MutableMapping]
@@ -103,6 +147,293 @@ class QueueFetchResult:
             self.track_object = lavalink.Track(self.track)
 
 
+class MemoryCache:
+    """Bounded in-memory LRU cache kept in front of a local cache table.
+
+    Entries are stored alongside their ``last_updated`` timestamp so they expire at the
+    same time the matching row would stop being returned by the database.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, maxage: int) -> Optional[Tuple[Any, int]]:
+        """Get the value and its last updated timestamp, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= maxage:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: Hashable, value: Any, last_updated: int) -> None:
+        """Add an entry, evicting the least recently used ones when full."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (value, last_updated)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def touch(self, key: Hashable) -> None:
+        """Mark an entry as recently used."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove an entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def stats(self) -> MutableMapping[str, int]:
+        """Return the current size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into a single in-flight call.
+
+    The first caller for a key starts the call, every caller arriving while it is still
+    running awaits the same result instead of making a request of its own.
+    """
+
+    __slots__ = ("_calls",)
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Retrieve the exception so it isn't logged when every caller went away.
+            future.exception()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func()``, or the call already in flight for ``key``."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(functools.partial(self._done, key))
+        # Shielded so a cancelled caller doesn't cancel the call for everyone else.
+        return await asyncio.shield(future)
+
+
+AutoplayCandidate = namedtuple("AutoplayCandidate", "uri title author")
+
+
+class CandidatePool:
+    """Compact references to the tracks autoplay can pick from.
+
+    Only the uri, title and author of each track payload returned by the loader are kept,
+    the picked candidate is loaded into a full track by the caller.
+    Picking is a ``random.choice`` over the references, the expensive loading is done by
+    :meth:`refresh` which callers run in the background once the pool is ``ttl`` seconds old.
+    An empty load only counts for ``retry_ttl`` seconds, a failed one not at all.
+    """
+
+    __slots__ = ("tracks", "ttl", "retry_ttl", "refreshed_at", "_refresh_task")
+
+    def __init__(self, ttl: float, retry_ttl: float = 30.0):
+        self.tracks: List[AutoplayCandidate] = []
+        self.ttl = ttl
+        self.retry_ttl = retry_ttl
+        self.refreshed_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    @property
+    def loaded(self) -> bool:
+        return self.refreshed_at is not None
+
+    @property
+    def stale(self) -> bool:
+        if self.refreshed_at is None:
+            return True
+        ttl = self.ttl if self.tracks else self.retry_ttl
+        return time.monotonic() - self.refreshed_at > ttl
+
+    def pick(self) -> Optional[AutoplayCandidate]:
+        """A random candidate, ``None`` if the pool is empty."""
+        return random.choice(self.tracks) if self.tracks else None
+
+    def refresh(self, loader: Callable[[], Awaitable[List[MutableMapping]]]) -> asyncio.Task:
+        """Replace the candidates with the tracks returned by `loader`, at most once at a time."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(loader))
+            self._refresh_task.add_done_callback(self._refresh_done)
+        return self._refresh_task
+
+    async def _refresh(self, loader: Callable[[], Awaitable[List[MutableMapping]]]) -> None:
+        tracks = await loader()
+        self.tracks = [
+            AutoplayCandidate(info["uri"], info.get("title", ""), info.get("author", ""))
+            for info in (track.get("info") or {} for track in tracks)
+            if info.get("uri")
+        ]
+        self.refreshed_at = time.monotonic()
+
+    @staticmethod
+    def _refresh_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            debug_exc_log(log, exc, "Failed to refresh autoplay candidates")
+
+    def cancel(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+
+
+class CircuitBreaker:
+    """Track the health of a remote API and stop calling it while it is failing.
+
+    The latency and outcome of the last ``window`` calls are kept. Once enough calls
+    have been seen the timeout shrinks to ``slack`` times the ``percentile`` latency,
+    so a slow API costs a fraction of the configured timeout per call.
+    When the error rate reaches ``error_threshold`` the circuit opens, :meth:`allow`
+    returns ``False`` and ``probe`` is called in the background with an increasing
+    delay until it succeeds, which closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        probe: Callable[[], Awaitable[bool]],
+        window: int = 50,
+        min_samples: int = 10,
+        error_threshold: float = 0.5,
+        percentile: float = 0.95,
+        slack: float = 1.5,
+        min_timeout: float = 0.5,
+        probe_interval: float = 15.0,
+        max_probe_interval: float = 300.0,
+    ):
+        self.name = name
+        self._probe = probe
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.error_threshold = error_threshold
+        self.percentile = percentile
+        self.slack = slack
+        self.min_timeout = min_timeout
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self._probe_task: Optional[asyncio.Task] = None
+        self.opened_at: Optional[float] = None
+        self.skipped = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    @property
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for (_, ok) in self._samples if not ok) / len(self._samples)
+
+    def allow(self) -> bool:
+        """Whether a call should be made right now."""
+        if self.opened_at is None:
+            return True
+        self.skipped += 1
+        return False
+
+    def timeout(self, max_timeout: float) -> float:
+        """The timeout to use for the next call, never more than `max_timeout`."""
+        latencies = sorted(latency for (latency, ok) in self._samples if ok)
+        if len(latencies) < self.min_samples:
+            return max_timeout
+        index = min(int(len(latencies) * self.percentile), len(latencies) - 1)
+        return min(max(latencies[index] * self.slack, self.min_timeout), max_timeout)
+
+    def record(self, latency: float, ok: bool = True) -> None:
+        """Record the outcome of a call."""
+        if self.opened_at is not None:
+            return
+        self._samples.append((latency, ok))
+        if (
+            not ok
+            and len(self._samples) >= self.min_samples
+            and self.error_rate >= self.error_threshold
+        ):
+            self.open()
+
+    def open(self) -> None:
+        """Stop allowing calls and start probing the API."""
+        if self.opened_at is not None:
+            return
+        log.warning(
+            "%s error rate is %.0f%%, pausing requests until it recovers",
+            self.name,
+            self.error_rate * 100,
+        )
+        self.opened_at = time.monotonic()
+        self._probe_task = asyncio.create_task(self._probe_until_healthy())
+        self._probe_task.add_done_callback(task_callback)
+
+    def close(self) -> None:
+        """Allow calls again and forget the samples recorded while the API was failing."""
+        self.opened_at = None
+        self._samples.clear()
+
+    async def _probe_until_healthy(self) -> None:
+        delay = self.probe_interval
+        while self.opened_at is not None:
+            await asyncio.sleep(delay)
+            with contextlib.suppress(Exception):
+                if await self._probe():
+                    log.info(
+                        "%s recovered after %.0fs, resuming requests",
+                        self.name,
+                        time.monotonic() - self.opened_at,
+                    )
+                    self.close()
+                    return
+            delay = min(delay * 2, self.max_probe_interval)
+
+    def cancel(self) -> None:
+        """Stop probing."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+
+
+def copy_lavalink_payload(value: MutableMapping) -> MutableMapping:
+    """Copy a Lavalink load result payload so each caller gets its own track dicts."""
+    copied = dict(value)
+    copied["tracks"] = [dict(track) for track in value.get("tracks", [])]
+    return copied
+
+
 def standardize_scope(scope: str) -> str:
     """Convert any of the used scopes into one we are expecting."""
     scope = scope.upper()
@@ -0,0 +1,120 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, MutableMapping, Optional, TypeVar, Union
+import asyncio
+import contextlib
+import functools
+import logging
+import threading
+
+# Dependency Imports
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+import apsw
+
+# Music Imports
+from ..sql_statements import PRAGMA_SET_temp_store
+
+log = logging.getLogger("red.cogs.Music.api.DatabaseExecutor")
+
+T = TypeVar("T")
+Values = Optional[Union[MutableMapping, tuple]]
+
+
+class DatabaseExecutor:
+    """Long-lived executor shared by every database wrapper.
+
+    All writes go through a single writer connection living on a dedicated thread,
+    reads are spread over a small pool of read-only connections, since the database
+    runs in WAL mode reads never have to wait behind a write.
+    """
+
+    def __init__(self, path: str, read_connections: int = 4):
+        self.path = path
+        self._read_pool_size = max(1, read_connections)
+        self._writer: APSWConnectionWrapper = APSWConnectionWrapper(path)
+        self._readers: List[APSWConnectionWrapper] = []
+        self._readers_lock = threading.Lock()
+        self._local = threading.local()
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="Music-DB-Writer"
+        )
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=self._read_pool_size, thread_name_prefix="Music-DB-Reader"
+        )
+        self._closed = False
+
+    @property
+    def writer(self) -> APSWConnectionWrapper:
+        """The connection used for every write, only use it from the writer thread."""
+        return self._writer
+
+    def _reader(self) -> APSWConnectionWrapper:
+        """Get the read-only connection owned by the current reader thread."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = APSWConnectionWrapper(self.path, flags=apsw.SQLITE_OPEN_READONLY)
+            conn.cursor().execute(PRAGMA_SET_temp_store)
+            self._local.connection = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    async def _run(self, executor: ThreadPoolExecutor, func: Callable[..., T], *args) -> T:
+        if self._closed:
+            raise RuntimeError("The database executor has been closed.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+    async def read(self, func: Callable[[APSWConnectionWrapper], T]) -> T:
+        """Run `func` with a read-only connection in the reader pool."""
+        return await self._run(self._read_executor, lambda: func(self._reader()))
+
+    async def write(self, func: Callable[[APSWConnectionWrapper], T]) -> T:
+        """Run `func` with the writer connection in the writer thread."""
+        return await self._run(self._write_executor, func, self._writer)
+
+    async def fetchone(self, statement: str, values: Values = None) -> Optional[tuple]:
+        """Fetch a single row."""
+        return await self.read(lambda conn: conn.cursor().execute(statement, values).fetchone())
+
+    async def fetchall(self, statement: str, values: Values = None) -> List[tuple]:
+        """Fetch all rows."""
+        return await self.read(lambda conn: conn.cursor().execute(statement, values).fetchall())
+
+    async def execute(self, statement: str, values: Values = None) -> None:
+        """Execute a write statement."""
+        await self.write(lambda conn: conn.cursor().execute(statement, values).fetchall())
+
+    async def executemany(self, statement: str, values: Iterable[Values]) -> None:
+        """Execute a write statement for each set of values inside a single transaction."""
+
+        def _executemany(conn: APSWConnectionWrapper) -> None:
+            with conn.transaction() as transaction:
+                transaction.executemany(statement, values)
+
+        await self.write(_executemany)
+
+    async def close(self) -> None:
+        """Wait for pending work to finish then close every connection.
+
+        The wait happens in the default executor, so the event loop keeps running while
+        the writer thread drains.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            with contextlib.suppress(Exception):
+                conn.close()
+        with contextlib.suppress(Exception):
+            self._writer.close()
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 # Standard Library Imports
 from copy import copy
-from typing import Mapping, Optional, TYPE_CHECKING, Union
+from typing import Mapping, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
 import asyncio
 import contextlib
 import logging
+import time
 
 # Dependency Imports
 import aiohttp
@@ -28,6 +29,7 @@ from redbot.core.commands import Cog
 # Music Imports
 from ..audio_dataclasses import Query
 from ..audio_logging import debug_exc_log, IS_DEBUG
+from .api_utils import CircuitBreaker, copy_lavalink_payload, SingleFlight
 
 if TYPE_CHECKING:
 
@@ -58,6 +60,8 @@ class GlobalCacheWrapper:
         self._handshake_token = ""
         self.has_api_key = None
         self._token: Mapping[str, str] = {}
+        self._inflight = SingleFlight()
+        self.breaker = CircuitBreaker("Global API", self._probe)
         self.cog = cog
 
     async def update_token(self, new_token: Mapping[str, str]):
@@ -79,9 +83,46 @@ class GlobalCacheWrapper:
         self._handshake_token = "||".join(map(str, id_list))
         return self.api_key
 
+    async def _get(
+        self, api_url: str, params: MutableMapping
+    ) -> Tuple[Union[dict, str], Optional[aiohttp.ClientResponse]]:
+        """GET `api_url`, recording the latency and outcome with the circuit breaker.
+
+        The timeout is the configured one, shrunk to what the API usually needs.
+        """
+        max_timeout = await self.config_cache.global_api_timeout.get_global()
+        search_response = "error"
+        response = None
+        start = time.monotonic()
+        try:
+            async with self.session.get(
+                api_url,
+                timeout=aiohttp.ClientTimeout(total=self.breaker.timeout(max_timeout)),
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+                params=params,
+            ) as response:
+                with contextlib.suppress(aiohttp.ContentTypeError):
+                    search_response = await response.json(loads=json.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            self.breaker.record(time.monotonic() - start, ok=False)
+            debug_exc_log(log, exc, "Failed to Get query: %s", api_url)
+        else:
+            self.breaker.record(time.monotonic() - start, ok=response.status < 500)
+        return search_response, response
+
+    async def _probe(self) -> bool:
+        async with self.session.get(
+            f"{_API_URL}api/v2/users/me",
+            timeout=aiohttp.ClientTimeout(
+                total=await self.config_cache.global_api_timeout.get_global()
+            ),
+            headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+        ) as response:
+            return response.status < 500
+
     async def get_call(self, query: Optional[Query] = None) -> dict:
         api_url = f"{_API_URL}api/v2/queries"
-        if not self.cog.global_api_user.get("can_read"):
+        if not self.cog.global_api_user.get("can_read") or not self.breaker.allow():
             return {}
         try:
             query = Query.process_input(query, self.cog.local_folder_current_path)
@@ -90,102 +131,108 @@ class GlobalCacheWrapper:
             await self._get_api_key()
             if self.api_key is None:
                 return {}
-            search_response = "error"
             query = query.lavalink_query
-            with contextlib.suppress(aiohttp.ContentTypeError, asyncio.TimeoutError):
-                async with self.session.get(
-                    api_url,
-                    timeout=aiohttp.ClientTimeout(
-                        total=await self.config_cache.global_api_timeout.get_global()
-                    ),
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                    params={"query": query},
-                ) as r:
-                    search_response = await r.json(loads=json.loads)
-                    if IS_DEBUG and "x-process-time" in r.headers:
-                        log.debug(
-                            "GET || Ping %s || Status code %d || %s",
-                            r.headers.get("x-process-time"),
-                            r.status,
-                            query,
-                        )
+
+            async def request() -> Union[dict, str]:
+                (search_response, r) = await self._get(api_url, params={"query": query})
+                if IS_DEBUG and r is not None and "x-process-time" in r.headers:
+                    log.debug(
+                        "GET || Ping %s || Status code %d || %s",
+                        r.headers.get("x-process-time"),
+                        r.status,
+                        query,
+                    )
+                return search_response
+
+            search_response = await self._inflight.run(("query", query), request)
             if "tracks" not in search_response:
                 return {}
-            return search_response
+            return copy_lavalink_payload(search_response)
         except Exception as err:
             debug_exc_log(log, err, "Failed to Get query: %s/%s", api_url, query)
         return {}
 
     async def get_spotify(self, title: str, author: Optional[str]) -> dict:
-        if not self.cog.global_api_user.get("can_read"):
+        if not self.cog.global_api_user.get("can_read") or not self.breaker.allow():
             return {}
         api_url = f"{_API_URL}api/v2/queries/spotify"
         try:
-            search_response = "error"
             params = {"title": title, "author": author}
             await self._get_api_key()
             if self.api_key is None:
                 return {}
-            with contextlib.suppress(aiohttp.ContentTypeError, asyncio.TimeoutError):
-                async with self.session.get(
-                    api_url,
-                    timeout=aiohttp.ClientTimeout(
-                        total=await self.config_cache.global_api_timeout.get_global()
-                    ),
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                    params=params,
-                ) as r:
-                    search_response = await r.json(loads=json.loads)
-                    if IS_DEBUG and "x-process-time" in r.headers:
-                        log.debug(
-                            "GET/spotify || Ping %s || Status code %d || %s - %s",
-                            r.headers.get("x-process-time"),
-                            r.status,
-                            title,
-                            author,
-                        )
+
+            async def request() -> Union[dict, str]:
+                (search_response, r) = await self._get(api_url, params=params)
+                if IS_DEBUG and r is not None and "x-process-time" in r.headers:
+                    log.debug(
+                        "GET/spotify || Ping %s || Status code %d || %s - %s",
+                        r.headers.get("x-process-time"),
+                        r.status,
+                        title,
+                        author,
+                    )
+                return search_response
+
+            search_response = await self._inflight.run(("spotify", title, author), request)
             if "tracks" not in search_response:
                 return {}
-            return search_response
+            return copy_lavalink_payload(search_response)
         except Exception as err:
             debug_exc_log(log, err, "Failed to Get query: %s", api_url)
         return {}
 
-    async def post_call(self, llresponse: LoadResult, query: Optional[Query]) -> None:
+    def prepare_upload(
+        self, llresponse: LoadResult, query: Optional[Query] = None
+    ) -> Optional[Tuple[str, str]]:
+        """Get the query and payload to post for a contribution, if it should be posted."""
+        if not self.cog.global_api_user.get("can_post"):
+            return None
+        query = Query.process_input(query, self.cog.local_folder_current_path)
+        if llresponse.has_error or llresponse.load_type.value in ["NO_MATCHES", "LOAD_FAILED"]:
+            return None
+        if not (query and query.valid and query.is_youtube):
+            return None
+        return query.lavalink_query, json.dumps(llresponse._raw)
+
+    async def upload(self, query: str, data: str) -> Optional[int]:
+        """Post a prepared contribution, returns the response status or ``None`` on failure."""
         try:
-            if not self.cog.global_api_user.get("can_post"):
-                return
-            query = Query.process_input(query, self.cog.local_folder_current_path)
-            if llresponse.has_error or llresponse.load_type.value in ["NO_MATCHES", "LOAD_FAILED"]:
-                return
-            if query and query.valid and query.is_youtube:
-                query = query.lavalink_query
-            else:
-                return None
             await self._get_api_key()
             if self.api_key is None:
                 return None
             api_url = f"{_API_URL}api/v2/queries"
             async with self.session.post(
                 api_url,
-                json=llresponse._raw,
-                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+                data=data,
+                headers={
+                    "Authorization": self.api_key,
+                    "X-Token": self._handshake_token,
+                    "Content-Type": "application/json",
+                },
                 params={"query": query},
             ) as r:
                 await r.read()
                 if IS_DEBUG and "x-process-time" in r.headers:
                     log.debug(
-                        "GET || Ping %s || Status code %d || %s",
+                        "POST || Ping %s || Status code %d || %s",
                         r.headers.get("x-process-time"),
                         r.status,
                         query,
                     )
+                return r.status
         except Exception as err:
             debug_exc_log(log, err, "Failed to post query: %s", query)
-        await asyncio.sleep(0)
+        return None
 
-    async def update_global(self, llresponse: LoadResult, query: Optional[Query] = None):
-        await self.post_call(llresponse=llresponse, query=query)
+    async def post_call(self, llresponse: LoadResult, query: Optional[Query]) -> None:
+        try:
+            prepared = self.prepare_upload(llresponse, query)
+        except Exception as err:
+            debug_exc_log(log, err, "Failed to post query: %s", query)
+            return
+        if prepared is not None:
+            await self.upload(*prepared)
 
     async def report_invalid(self, identification: str) -> None:
         if not self.cog.global_api_user.get("can_delete"):
@@ -206,15 +253,16 @@ class GlobalCacheWrapper:
         if (not is_enabled) or self.api_key is None:
             return global_api_user
         with contextlib.suppress(Exception):
-            async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-                async with session.get(
-                    f"{_API_URL}api/v2/users/me",
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                ) as resp:
-                    if resp.status == 200:
-                        search_response = await resp.json(loads=json.loads)
-                        global_api_user["fetched"] = True
-                        global_api_user["can_read"] = search_response.get("can_read", False)
-                        global_api_user["can_post"] = search_response.get("can_post", False)
-                        global_api_user["can_delete"] = search_response.get("can_delete", False)
+            async with self.cog.http.request(
+                "GET",
+                f"{_API_URL}api/v2/users/me",
+                service="global",
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+            ) as resp:
+                if resp.status == 200:
+                    search_response = await resp.json(loads=json.loads)
+                    global_api_user["fetched"] = True
+                    global_api_user["can_read"] = search_response.get("can_read", False)
+                    global_api_user["can_post"] = search_response.get("can_post", False)
+                    global_api_user["can_delete"] = search_response.get("can_delete", False)
         return global_api_user
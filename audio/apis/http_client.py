@@ -0,0 +1,152 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Final, MutableMapping, Union
+import asyncio
+import contextlib
+import logging
+import time
+
+# Dependency Imports
+import aiohttp
+
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    import json
+
+# Music Imports
+from ..audio_logging import IS_DEBUG
+
+log = logging.getLogger("red.cogs.Music.api.HTTPClient")
+
+_IDEMPOTENT_METHODS: Final[frozenset] = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+
+@dataclass(frozen=True)
+class ServicePolicy:
+    """Timeout and retry settings used for every request made to a service."""
+
+    timeout: aiohttp.ClientTimeout
+    retries: int = 2
+    backoff: float = 0.5
+
+
+SERVICE_POLICIES: Final[Dict[str, ServicePolicy]] = {
+    "default": ServicePolicy(aiohttp.ClientTimeout(total=30, connect=10)),
+    "lyrics": ServicePolicy(aiohttp.ClientTimeout(total=15, connect=5), retries=1),
+    "curated": ServicePolicy(aiohttp.ClientTimeout(total=30, connect=10)),
+    "global": ServicePolicy(aiohttp.ClientTimeout(total=10, connect=5), retries=1),
+    "github": ServicePolicy(aiohttp.ClientTimeout(total=30, connect=10)),
+    # The jar is large, only bound how long a single read may stall.
+    "lavalink": ServicePolicy(aiohttp.ClientTimeout(total=None, connect=30, sock_read=60)),
+}
+
+
+@dataclass
+class RequestMetrics:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def record(self, latency: float) -> None:
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class HTTPClient:
+    """Pooled HTTP client shared by every outbound call the cog makes.
+
+    A single connector keeps connections alive between calls and caches DNS lookups,
+    so repeated calls to the same host skip the TCP and TLS handshakes. Requests
+    made through :meth:`request` get the timeout and retry policy of their service.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        self._connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+        )
+        self.session = aiohttp.ClientSession(connector=self._connector, json_serialize=json.dumps)
+        self.metrics: Dict[str, RequestMetrics] = defaultdict(RequestMetrics)
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, service: str = "default", **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Make a request using the policy of `service`.
+
+        Idempotent requests are retried with an exponential backoff when the connection
+        fails, times out or the server answers with a 5xx status.
+        """
+        policy = SERVICE_POLICIES.get(service, SERVICE_POLICIES["default"])
+        metrics = self.metrics[service]
+        kwargs.setdefault("timeout", policy.timeout)
+        retries = policy.retries if method.upper() in _IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            metrics.requests += 1
+            start = time.monotonic()
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                metrics.errors += 1
+                if attempt >= retries:
+                    raise
+            else:
+                metrics.record(time.monotonic() - start)
+                if response.status < 500:
+                    break
+                metrics.errors += 1
+                if attempt >= retries:
+                    break
+                response.release()
+            attempt += 1
+            metrics.retries += 1
+            if IS_DEBUG:
+                log.debug("Retrying %s request to %s (attempt %d)", service, url, attempt)
+            await asyncio.sleep(policy.backoff * 2 ** (attempt - 1))
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def stats(self) -> MutableMapping[str, MutableMapping[str, Union[int, float]]]:
+        """Request counters and latency of every service used so far."""
+        return {
+            service: {
+                "requests": metrics.requests,
+                "retries": metrics.retries,
+                "errors": metrics.errors,
+                "average_latency": metrics.average_latency,
+                "max_latency": metrics.max_latency,
+            }
+            for service, metrics in self.metrics.items()
+        }
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        if not self.session.closed:
+            await self.session.close()
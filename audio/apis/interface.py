@@ -2,13 +2,29 @@
 from __future__ import annotations
 
 # Standard Library Imports
-from collections import namedtuple
-from typing import Callable, cast, List, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
+from collections import deque, namedtuple
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    cast,
+    Deque,
+    Hashable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import asyncio
 import contextlib
 import datetime
+import functools
+import itertools
 import logging
-import random
+import os
 import time
 
 # Dependency Imports
@@ -30,20 +46,28 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog, Context
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 # Music Imports
 from ..audio_dataclasses import Query
 from ..audio_logging import debug_exc_log, IS_DEBUG
 from ..errors import DatabaseError, SpotifyFetchError, TrackEnqueueError, YouTubeApiError
-from ..utils import CacheLevel, Notifier
-from .api_utils import LavalinkCacheFetchForGlobalResult
+from ..utils import CacheLevel, Notifier, PlaylistScope
+from .api_utils import (
+    CandidatePool,
+    copy_lavalink_payload,
+    LavalinkCacheFetchForGlobalResult,
+    SingleFlight,
+)
+from .database_executor import DatabaseExecutor
 from .global_db import GlobalCacheWrapper
 from .local_db import LocalCacheWrapper
+from .local_tracks_index import LocalTracksIndex
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
 from .playlist_wrapper import PlaylistWrapper
 from .spotify import SpotifyWrapper
+from .upload_queue import GlobalUploadQueue
+from .write_queue import CacheWriteQueue
 from .youtube import YouTubeWrapper
 
 if TYPE_CHECKING:
@@ -55,6 +79,15 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("red.cogs.Music.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
+_AUTOPLAYLIST_POOL_TTL = 600
+_LOCAL_LOAD_CONCURRENCY = 8
+_RECENT_POOL_TTL = 600
+_TOP_100_POOL_TTL = 3600
+_SPOTIFY_RESOLVE_WINDOW = 25
+_SPOTIFY_PAGE_CONCURRENCY = 5
+_SPOTIFY_RATE_LIMITED = (
+    "Spotify is rate limiting requests at the moment, try again in a few minutes."
+)
 # TODO: Get random from global Cache
 
 
@@ -69,7 +102,7 @@ class AudioAPIInterface:
         bot: Red,
         config: Config,
         session: aiohttp.ClientSession,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -94,128 +127,56 @@ class AudioAPIInterface:
             self.bot, self.config, self.conn, self.cog, self.config_cache
         )
         self._session: aiohttp.ClientSession = session
-        self._tasks: MutableMapping = {}
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self.global_uploads = GlobalUploadQueue(self.conn, self.global_cache_api)
+        self.write_queue = CacheWriteQueue(self.local_cache_api, self.global_uploads)
+        self.local_tracks = LocalTracksIndex(self.conn)
+        self._stage_limits: MutableMapping[str, asyncio.Semaphore] = {
+            "cache": asyncio.Semaphore(20),
+            "global": asyncio.Semaphore(10),
+            "youtube": asyncio.Semaphore(5),
+            "lavalink": asyncio.Semaphore(10),
+        }
+        self._inflight = SingleFlight()
+        self._autoplay_lookahead: MutableMapping[int, asyncio.Task] = {}
+        self._autoplay_pools: MutableMapping[Hashable, CandidatePool] = {}
 
     async def initialize(self) -> None:
         """Initialises the Local Cache connection."""
         await self.local_cache_api.lavalink.init()
         await self.persistent_queue_api.init()
+        await self.global_uploads.init()
+        await self.local_tracks.init()
+        self.write_queue.start()
+        self.global_uploads.start()
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Closes the Local Cache connection."""
-        self.local_cache_api.lavalink.close()
+        self.global_cache_api.breaker.cancel()
+        for task in self._autoplay_lookahead.values():
+            task.cancel()
+        self._autoplay_lookahead.clear()
+        for pool in self._autoplay_pools.values():
+            pool.cancel()
+        self._autoplay_pools.clear()
+        await self.local_cache_api.lavalink.close()
 
-    async def get_random_track_from_db(self, tries=0) -> Optional[MutableMapping]:
-        """Get a random track from the local database and return it."""
-        track: Optional[MutableMapping] = {}
+    async def run_all_pending_tasks(self) -> None:
+        """Flush all pending writes and stop the write queue, called on cog_unload."""
+        if IS_DEBUG:
+            log.debug("Running pending writes to database")
         try:
-            query_data = {}
-            date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=7)
-            date_timestamp = int(date.timestamp())
-            query_data["day"] = date_timestamp
-            max_age = await self.config_cache.local_cache_age.get_global()
-            maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
-                days=max_age
-            )
-            maxage_int = int(time.mktime(maxage.timetuple()))
-            query_data["maxage"] = maxage_int
-            track = await self.local_cache_api.lavalink.fetch_random(query_data)
-            if track is not None:
-                if track.get("loadType") == "V2_COMPACT":
-                    track["loadType"] = "V2_COMPAT"
-                results = LoadResult(track)
-                track = random.choice(list(results.tracks))
+            await self.write_queue.close()
+            await self.global_uploads.close()
+            await self.local_tracks.close()
         except Exception as exc:
-            debug_exc_log(log, exc, "Failed to fetch a random track from database")
-            track = {}
-
-        if not track:
-            return None
-
-        return track
-
-    async def route_tasks(
-        self,
-        action_type: str = None,
-        data: Union[List[MutableMapping], MutableMapping] = None,
-    ) -> None:
-        """Separate the tasks and run them in the appropriate functions."""
-
-        if not data:
-            return
-        if action_type == "insert" and isinstance(data, list):
-            for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.insert(d)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.insert(d)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.insert(d)
-        elif action_type == "update" and isinstance(data, dict):
-            for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.update(data)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.update(data)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.update(data)
-        elif action_type == "global" and isinstance(data, list):
-            await asyncio.gather(*[self.global_cache_api.update_global(**d) for d in data])
-
-    async def run_tasks(self, ctx: Optional[commands.Context] = None, message_id=None) -> None:
-        """Run tasks for a specific context."""
-        if message_id is not None:
-            lock_id = message_id
-        elif ctx is not None:
-            lock_id = ctx.message.id
+            debug_exc_log(log, exc, "Failed database writes")
         else:
-            return
-        lock_author = ctx.author if ctx else None
-        async with self._lock:
-            if lock_id in self._tasks:
-                if IS_DEBUG:
-                    log.debug("Running database writes for %d (%s)", lock_id, lock_author)
-                try:
-                    tasks = self._tasks[lock_id]
-                    tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
-                    await asyncio.gather(*tasks, return_exceptions=False)
-                    del self._tasks[lock_id]
-                except Exception as exc:
-                    debug_exc_log(
-                        log, exc, "Failed database writes for %d (%s)", lock_id, lock_author
-                    )
-                else:
-                    if IS_DEBUG:
-                        log.debug("Completed database writes for %d (%s)", lock_id, lock_author)
-
-    async def run_all_pending_tasks(self) -> None:
-        """Run all pending tasks left in the cache, called on cog_unload."""
-        async with self._lock:
             if IS_DEBUG:
-                log.debug("Running pending writes to database")
-            try:
-                tasks: MutableMapping = {"update": [], "insert": [], "global": []}
-                async for k, task in AsyncIter(self._tasks.items()):
-                    async for t, args in AsyncIter(task.items()):
-                        tasks[t].append(args)
-                self._tasks = {}
-                coro_tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
-
-                await asyncio.gather(*coro_tasks, return_exceptions=False)
-
-            except Exception as exc:
-                debug_exc_log(log, exc, "Failed database writes")
-            else:
-                if IS_DEBUG:
-                    log.debug("Completed pending writes to database have finished")
+                log.debug("Completed pending writes to database have finished")
 
-    def append_task(self, ctx: commands.Context, event: str, task: Tuple, _id: int = None) -> None:
-        """Add a task to the cache to be run later."""
-        lock_id = _id or ctx.message.id
-        if lock_id not in self._tasks:
-            self._tasks[lock_id] = {"update": [], "insert": [], "global": []}
-        self._tasks[lock_id][event].append(task)
+    async def append_task(self, event: str, task: Tuple) -> None:
+        """Add a write to the background write queue."""
+        await self.write_queue.put(event, task)
 
     async def fetch_spotify_query(
         self,
@@ -238,21 +199,30 @@ class AudioAPIInterface:
         youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
         youtube_api_error = None
         global_api = self.cog.global_api_user.get("can_read")
+        spotify_tracks = []
         async for track in AsyncIter(tracks):
             if isinstance(track, str):
                 break
             elif isinstance(track, dict) and track.get("error", {}).get("message") == "invalid id":
                 continue
-            (
-                song_url,
-                track_info,
-                uri,
-                artist_name,
-                track_name,
-                _id,
-                _type,
-            ) = await self.spotify_api.get_spotify_track_info(track, ctx)
-
+            spotify_tracks.append(await self.spotify_api.get_spotify_track_info(track, ctx))
+        cached_youtube_urls = {}
+        if youtube_cache and not skip_youtube:
+            try:
+                cached_youtube_urls = await self.local_cache_api.youtube.fetch_many(
+                    track[1] for track in spotify_tracks
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to bulk fetch tracks from YouTube table")
+        async for (
+            song_url,
+            track_info,
+            uri,
+            artist_name,
+            track_name,
+            _id,
+            _type,
+        ) in AsyncIter(spotify_tracks):
             database_entries.append(
                 {
                     "id": _id,
@@ -269,17 +239,7 @@ class AudioAPIInterface:
             if skip_youtube:
                 youtube_urls.append(track_info)
             else:
-                val = None
-                if youtube_cache:
-                    try:
-                        (val, last_update) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(
-                            log, exc, "Failed to fetch %r from YouTube table", track_info
-                        )
-
+                val, last_update = cached_youtube_urls.get(track_info, (None, None))
                 if val is None:
                     try:
                         val = await self.fetch_youtube_query(
@@ -290,7 +250,7 @@ class AudioAPIInterface:
                         youtube_api_error = err.message
                 if youtube_cache and val:
                     task = ("update", ("youtube", {"track": track_info}))
-                    self.append_task(ctx, *task)
+                    await self.append_task(*task)
                 if val:
                     youtube_urls.append(val)
             track_count += 1
@@ -307,75 +267,102 @@ class AudioAPIInterface:
                 break
         if CacheLevel.set_spotify().is_subset(current_cache_level):
             task = ("insert", ("spotify", database_entries))
-            self.append_task(ctx, *task)
+            await self.append_task(*task)
         return youtube_urls
 
     async def fetch_from_spotify_api(
         self,
         query_type: str,
         uri: str,
-        recursive: Union[str, bool] = False,
         params: MutableMapping = None,
         notifier: Optional[Notifier] = None,
         ctx: Context = None,
     ) -> Union[List[MutableMapping], List[str]]:
         """Gets track info from spotify API."""
+        tracks = []
+        async for (page, _total) in self.iter_spotify_pages(query_type, uri, notifier=notifier):
+            tracks.extend(page)
+        return tracks
 
-        if recursive is False:
-            (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
-            results = await self.spotify_api.make_get_call(call, params)
+    async def iter_spotify_pages(
+        self, query_type: str, uri: str, notifier: Optional[Notifier] = None
+    ) -> AsyncIterator[Tuple[List[MutableMapping], int]]:
+        """Yield the tracks of a Spotify query one page at a time, with the total track count.
+
+        The first page tells us how many tracks there are, the remaining pages are then
+        fetched concurrently and yielded in order as soon as they are available.
+        """
+        (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
+        if query_type == "track":
+            results = await self.spotify_api.get_track(uri)
         else:
-            if isinstance(recursive, str):
-                results = await self.spotify_api.make_get_call(recursive, params)
-            else:
-                results = {}
-        try:
-            if results["error"]["status"] == 401 and not recursive:
+            results = await self.spotify_api.make_get_call(call, params)
+        with contextlib.suppress(KeyError):
+            if results["error"]["status"] == 401:
                 raise SpotifyFetchError(
                     (
                         "The Spotify API key or client secret has not been set properly. "
                         "\nUse `{prefix}audioset spotifyapi` for instructions."
                     )
                 )
-            elif recursive:
-                return {"next": None}
-        except KeyError:
-            pass
-        if recursive:
-            return results
-        tracks = []
-        track_count = 0
-        total_tracks = results.get("tracks", results).get("total", 1)
-        while True:
-            new_tracks: List = []
-            if query_type == "track":
-                new_tracks = results
-                tracks.append(new_tracks)
-            elif query_type == "album":
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = tracks_raw
-                    tracks.extend(new_tracks)
-            else:
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = [k["track"] for k in tracks_raw if k.get("track")]
-                    tracks.extend(new_tracks)
-            track_count += len(new_tracks)
+            elif results["error"]["status"] == 429:
+                raise SpotifyFetchError(_SPOTIFY_RATE_LIMITED)
+        if query_type == "track":
             if notifier:
-                await notifier.notify_user(current=track_count, total=total_tracks, key="spotify")
-            try:
-                if results.get("next") is None:
-                    break
-                results = await self.fetch_from_spotify_api(
-                    query_type, uri, results["next"], params, notifier=notifier
-                )
-                continue
-            except KeyError:
-                raise SpotifyFetchError(
-                    "This doesn't seem to be a valid Spotify playlist/album URL or code."
+                await notifier.notify_user(current=1, total=1, key="spotify")
+            yield ([results], 1)
+            return
+        page = results.get("tracks", results)
+        if "items" not in page:
+            return
+        total_tracks = page.get("total", 1)
+        track_count = 0
+        new_tracks = self._spotify_page_tracks(query_type, page)
+        track_count += len(new_tracks)
+        if notifier:
+            await notifier.notify_user(current=track_count, total=total_tracks, key="spotify")
+        yield (new_tracks, total_tracks)
+        limit = page.get("limit") or len(page["items"])
+        if page.get("next") is None or not limit:
+            return
+
+        semaphore = asyncio.Semaphore(_SPOTIFY_PAGE_CONCURRENCY)
+
+        async def fetch_page(offset: int) -> MutableMapping:
+            async with semaphore:
+                return await self.spotify_api.make_get_call(
+                    call, {**params, "offset": offset, "limit": limit}
                 )
-        return tracks
+
+        pages = [
+            asyncio.create_task(fetch_page(offset))
+            for offset in range(page.get("offset", 0) + limit, total_tracks, limit)
+        ]
+        try:
+            for page_task in pages:
+                results = await page_task
+                if "error" in results:
+                    if results["error"].get("status") == 429:
+                        # Don't hand back a silently truncated playlist.
+                        raise SpotifyFetchError(_SPOTIFY_RATE_LIMITED)
+                    break
+                new_tracks = self._spotify_page_tracks(query_type, results.get("tracks", results))
+                track_count += len(new_tracks)
+                if notifier:
+                    await notifier.notify_user(
+                        current=track_count, total=total_tracks, key="spotify"
+                    )
+                yield (new_tracks, total_tracks)
+        finally:
+            for page_task in pages:
+                page_task.cancel()
+
+    @staticmethod
+    def _spotify_page_tracks(query_type: str, page: MutableMapping) -> List[MutableMapping]:
+        tracks_raw = page.get("items", [])
+        if query_type == "album":
+            return tracks_raw
+        return [k["track"] for k in tracks_raw if k.get("track")]
 
     async def spotify_query(
         self,
@@ -432,7 +419,7 @@ class AudioAPIInterface:
         else:
             if query_type == "track" and cache_enabled:
                 task = ("update", ("spotify", {"uri": f"spotify:track:{uri}"}))
-                self.append_task(ctx, *task)
+                await self.append_task(*task)
             youtube_urls.append(val)
         return youtube_urls
 
@@ -447,6 +434,7 @@ class AudioAPIInterface:
         notifier: Optional[Notifier] = None,
         forced: bool = False,
         query_global: bool = True,
+        started: Optional[asyncio.Event] = None,
     ) -> List[lavalink.Track]:
         """Queries the Database then falls back to Spotify and YouTube APIs then Enqueued matched
         tracks.
@@ -471,6 +459,8 @@ class AudioAPIInterface:
             Whether or not to query the global API.
         forced: bool
             Ignore Cache and make a fetch from API.
+        started: asyncio.Event
+            Set and the lock released as soon as the first track has been enqueued.
         Returns
         -------
         List[str]
@@ -481,19 +471,57 @@ class AudioAPIInterface:
         global_entry = globaldb_toggle and query_global
         track_list: List = []
         has_not_allowed = False
+        disconnected = False
         youtube_api_error = None
-        skip_youtube_api = False
+        pending: Deque[Tuple[int, Tuple[str, ...], asyncio.Task]] = deque()
+        pages: Optional[AsyncGenerator[Tuple[List[MutableMapping], int], None]] = None
         try:
             current_cache_level = await self.config_cache.local_cache_level.get_global()
             enqueued_tracks = 0
             consecutive_fails = 0
-            queue_dur = await self.cog.queue_duration(ctx)
-            queue_total_duration = self.cog.format_time(queue_dur)
             before_queue_length = len(player.queue)
-            tracks_from_spotify = await self.fetch_from_spotify_api(
-                query_type, uri, params=None, notifier=notifier
-            )
-            total_tracks = len(tracks_from_spotify)
+            queue_dur = await self.cog.queue_time_until(ctx, before_queue_length + 1)
+            spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
+            collection_uri = f"spotify:{query_type}:{uri}"
+            snapshot_id = None
+            if spotify_cache and query_type in ["album", "playlist"]:
+                snapshot_id = await self.spotify_api.get_snapshot_id(query_type, uri)
+            if snapshot_id is not None and not forced:
+                (cached_tracks, _) = await self.local_cache_api.spotify_collection.fetch_one(
+                    {"uri": collection_uri, "snapshot_id": snapshot_id}
+                )
+                if cached_tracks:
+                    # Nothing changed since this playlist was last resolved.
+                    async for track_data in AsyncIter(cached_tracks):
+                        if enqueue and player.channel is None:
+                            break
+                        single_track = lavalink.Track(track_data)
+                        enqueued = await self._enqueue_resolved_track(
+                            ctx, player, single_track, enqueue=enqueue, lock=lock, started=started
+                        )
+                        if enqueued is None:
+                            continue
+                        track_list.append(single_track)
+                        enqueued_tracks += enqueued
+                    if enqueue:
+                        await self._notify_playlist_enqueued(
+                            ctx,
+                            notifier,
+                            total_tracks=len(cached_tracks),
+                            enqueued_tracks=enqueued_tracks,
+                            queue_dur=queue_dur,
+                            before_queue_length=before_queue_length,
+                        )
+                    lock(ctx, False)
+                    player.maybe_shuffle()
+                    task = ("update", ("spotify_collection", {"uri": collection_uri}))
+                    await self.append_task(*task)
+                    return track_list
+            pages = self.iter_spotify_pages(query_type, uri, notifier=notifier)
+            try:
+                (first_page, total_tracks) = await pages.__anext__()
+            except StopAsyncIteration:
+                (first_page, total_tracks) = ([], 0)
             if total_tracks < 1 and notifier is not None:
                 lock(ctx, False)
                 embed3 = discord.Embed(
@@ -506,8 +534,69 @@ class AudioAPIInterface:
             database_entries = []
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
-            spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
-            async for track_count, track in AsyncIter(tracks_from_spotify).enumerate(start=1):
+            collection_tracks: List[MutableMapping] = []
+            fully_resolved = False
+            spotify_tracks: Deque[Tuple[str, ...]] = deque()
+            cached_youtube_urls = {}
+            resolve_state: MutableMapping = {"skip_youtube_api": False}
+            page_state: MutableMapping = {"exhausted": False}
+            track_counter = itertools.count(1)
+
+            async def add_page(page: List[MutableMapping]) -> None:
+                page_tracks = [
+                    await self.spotify_api.get_spotify_track_info(track, ctx)
+                    async for track in AsyncIter(page)
+                ]
+                if youtube_cache:
+                    try:
+                        cached_youtube_urls.update(
+                            await self.local_cache_api.youtube.fetch_many(
+                                track[1] for track in page_tracks
+                            )
+                        )
+                    except Exception as exc:
+                        debug_exc_log(log, exc, "Failed to bulk fetch tracks from YouTube table")
+                spotify_tracks.extend(page_tracks)
+
+            async def schedule_resolutions() -> None:
+                # Keep a bounded window of tracks resolving in the background, fed page by
+                # page as Spotify answers, results are still consumed in playlist order below.
+                while len(pending) < _SPOTIFY_RESOLVE_WINDOW:
+                    if not spotify_tracks:
+                        if page_state["exhausted"]:
+                            return
+                        try:
+                            (page, _total) = await pages.__anext__()
+                        except StopAsyncIteration:
+                            page_state["exhausted"] = True
+                            return
+                        await add_page(page)
+                        continue
+                    spotify_track = spotify_tracks.popleft()
+                    resolution = asyncio.create_task(
+                        self._resolve_spotify_track(
+                            ctx,
+                            player,
+                            spotify_track,
+                            cached_youtube_urls.get(spotify_track[1], (None, None))[0],
+                            query_global=query_global,
+                            forced=forced,
+                            current_cache_level=current_cache_level,
+                            state=resolve_state,
+                        )
+                    )
+                    pending.append((next(track_counter), spotify_track, resolution))
+
+            await add_page(first_page)
+            await schedule_resolutions()
+            while pending:
+                if enqueue and player.channel is None:
+                    # Disconnected while loading, there is no queue left to add to.
+                    disconnected = True
+                    break
+                track_count, spotify_track, resolution = pending.popleft()
+                track_object, track_youtube_api_error, abort_title = await resolution
+                await schedule_resolutions()
                 (
                     song_url,
                     track_info,
@@ -516,7 +605,7 @@ class AudioAPIInterface:
                     track_name,
                     _id,
                     _type,
-                ) = await self.spotify_api.get_spotify_track_info(track, ctx)
+                ) = spotify_track
 
                 database_entries.append(
                     {
@@ -531,81 +620,15 @@ class AudioAPIInterface:
                         "last_fetched": time_now,
                     }
                 )
-                val = None
-                llresponse = None
-                if youtube_cache:
-                    try:
-                        (val, last_updated) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(
-                            log, exc, "Failed to fetch %r from YouTube table", track_info
-                        )
-                should_query_global = globaldb_toggle and query_global and val is None
-                if should_query_global:
-                    llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
-                    if llresponse:
-                        if llresponse.get("loadType") == "V2_COMPACT":
-                            llresponse["loadType"] = "V2_COMPAT"
-                        llresponse = LoadResult(llresponse)
-                    val = llresponse or None
-                if val is None and not skip_youtube_api:
-                    try:
-                        val = await self.fetch_youtube_query(
-                            ctx, track_info, current_cache_level=current_cache_level
-                        )
-                    except YouTubeApiError as err:
-                        val = None
-                        youtube_api_error = err.message
-                        skip_youtube_api = True
-                if not youtube_api_error:
-                    if youtube_cache and val and llresponse is None:
-                        task = ("update", ("youtube", {"track": track_info}))
-                        self.append_task(ctx, *task)
-
-                    if isinstance(llresponse, LoadResult):
-                        track_object = llresponse.tracks
-                    elif val:
-                        result = None
-                        if should_query_global:
-                            llresponse = await self.global_cache_api.get_call(val)
-                            if llresponse:
-                                if llresponse.get("loadType") == "V2_COMPACT":
-                                    llresponse["loadType"] = "V2_COMPAT"
-                                llresponse = LoadResult(llresponse)
-                            result = llresponse or None
-                        if not result:
-                            try:
-                                (result, called_api) = await self.fetch_track(
-                                    ctx,
-                                    player,
-                                    Query.process_input(val, self.cog.local_folder_current_path),
-                                    forced=forced,
-                                    should_query_global=not should_query_global,
-                                )
-                            except (RuntimeError, aiohttp.ServerDisconnectedError):
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title="The connection was reset while loading the playlist.",
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                            except asyncio.TimeoutError:
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title="Player timeout, skipping remaining tracks.",
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                        track_object = result.tracks
-                    else:
-                        track_object = []
-                else:
+                if abort_title is not None:
+                    lock(ctx, False)
+                    error_embed = discord.Embed(colour=await ctx.embed_colour(), title=abort_title)
+                    if notifier is not None:
+                        await notifier.update_embed(error_embed)
+                    break
+                if track_youtube_api_error and not youtube_api_error:
+                    youtube_api_error = track_youtube_api_error
+                if youtube_api_error:
                     track_object = []
                 if (track_count % 2 == 0) or (track_count == total_tracks):
                     key = "lavalink"
@@ -638,94 +661,28 @@ class AudioAPIInterface:
                     continue
                 consecutive_fails = 0
                 single_track = track_object[0]
-                query = Query.process_input(single_track, self.cog.local_folder_current_path)
-                if not await self.cog.is_query_allowed(
-                    self.config_cache,
-                    ctx,
-                    f"{single_track.title} {single_track.author} {single_track.uri} {query}",
-                    query_obj=query,
-                ):
+                collection_tracks.append(self.cog.track_to_json(single_track))
+                enqueued = await self._enqueue_resolved_track(
+                    ctx, player, single_track, enqueue=enqueue, lock=lock, started=started
+                )
+                if enqueued is None:
                     has_not_allowed = True
-                    if IS_DEBUG:
-                        log.debug("Query is not allowed in %r (%d)", ctx.guild.name, ctx.guild.id)
                     continue
                 track_list.append(single_track)
-                if enqueue:
-                    if len(
-                        player.queue
-                    ) >= await self.config_cache.max_queue_size.get_context_value(player.guild):
-                        continue
-
-                    if (
-                        max_length := await self.config_cache.max_track_length.get_context_value(
-                            ctx.guild
-                        )
-                    ) > 0:
-                        if self.cog.is_track_length_allowed(single_track, max_length):
-                            enqueued_tracks += 1
-                            single_track.extras.update(
-                                {
-                                    "enqueue_time": int(time.time()),
-                                    "vc": player.channel.id,
-                                    "requester": ctx.author.id,
-                                }
-                            )
-                            player.add(ctx.author, single_track)
-                            self.bot.dispatch(
-                                "red_audio_track_enqueue",
-                                player.guild,
-                                single_track,
-                                ctx.author,
-                            )
-                    else:
-                        enqueued_tracks += 1
-                        single_track.extras.update(
-                            {
-                                "enqueue_time": int(time.time()),
-                                "vc": player.channel.id,
-                                "requester": ctx.author.id,
-                            }
-                        )
-                        player.add(ctx.author, single_track)
-                        self.bot.dispatch(
-                            "red_audio_track_enqueue",
-                            player.guild,
-                            single_track,
-                            ctx.author,
-                        )
-
-                    if not player.current:
-                        await player.play()
-            if enqueue and tracks_from_spotify:
-                if total_tracks > enqueued_tracks:
-                    maxlength_msg = " {bad_tracks} tracks cannot be queued.".format(
-                        bad_tracks=(total_tracks - enqueued_tracks)
-                    )
-                else:
-                    maxlength_msg = ""
-
-                embed = discord.Embed(
-                    colour=await ctx.embed_colour(),
-                    title="Playlist Enqueued",
-                    description="Added {num} tracks to the queue.{maxlength_msg}".format(
-                        num=enqueued_tracks, maxlength_msg=maxlength_msg
-                    ),
+                enqueued_tracks += enqueued
+            else:
+                fully_resolved = True
+            if enqueue and total_tracks:
+                await self._notify_playlist_enqueued(
+                    ctx,
+                    notifier,
+                    total_tracks=total_tracks,
+                    enqueued_tracks=enqueued_tracks,
+                    queue_dur=queue_dur,
+                    before_queue_length=before_queue_length,
                 )
-                if (
-                    not await self.config_cache.shuffle.get_context_value(ctx.guild)
-                    and queue_dur > 0
-                ):
-                    embed.set_footer(
-                        text=(
-                            "{time} until start of playlist"
-                            " playback: starts at #{position} in queue"
-                        ).format(time=queue_total_duration, position=before_queue_length + 1)
-                    )
-
-                if notifier is not None:
-                    await notifier.update_embed(embed)
             lock(ctx, False)
-            if not track_list and not has_not_allowed:
+            if not track_list and not has_not_allowed and not disconnected:
                 raise SpotifyFetchError(
                     message=(
                         "Nothing found.\nThe YouTube API key may be invalid "
@@ -738,22 +695,223 @@ class AudioAPIInterface:
 
             if spotify_cache:
                 task = ("insert", ("spotify", database_entries))
-                self.append_task(ctx, *task)
+                await self.append_task(*task)
+            if (
+                snapshot_id is not None
+                and fully_resolved
+                and not youtube_api_error
+                and collection_tracks
+            ):
+                task = (
+                    "insert",
+                    (
+                        "spotify_collection",
+                        [
+                            {
+                                "uri": collection_uri,
+                                "snapshot_id": snapshot_id,
+                                "tracks": json.dumps(collection_tracks),
+                                "last_updated": time_now,
+                                "last_fetched": time_now,
+                            }
+                        ],
+                    ),
+                )
+                await self.append_task(*task)
         except Exception as exc:
             lock(ctx, False)
             raise exc
         finally:
+            for _count, _track, resolution in pending:
+                resolution.cancel()
+            if pages is not None:
+                await pages.aclose()
             lock(ctx, False)
         return track_list
 
+    async def _enqueue_resolved_track(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        single_track: lavalink.Track,
+        enqueue: bool,
+        lock: Callable,
+        started: Optional[asyncio.Event] = None,
+    ) -> Optional[bool]:
+        """Add a resolved Spotify track to the player's queue.
+
+        Returns None if the track isn't allowed in this guild, otherwise whether or not it
+        was enqueued.
+        """
+        query = Query.process_input(single_track, self.cog.local_folder_current_path)
+        if not await self.cog.is_query_allowed(
+            self.config_cache,
+            ctx,
+            f"{single_track.title} {single_track.author} {single_track.uri} {query}",
+            query_obj=query,
+        ):
+            if IS_DEBUG:
+                log.debug("Query is not allowed in %r (%d)", ctx.guild.name, ctx.guild.id)
+            return None
+        if not enqueue or player.channel is None:
+            return False
+        if len(player.queue) >= await self.config_cache.max_queue_size.get_context_value(
+            player.guild
+        ):
+            return False
+        enqueued = False
+        max_length = await self.config_cache.max_track_length.get_context_value(ctx.guild)
+        if max_length <= 0 or self.cog.is_track_length_allowed(single_track, max_length):
+            enqueued = True
+            single_track.extras.update(
+                {
+                    "enqueue_time": int(time.time()),
+                    "vc": player.channel.id,
+                    "requester": ctx.author.id,
+                }
+            )
+            player.add(ctx.author, single_track)
+            self.bot.dispatch(
+                "red_audio_track_enqueue",
+                player.guild,
+                single_track,
+                ctx.author,
+            )
+
+        if not player.current:
+            await player.play()
+        if started is not None and not started.is_set():
+            # Playback has started, let the caller return and free the
+            # player lock while the rest of the playlist keeps loading.
+            lock(ctx, False)
+            started.set()
+        return enqueued
+
+    async def _notify_playlist_enqueued(
+        self,
+        ctx: commands.Context,
+        notifier: Optional[Notifier],
+        total_tracks: int,
+        enqueued_tracks: int,
+        queue_dur: int,
+        before_queue_length: int,
+    ) -> None:
+        if total_tracks > enqueued_tracks:
+            maxlength_msg = " {bad_tracks} tracks cannot be queued.".format(
+                bad_tracks=(total_tracks - enqueued_tracks)
+            )
+        else:
+            maxlength_msg = ""
+
+        embed = discord.Embed(
+            colour=await ctx.embed_colour(),
+            title="Playlist Enqueued",
+            description="Added {num} tracks to the queue.{maxlength_msg}".format(
+                num=enqueued_tracks, maxlength_msg=maxlength_msg
+            ),
+        )
+        if not await self.config_cache.shuffle.get_context_value(ctx.guild) and queue_dur > 0:
+            embed.set_footer(
+                text=(
+                    "{time} until start of playlist playback: starts at #{position} in queue"
+                ).format(time=self.cog.format_time(queue_dur), position=before_queue_length + 1)
+            )
+
+        if notifier is not None:
+            await notifier.update_embed(embed)
+
+    async def _resolve_spotify_track(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        spotify_track: Tuple[str, ...],
+        val: Optional[str],
+        query_global: bool,
+        forced: bool,
+        current_cache_level: CacheLevel,
+        state: MutableMapping,
+    ) -> Tuple[List[lavalink.Track], Optional[str], Optional[str]]:
+        """Resolve a single Spotify track into Lavalink tracks.
+
+        Returns the matched tracks, the YouTube API error message if one was raised and
+        the title of the error to show if loading the rest of the playlist should be aborted.
+        """
+        (song_url, track_info, uri, artist_name, track_name, _id, _type) = spotify_track
+        should_query_global = (
+            self.cog.global_api_user.get("can_read") and query_global and val is None
+        )
+        llresponse = None
+        if should_query_global:
+            async with self._stage_limits["global"]:
+                llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
+            if llresponse:
+                if llresponse.get("loadType") == "V2_COMPACT":
+                    llresponse["loadType"] = "V2_COMPAT"
+                llresponse = LoadResult(llresponse)
+            val = llresponse or None
+        if val is None and not state["skip_youtube_api"]:
+            try:
+                val = await self.fetch_youtube_query(
+                    ctx, track_info, current_cache_level=current_cache_level
+                )
+            except YouTubeApiError as err:
+                state["skip_youtube_api"] = True
+                return [], err.message, None
+        if CacheLevel.set_youtube().is_subset(current_cache_level) and val and llresponse is None:
+            task = ("update", ("youtube", {"track": track_info}))
+            await self.append_task(*task)
+
+        if isinstance(llresponse, LoadResult):
+            return llresponse.tracks, None, None
+        if not val:
+            return [], None, None
+        result = None
+        if should_query_global:
+            async with self._stage_limits["global"]:
+                llresponse = await self.global_cache_api.get_call(val)
+            if llresponse:
+                if llresponse.get("loadType") == "V2_COMPACT":
+                    llresponse["loadType"] = "V2_COMPAT"
+                llresponse = LoadResult(llresponse)
+            result = llresponse or None
+        if not result:
+            try:
+                (result, called_api) = await self.fetch_track(
+                    ctx,
+                    player,
+                    Query.process_input(val, self.cog.local_folder_current_path),
+                    forced=forced,
+                    should_query_global=not should_query_global,
+                )
+            except (RuntimeError, aiohttp.ServerDisconnectedError):
+                return [], None, "The connection was reset while loading the playlist."
+            except asyncio.TimeoutError:
+                return [], None, "Player timeout, skipping remaining tracks."
+        return result.tracks, None, None
+
     async def fetch_youtube_query(
         self,
         ctx: commands.Context,
         track_info: str,
         current_cache_level: CacheLevel = CacheLevel.none(),
     ) -> Optional[str]:
-        """Call the Youtube API and returns the youtube URL that the query matched."""
-        track_url = await self.youtube_api.get_call(track_info)
+        """Call the Youtube API and returns the youtube URL that the query matched.
+
+        Once the YouTube Data API budget for the day is spent this returns a Lavalink
+        search query for `fetch_track` to resolve instead.
+        """
+        await self.youtube_api.quota.load()
+        if not self.youtube_api.quota.has_budget():
+            if IS_DEBUG:
+                log.debug("YouTube quota spent, searching %r through Lavalink", track_info)
+            return f"ytsearch:{track_info}"
+        try:
+            async with self._stage_limits["youtube"]:
+                track_url = await self.youtube_api.get_call(track_info)
+        except YouTubeApiError:
+            if self.youtube_api.quota.has_budget():
+                raise
+            return f"ytsearch:{track_info}"
         if CacheLevel.set_youtube().is_subset(current_cache_level) and track_url:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             task = (
@@ -770,7 +928,7 @@ class AudioAPIInterface:
                     ],
                 ),
             )
-            self.append_task(ctx, *task)
+            await self.append_task(*task)
         return track_url
 
     async def fetch_from_youtube_api(
@@ -795,10 +953,14 @@ class AudioAPIInterface:
         else:
             if cache_enabled:
                 task = ("update", ("youtube", {"track": track_info}))
-                self.append_task(ctx, *task)
+                await self.append_task(*task)
             youtube_url = val
         return youtube_url
 
+    async def _load_tracks(self, player: lavalink.Player, query_string: str) -> LoadResult:
+        async with self._stage_limits["lavalink"]:
+            return await player.load_tracks(query_string)
+
     async def fetch_track(
         self,
         ctx: commands.Context,
@@ -843,11 +1005,19 @@ class AudioAPIInterface:
         prefer_lyrics = await self.cog.get_lyrics_status(ctx)
         if prefer_lyrics and query.is_youtube and query.is_search:
             query_string = f"{query} - lyrics"
+        local_file = None
+        local_stats = {}
+        if cache_enabled and query.is_local and query.single_track:
+            local_file = os.path.abspath(query.track)
+            local_stats = await self.local_tracks.file_stats([local_file])
+            if not forced and local_stats:
+                val = (await self.local_tracks.fetch_loads(local_stats)).get(local_file)
         if cache_enabled and not forced and not query.is_local:
             try:
-                (val, last_updated) = await self.local_cache_api.lavalink.fetch_one(
-                    {"query": query_string}
-                )
+                async with self._stage_limits["cache"]:
+                    (val, last_updated) = await self.local_cache_api.lavalink.fetch_one(
+                        {"query": query_string}
+                    )
             except Exception as exc:
                 debug_exc_log(log, exc, "Failed to fetch %r from Lavalink table", query_string)
 
@@ -855,7 +1025,7 @@ class AudioAPIInterface:
                 if IS_DEBUG:
                     log.debug("Updating Local Database with %r", query_string)
                 task = ("update", ("lavalink", {"query": query_string}))
-                self.append_task(ctx, *task)
+                await self.append_task(*task)
             else:
                 val = None
 
@@ -874,7 +1044,8 @@ class AudioAPIInterface:
         ):
             valid_global_entry = False
             with contextlib.suppress(Exception):
-                global_entry = await self.global_cache_api.get_call(query=query)
+                async with self._stage_limits["global"]:
+                    global_entry = await self.global_cache_api.get_call(query=query)
                 if global_entry.get("loadType") == "V2_COMPACT":
                     global_entry["loadType"] = "V2_COMPAT"
                 results = LoadResult(global_entry)
@@ -909,7 +1080,11 @@ class AudioAPIInterface:
                 log.debug("Querying Lavalink api for %r", query_string)
             called_api = True
             try:
-                results = await player.load_tracks(query_string)
+                results = await self._inflight.run(
+                    query_string, functools.partial(self._load_tracks, player, query_string)
+                )
+                # Every caller coalesced on this query gets its own tracks.
+                results = LoadResult(copy_lavalink_payload(results._raw))
             except KeyError:
                 results = None
             except RuntimeError:
@@ -928,7 +1103,14 @@ class AudioAPIInterface:
                 and len(results.tracks) >= 1
             ):
                 global_task = ("global", dict(llresponse=results, query=query))
-                self.append_task(ctx, *global_task)
+                await self.append_task(*global_task)
+        if local_file in local_stats and called_api and not results.has_error and results.tracks:
+            try:
+                await self.local_tracks.store_load(
+                    local_file, local_stats[local_file], json.dumps(results._raw)
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to cache the load result of %r", local_file)
         if (
             cache_enabled
             and results.load_type
@@ -954,7 +1136,7 @@ class AudioAPIInterface:
                             ],
                         ),
                     )
-                    self.append_task(ctx, *task)
+                    await self.append_task(*task)
             except Exception as exc:
                 debug_exc_log(
                     log,
@@ -964,94 +1146,222 @@ class AudioAPIInterface:
                 )
         return results, called_api
 
+    async def fetch_local_tracks(
+        self, ctx: commands.Context, player: lavalink.Player, queries: List[Query]
+    ) -> List[lavalink.Track]:
+        """Load local files, in order, skipping the ones that fail to load.
+
+        Files whose size and mtime match their cached load result are not sent to Lavalink,
+        the others are loaded with at most ``_LOCAL_LOAD_CONCURRENCY`` loads at a time.
+        """
+        current_cache_level = await self.config_cache.local_cache_level.get_global()
+        cached = {}
+        if CacheLevel.set_lavalink().is_subset(current_cache_level):
+            paths = [os.path.abspath(query.track) for query in queries]
+            cached = await self.local_tracks.fetch_loads(await self.local_tracks.file_stats(paths))
+        semaphore = asyncio.Semaphore(_LOCAL_LOAD_CONCURRENCY)
+
+        async def _load(query: Query) -> Optional[lavalink.Track]:
+            data = cached.get(os.path.abspath(query.track))
+            if data is not None:
+                if data.get("loadType") == "V2_COMPACT":
+                    data["loadType"] = "V2_COMPAT"
+                results = LoadResult(data)
+            else:
+                async with semaphore:
+                    try:
+                        (results, called_api) = await self.fetch_track(ctx, player, query)
+                    except TrackEnqueueError:
+                        return None
+            return results.tracks[0] if results.tracks else None
+
+        tracks = await asyncio.gather(*(_load(query) for query in queries))
+        return [track for track in tracks if track is not None]
+
+    def prepare_autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper) -> None:
+        """Pick the next autoplay track in the background while the last queued one plays."""
+        task = self._autoplay_lookahead.get(player.guild.id)
+        if task is not None and not (
+            task.done() and (task.cancelled() or task.exception() is not None)
+        ):
+            return
+        task = asyncio.create_task(self.pick_autoplay_track(player, playlist_api))
+        task.add_done_callback(self._autoplay_lookahead_done)
+        self._autoplay_lookahead[player.guild.id] = task
+
+    def discard_autoplay(self, guild_id: int) -> None:
+        """Forget the autoplay track picked ahead of time for a guild."""
+        task = self._autoplay_lookahead.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
+
+    @staticmethod
+    def _autoplay_lookahead_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            debug_exc_log(log, exc, "Failed to pick the next autoplay track ahead of time")
+
     async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
-        """Enqueue a random track."""
+        """Enqueue a random track, the one picked ahead of time when there is one."""
+        notify_channel_id = player.fetch("notify_channel")
+        track = None
+        task = self._autoplay_lookahead.pop(player.guild.id, None)
+        if task is not None and not task.cancelled():
+            try:
+                track = await task
+            except Exception as exc:
+                debug_exc_log(log, exc, "Autoplay lookahead failed, picking a track now")
+        if track is None:
+            track = await self.pick_autoplay_track(player, playlist_api)
+        if track is None:
+            return
+        track.extras.update(
+            {
+                "autoplay": True,
+                "enqueue_time": int(time.time()),
+                "vc": player.channel.id,
+                "requester": player.guild.me.id,
+            }
+        )
+        player.add(player.guild.me, track)
+        self.bot.dispatch(
+            "red_audio_track_auto_play",
+            player.guild,
+            track,
+            player.guild.me,
+            player,
+        )
+        if notify_channel_id:
+            await self.config_cache.autoplay.set_currently_in_guild(
+                player.guild, (notify_channel_id, player.channel.id)
+            )
+        else:
+            await self.config_cache.autoplay.set_currently_in_guild(player.guild)
+        if not player.current:
+            await player.play()
+
+    async def pick_autoplay_track(
+        self, player: lavalink.Player, playlist_api: PlaylistWrapper
+    ) -> Optional[lavalink.Track]:
+        """Pick a random allowed track from the autoplaylist, the local cache or the top 100.
+
+        Candidates are picked from in-memory pools of compact track references, which
+        are loaded on first use and refreshed in the background once they are older than
+        their TTL. Only the picked candidate is loaded into a full track.
+        Returns None when none of the sources has a candidate to offer.
+        """
         autoplaylist = await self.config.guild(player.guild).autoplaylist()
         current_cache_level = await self.config_cache.local_cache_level.get_global()
         cache_enabled = CacheLevel.set_lavalink().is_subset(current_cache_level)
         notify_channel_id = player.fetch("notify_channel")
-        playlist = None
-        tracks = None
+        pool = None
         if autoplaylist["enabled"]:
+            scope_id = (
+                None if autoplaylist["scope"] == PlaylistScope.GLOBAL.value else player.guild.id
+            )
             try:
-                playlist = await get_playlist(
-                    autoplaylist["id"],
-                    autoplaylist["scope"],
-                    self.bot,
-                    playlist_api,
-                    player.guild,
-                    player.guild.me,
+                pool = await self._autoplay_pool(
+                    ("playlist", autoplaylist["scope"], autoplaylist["id"], scope_id),
+                    functools.partial(
+                        self._load_autoplaylist_candidates, player, playlist_api, autoplaylist
+                    ),
+                    _AUTOPLAYLIST_POOL_TTL,
                 )
-                tracks = playlist.tracks_obj
             except Exception as exc:
                 debug_exc_log(log, exc, "Failed to fetch playlist for autoplay")
-
-        if (not tracks or not getattr(playlist, "tracks", None)) and cache_enabled:
-            track = await self.get_random_track_from_db()
-            tracks = [] if not track else [track]
-        if not tracks:
-            ctx = namedtuple("Context", "message guild cog")
-            (results, called_api) = await self.fetch_track(
-                cast(commands.Context, ctx(player.guild, player.guild, self.cog)),
-                player,
-                Query.process_input(_TOP_100_US, self.cog.local_folder_current_path),
-            )
-            tracks = list(results.tracks)
-        if tracks:
-            multiple = len(tracks) > 1
-            valid = not multiple
-            tries = len(tracks)
-            track = tracks[0]
-            while not valid and multiple:
-                tries -= 1
-                if tries <= 0:
-                    raise DatabaseError("No valid entry found")
-                track = random.choice(tracks)
-                query = Query.process_input(track, self.cog.local_folder_current_path)
-                await asyncio.sleep(0.001)
-                if (not query.valid) or (
-                    query.is_local
-                    and query.local_track_path is not None
-                    and not query.local_track_path.exists()
-                ):
-                    continue
-                notify_channel = self.bot.get_channel(notify_channel_id)
-                if not await self.cog.is_query_allowed(
-                    self.config_cache,
-                    notify_channel,
-                    f"{track.title} {track.author} {track.uri} {query}",
-                    query_obj=query,
-                ):
-                    if IS_DEBUG:
-                        log.debug(
-                            "Query is not allowed in %r (%d)", player.guild.name, player.guild.id
-                        )
-                    continue
-                valid = True
-            track.extras.update(
-                {
-                    "autoplay": True,
-                    "enqueue_time": int(time.time()),
-                    "vc": player.channel.id,
-                    "requester": player.guild.me.id,
-                }
+        if (pool is None or not pool.tracks) and cache_enabled:
+            try:
+                pool = await self._autoplay_pool(
+                    ("recent",), self._load_recent_candidates, _RECENT_POOL_TTL
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to fetch recent tracks for autoplay")
+        if pool is None or not pool.tracks:
+            pool = await self._autoplay_pool(
+                ("top100",),
+                functools.partial(self._load_top_100_candidates, player),
+                _TOP_100_POOL_TTL,
             )
-            player.add(player.guild.me, track)
-            self.bot.dispatch(
-                "red_audio_track_auto_play",
-                player.guild,
-                track,
-                player.guild.me,
-                player,
+        if not pool.tracks:
+            return None
+        notify_channel = self.bot.get_channel(notify_channel_id)
+        for _ in range(len(pool)):
+            candidate = pool.pick()
+            query = Query.process_input(candidate.uri, self.cog.local_folder_current_path)
+            await asyncio.sleep(0.001)
+            if (not query.valid) or (
+                query.is_local
+                and query.local_track_path is not None
+                and not query.local_track_path.exists()
+            ):
+                continue
+            if not await self.cog.is_query_allowed(
+                self.config_cache,
+                notify_channel,
+                f"{candidate.title} {candidate.author} {candidate.uri} {query}",
+                query_obj=query,
+            ):
+                if IS_DEBUG:
+                    log.debug(
+                        "Query is not allowed in %r (%d)", player.guild.name, player.guild.id
+                    )
+                continue
+            (results, called_api) = await self.fetch_track(
+                self._autoplay_context(player), player, query
             )
-            if notify_channel_id:
-                await self.config_cache.autoplay.set_currently_in_guild(
-                    player.guild, (notify_channel_id, player.channel.id)
-                )
-            else:
-                await self.config_cache.autoplay.set_currently_in_guild(player.guild)
-            if not player.current:
-                await player.play()
+            if results.tracks:
+                return results.tracks[0]
+        raise DatabaseError("No valid entry found")
+
+    def _autoplay_context(self, player: lavalink.Player) -> commands.Context:
+        ctx = namedtuple("Context", "message guild cog")
+        return cast(commands.Context, ctx(player.guild, player.guild, self.cog))
+
+    async def _autoplay_pool(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[List[MutableMapping]]],
+        ttl: float,
+    ) -> CandidatePool:
+        pool = self._autoplay_pools.get(key)
+        if pool is None:
+            pool = self._autoplay_pools[key] = CandidatePool(ttl)
+        if not pool.loaded or (pool.stale and not pool.tracks):
+            await pool.refresh(loader)
+        elif pool.stale:
+            pool.refresh(loader)
+        return pool
+
+    async def _load_autoplaylist_candidates(
+        self, player: lavalink.Player, playlist_api: PlaylistWrapper, autoplaylist: MutableMapping
+    ) -> List[MutableMapping]:
+        playlist = await get_playlist(
+            autoplaylist["id"],
+            autoplaylist["scope"],
+            self.bot,
+            playlist_api,
+            player.guild,
+            player.guild.me,
+        )
+        return list(playlist.tracks)
+
+    async def _load_recent_candidates(self) -> List[MutableMapping]:
+        date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=7)
+        maxage = await self.local_cache_api.lavalink.get_maxage()
+        return await self.local_cache_api.lavalink.fetch_recent_tracks(
+            {"day": int(date.timestamp()), "maxage": maxage}
+        )
+
+    async def _load_top_100_candidates(self, player: lavalink.Player) -> List[MutableMapping]:
+        (results, called_api) = await self.fetch_track(
+            self._autoplay_context(player),
+            player,
+            Query.process_input(_TOP_100_US, self.cog.local_folder_current_path),
+        )
+        return list(results._raw.get("tracks", []))
 
-    async def fetch_all_contribute(self) -> List[LavalinkCacheFetchForGlobalResult]:
-        return await self.local_cache_api.lavalink.fetch_all_for_global()
+    async def fetch_all_contribute(
+        self, chunk_size: int = 500
+    ) -> AsyncIterator[List[LavalinkCacheFetchForGlobalResult]]:
+        """Stream every cached Lavalink entry in chunks of `chunk_size`."""
+        async for chunk in self.local_cache_api.lavalink.iter_all_for_global(chunk_size):
+            yield chunk
@@ -3,10 +3,22 @@ from __future__ import annotations
 
 # Standard Library Imports
 from types import SimpleNamespace
-from typing import Callable, List, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
-import concurrent
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import contextlib
 import datetime
+import functools
 import logging
 import random
 import time
@@ -16,7 +28,6 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 # Music Imports
 from ..audio_logging import debug_exc_log
@@ -25,39 +36,63 @@ from ..sql_statements import (
     LAVALINK_CREATE_TABLE,
     LAVALINK_DELETE_OLD_ENTRIES,
     LAVALINK_FETCH_ALL_ENTRIES_GLOBAL,
+    LAVALINK_FETCH_ENTRIES_GLOBAL_CHUNK,
     LAVALINK_QUERY,
     LAVALINK_QUERY_ALL,
     LAVALINK_QUERY_LAST_FETCHED_RANDOM,
+    LAVALINK_QUERY_MANY,
+    LAVALINK_QUERY_MANY_TEMP,
     LAVALINK_UPDATE,
     LAVALINK_UPSERT,
+    LYRICS_CREATE_TABLE,
+    LYRICS_DELETE_OLD_ENTRIES,
+    LYRICS_QUERY,
+    LYRICS_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
     PRAGMA_SET_read_uncommitted,
     PRAGMA_SET_temp_store,
     PRAGMA_SET_user_version,
+    SPOTIFY_COLLECTION_CREATE_TABLE,
+    SPOTIFY_COLLECTION_DELETE_OLD_ENTRIES,
+    SPOTIFY_COLLECTION_QUERY,
+    SPOTIFY_COLLECTION_UPDATE,
+    SPOTIFY_COLLECTION_UPSERT,
     SPOTIFY_CREATE_INDEX,
     SPOTIFY_CREATE_TABLE,
     SPOTIFY_DELETE_OLD_ENTRIES,
     SPOTIFY_QUERY,
     SPOTIFY_QUERY_ALL,
     SPOTIFY_QUERY_LAST_FETCHED_RANDOM,
+    SPOTIFY_QUERY_MANY,
+    SPOTIFY_QUERY_MANY_TEMP,
     SPOTIFY_UPDATE,
     SPOTIFY_UPSERT,
+    TEMP_LOOKUP_CLEAR,
+    TEMP_LOOKUP_CREATE_TABLE,
+    TEMP_LOOKUP_INSERT,
     YOUTUBE_CREATE_INDEX,
     YOUTUBE_CREATE_TABLE,
     YOUTUBE_DELETE_OLD_ENTRIES,
     YOUTUBE_QUERY,
     YOUTUBE_QUERY_ALL,
     YOUTUBE_QUERY_LAST_FETCHED_RANDOM,
+    YOUTUBE_QUERY_MANY,
+    YOUTUBE_QUERY_MANY_TEMP,
     YOUTUBE_UPDATE,
     YOUTUBE_UPSERT,
 )
 from .api_utils import (
+    copy_lavalink_payload,
     LavalinkCacheFetchForGlobalResult,
     LavalinkCacheFetchResult,
+    LyricsCacheFetchResult,
+    MemoryCache,
     SpotifyCacheFetchResult,
+    SpotifyCollectionCacheFetchResult,
     YouTubeCacheFetchResult,
 )
+from .database_executor import DatabaseExecutor
 
 if TYPE_CHECKING:
 
@@ -68,6 +103,12 @@ if TYPE_CHECKING:
 log = logging.getLogger("red.cogs.Music.api.LocalDB")
 
 _SCHEMA_VERSION = 3
+_MEMORY_CACHE_SIZE = 10_000
+_LAVALINK_MEMORY_CACHE_SIZE = 1_000
+_BULK_CHUNK_SIZE = 500
+_BULK_TEMP_TABLE_THRESHOLD = 5_000
+_LYRICS_MEMORY_CACHE_SIZE = 256
+_LYRICS_NEGATIVE_TTL = 24 * 60 * 60
 
 
 class BaseWrapper:
@@ -75,7 +116,7 @@ class BaseWrapper:
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -91,77 +132,97 @@ class BaseWrapper:
         self.statement.get_user_version = PRAGMA_FETCH_user_version
         self.fetch_result: Optional[Callable] = None
         self.cog = cog
+        self.memory_cache = MemoryCache(maxsize=0)
+        self.cache_key: Optional[str] = None
+        self.cache_insert_key: Optional[str] = None
+
+    def _copy_cached(self, value: Any) -> Any:
+        """Return a copy of a memory cached value that is safe to hand out to callers"""
+        return value
 
     async def init(self) -> None:
         """Initialize the local cache"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.maybe_migrate)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_INDEX)
-            await self.clean_up_old_entries()
-
-    def close(self) -> None:
+        await self.database.execute(self.statement.pragma_temp_store)
+        await self.database.execute(self.statement.pragma_journal_mode)
+        await self.database.execute(self.statement.pragma_read_uncommitted)
+        await self.maybe_migrate()
+        await self.database.execute(LAVALINK_CREATE_TABLE)
+        await self.database.execute(LAVALINK_CREATE_INDEX)
+        await self.database.execute(YOUTUBE_CREATE_TABLE)
+        await self.database.execute(YOUTUBE_CREATE_INDEX)
+        await self.database.execute(SPOTIFY_CREATE_TABLE)
+        await self.database.execute(SPOTIFY_CREATE_INDEX)
+        await self.database.execute(SPOTIFY_COLLECTION_CREATE_TABLE)
+        await self.database.execute(LYRICS_CREATE_TABLE)
+        await self.clean_up_old_entries()
+
+    async def close(self) -> None:
         """Close the connection with the local cache"""
         with contextlib.suppress(Exception):
-            self.database.close()
+            await self.database.close()
 
-    async def clean_up_old_entries(self) -> None:
-        """Delete entries older than x in the local cache tables"""
+    async def get_maxage(self) -> int:
+        """Get the timestamp before which entries in the local cache are considered expired"""
         max_age = await self.config_cache.local_cache_age.get_global()
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
-        maxage_int = int(time.mktime(maxage.timetuple()))
-        values = {"maxage": maxage_int}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, YOUTUBE_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, SPOTIFY_DELETE_OLD_ENTRIES, values)
-
-    def maybe_migrate(self) -> None:
+        return int(time.mktime(maxage.timetuple()))
+
+    async def clean_up_old_entries(self) -> None:
+        """Delete entries older than x in the local cache tables"""
+        values = {"maxage": await self.get_maxage()}
+        await self.database.execute(LAVALINK_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(YOUTUBE_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(SPOTIFY_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(SPOTIFY_COLLECTION_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(LYRICS_DELETE_OLD_ENTRIES, values)
+
+    async def maybe_migrate(self) -> None:
         """Maybe migrate Database schema for the local cache"""
         current_version = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_user_version)]
-            ):
-                try:
-                    row_result = future.result()
-                    current_version = row_result.fetchone()
-                    break
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
-            if isinstance(current_version, tuple):
-                current_version = current_version[0]
-            if current_version == _SCHEMA_VERSION:
-                return
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.set_user_version,
-                {"version": _SCHEMA_VERSION},
+        try:
+            current_version = await self.database.write(
+                lambda conn: conn.cursor().execute(self.statement.get_user_version).fetchone()
             )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
+        if isinstance(current_version, tuple):
+            current_version = current_version[0]
+        if current_version == _SCHEMA_VERSION:
+            return
+        await self.database.execute(self.statement.set_user_version, {"version": _SCHEMA_VERSION})
 
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
+        if self.cache_insert_key is not None:
+            for value in values:
+                self.memory_cache.invalidate(value.get(self.cache_insert_key))
         try:
-            with self.database.transaction() as transaction:
-                transaction.executemany(self.statement.upsert, values)
+            await self.database.executemany(self.statement.upsert, values)
         except Exception as exc:
             debug_exc_log(log, exc, "Error during table insert")
 
     async def update(self, values: MutableMapping) -> None:
         """Update an entry of the local cache"""
 
+        if self.cache_key is not None:
+            # Only last_fetched changes, so the memory cached value is still valid.
+            self.memory_cache.touch(values.get(self.cache_key))
         try:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values["last_fetched"] = time_now
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                executor.submit(self.database.cursor().execute, self.statement.update, values)
+            await self.database.execute(self.statement.update, values)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Error during table update")
+
+    async def update_many(self, values: List[MutableMapping]) -> None:
+        """Update multiple entries of the local cache in a single transaction"""
+        time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        for value in values:
+            value.setdefault("last_fetched", time_now)
+            if self.cache_key is not None:
+                self.memory_cache.touch(value.get(self.cache_key))
+        try:
+            await self.database.executemany(self.statement.update, values)
         except Exception as exc:
             debug_exc_log(log, exc, "Error during table update")
 
@@ -171,25 +232,89 @@ class BaseWrapper:
         Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]
     ]:
         """Get an entry from the local cache"""
-        max_age = await self.config_cache.local_cache_age.get_global()
-        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
-        maxage_int = int(time.mktime(maxage.timetuple()))
+        maxage_int = await self.get_maxage()
         values.update({"maxage": maxage_int})
+        if self.fetch_result is None:
+            return None
+        key = values.get(self.cache_key) if self.cache_key is not None else None
+        if key is not None:
+            entry = self.memory_cache.get(key, maxage_int)
+            if entry is not None:
+                cached_value, last_updated = entry
+                return self.fetch_result(self._copy_cached(cached_value), last_updated)
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
-            ):
-                try:
-                    row_result = future.result()
-                    row = row_result.fetchone()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
+        try:
+            row = await self.database.fetchone(self.statement.get_one, values)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
         if not row:
             return None
+        result = self.fetch_result(*row)
+        if key is not None and result.query is not None:
+            self.memory_cache.set(key, result.query, result.last_updated)
+            result.query = self._copy_cached(result.query)
+        return result
+
+    async def _fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[
+        str, Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]
+    ]:
+        """Get multiple entries from the local cache in as few queries as possible"""
+        output = {}
         if self.fetch_result is None:
-            return None
-        return self.fetch_result(*row)
+            return output
+        maxage_int = await self.get_maxage()
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self.memory_cache.get(key, maxage_int)
+            if entry is not None:
+                cached_value, last_updated = entry
+                output[key] = self.fetch_result(self._copy_cached(cached_value), last_updated)
+            else:
+                missing.append(key)
+        if not missing:
+            return output
+        row_result = []
+        try:
+            row_result = await self.database.read(
+                functools.partial(self._fetch_many_rows, missing, maxage_int)
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed bulk fetch from database")
+        async for key, *row in AsyncIter(row_result):
+            if key in output:
+                continue
+            result = self.fetch_result(*row)
+            if result.query is not None:
+                self.memory_cache.set(key, result.query, result.last_updated)
+                result.query = self._copy_cached(result.query)
+            output[key] = result
+        return output
+
+    def _fetch_many_rows(self, keys: List[str], maxage: int, conn) -> List[tuple]:
+        """Run a bulk lookup on a database connection, called from the executor thread"""
+        cursor = conn.cursor()
+        if len(keys) > _BULK_TEMP_TABLE_THRESHOLD:
+            cursor.execute(TEMP_LOOKUP_CREATE_TABLE)
+            try:
+                with conn.transaction() as transaction:
+                    transaction.executemany(TEMP_LOOKUP_INSERT, ({"key": key} for key in keys))
+                return cursor.execute(self.statement.get_many_temp, {"maxage": maxage}).fetchall()
+            finally:
+                cursor.execute(TEMP_LOOKUP_CLEAR)
+        rows = []
+        for index in range(0, len(keys), _BULK_CHUNK_SIZE):
+            chunk = keys[index : index + _BULK_CHUNK_SIZE]
+            values: MutableMapping[str, Union[str, int]] = {
+                f"key{i}": key for i, key in enumerate(chunk)
+            }
+            values["maxage"] = maxage
+            statement = self.statement.get_many.format(
+                placeholders=", ".join(f":key{i}" for i in range(len(chunk)))
+            )
+            rows.extend(cursor.execute(statement, values).fetchall())
+        return rows
 
     async def _fetch_all(
         self, values: MutableMapping
@@ -199,14 +324,10 @@ class BaseWrapper:
         row_result = []
         if self.fetch_result is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all, values)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
         async for row in AsyncIter(row_result):
             output.append(self.fetch_result(*row))
         return output
@@ -218,20 +339,11 @@ class BaseWrapper:
     ]:
         """Get a random entry from the local cache"""
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                    rows = row_result.fetchall()
-                    row = random.choice(rows) if rows else None
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed random fetch from database")
+        try:
+            rows = await self.database.fetchall(self.statement.get_random, values)
+            row = random.choice(rows) if rows else None
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed random fetch from database")
         if not row:
             return None
         if self.fetch_result is None:
@@ -244,7 +356,7 @@ class YouTubeTableWrapper(BaseWrapper):
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -254,7 +366,12 @@ class YouTubeTableWrapper(BaseWrapper):
         self.statement.get_one = YOUTUBE_QUERY
         self.statement.get_all = YOUTUBE_QUERY_ALL
         self.statement.get_random = YOUTUBE_QUERY_LAST_FETCHED_RANDOM
+        self.statement.get_many = YOUTUBE_QUERY_MANY
+        self.statement.get_many_temp = YOUTUBE_QUERY_MANY_TEMP
         self.fetch_result = YouTubeCacheFetchResult
+        self.memory_cache = MemoryCache(maxsize=_MEMORY_CACHE_SIZE)
+        self.cache_key = "track"
+        self.cache_insert_key = "track_info"
 
     async def fetch_one(
         self, values: MutableMapping
@@ -265,6 +382,17 @@ class YouTubeTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[str, Optional[datetime.datetime]]]:
+        """Get all entries matching the given keys from the Youtube table"""
+        result = await self._fetch_many(keys)
+        return {
+            key: (entry.query, entry.updated_on)
+            for key, entry in result.items()
+            if isinstance(entry.query, str)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[YouTubeCacheFetchResult]:
         """Get all entries from the Youtube table"""
         result = await self._fetch_all(values)
@@ -285,7 +413,7 @@ class SpotifyTableWrapper(BaseWrapper):
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -295,7 +423,12 @@ class SpotifyTableWrapper(BaseWrapper):
         self.statement.get_one = SPOTIFY_QUERY
         self.statement.get_all = SPOTIFY_QUERY_ALL
         self.statement.get_random = SPOTIFY_QUERY_LAST_FETCHED_RANDOM
+        self.statement.get_many = SPOTIFY_QUERY_MANY
+        self.statement.get_many_temp = SPOTIFY_QUERY_MANY_TEMP
         self.fetch_result = SpotifyCacheFetchResult
+        self.memory_cache = MemoryCache(maxsize=_MEMORY_CACHE_SIZE)
+        self.cache_key = "uri"
+        self.cache_insert_key = "uri"
 
     async def fetch_one(
         self, values: MutableMapping
@@ -306,6 +439,17 @@ class SpotifyTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[str, Optional[datetime.datetime]]]:
+        """Get all entries matching the given keys from the Spotify table"""
+        result = await self._fetch_many(keys)
+        return {
+            key: (entry.query, entry.updated_on)
+            for key, entry in result.items()
+            if isinstance(entry.query, str)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[SpotifyCacheFetchResult]:
         """Get all entries from the Spotify table"""
         result = await self._fetch_all(values)
@@ -321,12 +465,89 @@ class SpotifyTableWrapper(BaseWrapper):
         return result.query
 
 
+class SpotifyCollectionTableWrapper(BaseWrapper):
+    """Resolved tracks of Spotify playlists and albums, keyed by their URI and snapshot"""
+
+    def __init__(
+        self,
+        bot: Red,
+        config: Config,
+        conn: DatabaseExecutor,
+        cog: Union[Music, Cog],
+        cache: SettingCacheManager,
+    ):
+        super().__init__(bot, config, conn, cog, cache)
+        self.statement.upsert = SPOTIFY_COLLECTION_UPSERT
+        self.statement.update = SPOTIFY_COLLECTION_UPDATE
+        self.statement.get_one = SPOTIFY_COLLECTION_QUERY
+        self.fetch_result = SpotifyCollectionCacheFetchResult
+        self.cache_key = "uri"
+        self.cache_insert_key = "uri"
+
+    async def fetch_one(
+        self, values: MutableMapping
+    ) -> Tuple[Optional[List[MutableMapping]], Optional[datetime.datetime]]:
+        """Get the tracks of a playlist or album at the given snapshot"""
+        result = await self._fetch_one(values)
+        if not result or not isinstance(result.query, list):
+            return None, None
+        return result.query, result.updated_on
+
+
+class LyricsTableWrapper(BaseWrapper):
+    """Scraped lyrics keyed by the normalised song title, ``None`` when none were found"""
+
+    def __init__(
+        self,
+        bot: Red,
+        config: Config,
+        conn: DatabaseExecutor,
+        cog: Union[Music, Cog],
+        cache: SettingCacheManager,
+    ):
+        super().__init__(bot, config, conn, cog, cache)
+        self.statement.upsert = LYRICS_UPSERT
+        self.statement.get_one = LYRICS_QUERY
+        self.fetch_result = LyricsCacheFetchResult
+        self.memory_cache = MemoryCache(maxsize=_LYRICS_MEMORY_CACHE_SIZE)
+        self.cache_key = "key"
+        self.cache_insert_key = "key"
+
+    async def fetch_one(self, values: MutableMapping) -> Optional[LyricsCacheFetchResult]:
+        """Get the cached lyrics of a song, not found results expire after a day"""
+        maxage = await self.get_maxage()
+        negative_maxage = int(time.time()) - _LYRICS_NEGATIVE_TTL
+        key = values["key"]
+        entry = self.memory_cache.get(key, maxage)
+        if entry is not None:
+            (data, last_updated) = entry
+            if data is not None or last_updated > negative_maxage:
+                return self.fetch_result(data, last_updated)
+        row = None
+        try:
+            row = await self.database.fetchone(
+                self.statement.get_one,
+                {"key": key, "maxage": maxage, "negative_maxage": negative_maxage},
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
+        if not row:
+            return None
+        result = self.fetch_result(*row)
+        self.memory_cache.set(key, result.query, result.last_updated)
+        return result
+
+    def remember(self, key: str, data: Optional[List[str]], last_updated: int) -> None:
+        """Keep freshly scraped lyrics in memory until the write queue stores them"""
+        self.memory_cache.set(key, data, last_updated)
+
+
 class LavalinkTableWrapper(BaseWrapper):
     def __init__(
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -336,9 +557,19 @@ class LavalinkTableWrapper(BaseWrapper):
         self.statement.get_one = LAVALINK_QUERY
         self.statement.get_all = LAVALINK_QUERY_ALL
         self.statement.get_random = LAVALINK_QUERY_LAST_FETCHED_RANDOM
+        self.statement.get_many = LAVALINK_QUERY_MANY
+        self.statement.get_many_temp = LAVALINK_QUERY_MANY_TEMP
         self.statement.get_all_global = LAVALINK_FETCH_ALL_ENTRIES_GLOBAL
+        self.statement.get_all_global_chunk = LAVALINK_FETCH_ENTRIES_GLOBAL_CHUNK
         self.fetch_result = LavalinkCacheFetchResult
         self.fetch_for_global: Optional[Callable] = LavalinkCacheFetchForGlobalResult
+        self.memory_cache = MemoryCache(maxsize=_LAVALINK_MEMORY_CACHE_SIZE)
+        self.cache_key = "query"
+        self.cache_insert_key = "query"
+
+    def _copy_cached(self, value: MutableMapping) -> MutableMapping:
+        """Copy the parsed payload so callers can't mutate the memory cached tracks"""
+        return copy_lavalink_payload(value)
 
     async def fetch_one(
         self, values: MutableMapping
@@ -349,6 +580,17 @@ class LavalinkTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[MutableMapping, Optional[datetime.datetime]]]:
+        """Get all entries matching the given keys from the Lavalink table"""
+        result = await self._fetch_many(keys)
+        return {
+            key: (entry.query, entry.updated_on)
+            for key, entry in result.items()
+            if isinstance(entry.query, dict)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[LavalinkCacheFetchResult]:
         """Get all entries from the Lavalink table"""
         result = await self._fetch_all(values)
@@ -363,23 +605,42 @@ class LavalinkTableWrapper(BaseWrapper):
             return None
         return result.query
 
-    async def fetch_all_for_global(self) -> List[LavalinkCacheFetchForGlobalResult]:
-        """Get all entries from the Lavalink table"""
-        output: List[LavalinkCacheFetchForGlobalResult] = []
-        row_result = []
-        if self.fetch_for_global is None:
-            return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
+    async def fetch_recent_tracks(self, values: MutableMapping) -> List[MutableMapping]:
+        """Get the tracks of the entries recently fetched from the Lavalink table"""
+        tracks: List[MutableMapping] = []
+        try:
+            row_result = await self.database.fetchall(self.statement.get_random, values)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
+            return tracks
         async for row in AsyncIter(row_result):
-            output.append(self.fetch_for_global(*row))
-        return output
+            result = self.fetch_result(*row)
+            if isinstance(result.query, dict):
+                tracks.extend(result.query.get("tracks", []))
+        return tracks
+
+    async def iter_all_for_global(
+        self, chunk_size: int = 500
+    ) -> AsyncIterator[List[LavalinkCacheFetchForGlobalResult]]:
+        """Get all entries from the Lavalink table, `chunk_size` rows at a time"""
+        if self.fetch_for_global is None:
+            return
+        last_query = ""
+        while True:
+            try:
+                row_result = await self.database.fetchall(
+                    self.statement.get_all_global_chunk,
+                    {"last_query": last_query, "limit": chunk_size},
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to completed fetch from database")
+                return
+            if not row_result:
+                return
+            last_query = row_result[-1][0]
+            yield [self.fetch_for_global(*row) for row in row_result]
+            if len(row_result) < chunk_size:
+                return
 
 
 class LocalCacheWrapper:
@@ -389,7 +650,7 @@ class LocalCacheWrapper:
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -407,3 +668,17 @@ class LocalCacheWrapper:
         self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(
             bot, config, conn, self.cog, self.config_cache
         )
+        self.spotify_collection: SpotifyCollectionTableWrapper = SpotifyCollectionTableWrapper(
+            bot, config, conn, self.cog, self.config_cache
+        )
+        self.lyrics: LyricsTableWrapper = LyricsTableWrapper(
+            bot, config, conn, self.cog, self.config_cache
+        )
+
+    def memory_cache_stats(self) -> MutableMapping[str, MutableMapping[str, int]]:
+        """Get the hit and miss counters of the in-memory cache in front of each table"""
+        return {
+            "lavalink": self.lavalink.memory_cache.stats(),
+            "youtube": self.youtube.memory_cache.stats(),
+            "spotify": self.spotify.memory_cache.stats(),
+        }
@@ -0,0 +1,413 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    import json
+
+try:
+    # Dependency Imports
+    from inotify_simple import flags as inotify_flags, INotify
+except ImportError:
+    INotify = None
+
+# Music Imports
+from ..audio_dataclasses import _FULLY_SUPPORTED_MUSIC_EXT, _PARTIALLY_SUPPORTED_MUSIC_EXT
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from ..sql_statements import (
+    LOCALTRACKS_CREATE_INDEX,
+    LOCALTRACKS_CREATE_TABLE,
+    LOCALTRACKS_DELETE_FOLDER,
+    LOCALTRACKS_FOLDERS_CREATE_TABLE,
+    LOCALTRACKS_FOLDERS_DELETE,
+    LOCALTRACKS_FOLDERS_QUERY_ALL,
+    LOCALTRACKS_FOLDERS_QUERY_CHILDREN,
+    LOCALTRACKS_FOLDERS_QUERY_TREE,
+    LOCALTRACKS_FOLDERS_UPSERT,
+    LOCALTRACKS_INSERT,
+    LOCALTRACKS_LOADS_CREATE_INDEX,
+    LOCALTRACKS_LOADS_CREATE_TABLE,
+    LOCALTRACKS_LOADS_DELETE_FOLDER,
+    LOCALTRACKS_LOADS_DELETE_MISSING,
+    LOCALTRACKS_LOADS_QUERY_MANY,
+    LOCALTRACKS_LOADS_QUERY_TREE,
+    LOCALTRACKS_LOADS_UPSERT,
+    LOCALTRACKS_QUERY_FOLDER,
+    LOCALTRACKS_QUERY_TREE,
+)
+from ..utils import task_callback
+from .database_executor import DatabaseExecutor
+
+log = logging.getLogger("red.cogs.Music.api.LocalTracksIndex")
+
+_MUSIC_EXTENSIONS: Final[frozenset] = frozenset(
+    _FULLY_SUPPORTED_MUSIC_EXT + _PARTIALLY_SUPPORTED_MUSIC_EXT
+)
+_LOADS_BY_PATH_LIMIT: Final[int] = 2_000
+_LOADS_CHUNK_SIZE: Final[int] = 500
+
+
+@dataclass
+class _ScanResult:
+    folders: List[MutableMapping] = field(default_factory=list)
+    tracks: Dict[str, List[MutableMapping]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    seen: Set[str] = field(default_factory=set)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.folders or self.removed)
+
+
+def _scan_tree(root: str, known: Dict[str, Tuple[float, List[str]]]) -> _ScanResult:
+    """Walk `root` and list the folders whose mtime changed since the last scan.
+
+    Adding, removing or renaming an entry updates the mtime of its folder, so the
+    subfolders of an unchanged folder are taken from the index instead of listing it.
+    This runs in an executor.
+    """
+    result = _ScanResult()
+    visited: Set[Tuple[int, int]] = set()
+    stack: List[Tuple[str, Optional[str]]] = [(root, None)]
+    while stack:
+        (folder, parent) = stack.pop()
+        try:
+            stat = os.stat(folder)
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in visited:
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+        result.seen.add(folder)
+        previous = known.get(folder)
+        if previous is not None and previous[0] == stat.st_mtime:
+            stack.extend((child, folder) for child in previous[1])
+            continue
+        subfolders = []
+        tracks = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    with contextlib.suppress(OSError):
+                        if entry.is_dir():
+                            subfolders.append(entry.path)
+                            continue
+                        extension = os.path.splitext(entry.name)[1]
+                        if extension in _MUSIC_EXTENSIONS and entry.is_file():
+                            entry_stat = entry.stat()
+                            tracks.append(
+                                {
+                                    "path": entry.path,
+                                    "folder": folder,
+                                    "size": entry_stat.st_size,
+                                    "mtime": entry_stat.st_mtime,
+                                    "extension": extension,
+                                }
+                            )
+        except OSError as exc:
+            debug_exc_log(log, exc, "Failed to list %s", folder)
+            continue
+        result.folders.append({"path": folder, "parent": parent, "mtime": stat.st_mtime})
+        result.tracks[folder] = tracks
+        stack.extend((child, folder) for child in subfolders)
+    result.removed = [folder for folder in known if folder not in result.seen]
+    return result
+
+
+def _apply_scan(conn, result: _ScanResult) -> None:
+    with conn.transaction() as cursor:
+        for folder in result.removed:
+            cursor.execute(LOCALTRACKS_DELETE_FOLDER, {"folder": folder})
+            cursor.execute(LOCALTRACKS_FOLDERS_DELETE, {"path": folder})
+            cursor.execute(LOCALTRACKS_LOADS_DELETE_FOLDER, {"folder": folder})
+        for (folder, tracks) in result.tracks.items():
+            cursor.execute(LOCALTRACKS_DELETE_FOLDER, {"folder": folder})
+            cursor.executemany(LOCALTRACKS_INSERT, tracks)
+            cursor.execute(LOCALTRACKS_LOADS_DELETE_MISSING, {"folder": folder})
+        cursor.executemany(LOCALTRACKS_FOLDERS_UPSERT, result.folders)
+
+
+def _stat_files(paths: Iterable[str]) -> Dict[str, Tuple[int, float]]:
+    stats = {}
+    for path in paths:
+        with contextlib.suppress(OSError):
+            stat = os.stat(path)
+            stats[path] = (stat.st_size, stat.st_mtime)
+    return stats
+
+
+def _tree_values(folder: str) -> MutableMapping[str, str]:
+    return {"folder": folder, "lower": folder + os.sep, "upper": folder + chr(ord(os.sep) + 1)}
+
+
+class LocalTracksIndex:
+    """SQLite index of every music file under the localtracks folder.
+
+    A background task rescans the folder every ``interval`` seconds, only listing the
+    folders whose mtime changed, so localtracks commands can query the ``localtracks``
+    table instead of walking the tree. On Linux with ``inotify_simple`` installed,
+    changes to the tree trigger a rescan right away. Commands go through :meth:`ready`,
+    which rescans first when the last scan is older than ``freshness`` seconds, so
+    newly copied files show up without waiting for the background pass.
+    The Lavalink load result of each file is cached too, keyed by its size and mtime.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseExecutor,
+        interval: float = 300.0,
+        debounce: float = 2.0,
+        freshness: float = 5.0,
+    ):
+        self.database = database
+        self.interval = interval
+        self.debounce = debounce
+        self.freshness = freshness
+        self.root: Optional[str] = None
+        self._scanned_root: Optional[str] = None
+        self._scanned_at = 0.0
+        self._scan_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._inotify = None
+        self._watches: Dict[str, int] = {}
+
+    async def init(self) -> None:
+        """Create the index tables."""
+        await self.database.execute(LOCALTRACKS_CREATE_TABLE)
+        await self.database.execute(LOCALTRACKS_CREATE_INDEX)
+        await self.database.execute(LOCALTRACKS_FOLDERS_CREATE_TABLE)
+        await self.database.execute(LOCALTRACKS_LOADS_CREATE_TABLE)
+        await self.database.execute(LOCALTRACKS_LOADS_CREATE_INDEX)
+
+    def start(self, root: Union[Path, str]) -> None:
+        """Index `root` and keep the index up to date in the background."""
+        root = os.path.abspath(root)
+        if root != self.root:
+            self.root = root
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(task_callback)
+            self._start_watcher()
+
+    async def ready(self, root: Union[Path, str]) -> None:
+        """Make sure the index of `root` is at most ``freshness`` seconds old."""
+        self.start(root)
+        await self.scan(max_age=self.freshness)
+
+    async def scan(self, max_age: Optional[float] = None) -> None:
+        """Bring the index up to date with the localtracks folder.
+
+        Parameters
+        ----------
+        max_age: Optional[float]
+            Skip the scan if the current root was scanned less than this many seconds ago.
+        """
+        async with self._scan_lock:
+            root = self.root
+            if root is None:
+                return
+            if (
+                max_age is not None
+                and self._scanned_root == root
+                and time.monotonic() - self._scanned_at < max_age
+            ):
+                return
+            rows = await self.database.fetchall(LOCALTRACKS_FOLDERS_QUERY_ALL)
+            known: Dict[str, Tuple[float, List[str]]] = {}
+            for (path, parent, mtime) in rows:
+                known[path] = (mtime, known.get(path, (None, []))[1])
+                if parent is not None:
+                    known.setdefault(parent, (None, []))[1].append(path)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, _scan_tree, root, known)
+            if result.changed:
+                await self.database.write(functools.partial(_apply_scan, result=result))
+                if IS_DEBUG:
+                    log.debug(
+                        "Indexed %d changed and %d removed folders under %s",
+                        len(result.folders),
+                        len(result.removed),
+                        root,
+                    )
+            self._update_watches(result.seen)
+            self._scanned_root = root
+            self._scanned_at = time.monotonic()
+
+    async def tracks(self, folder: Union[Path, str], recursive: bool = False) -> List[str]:
+        """The paths of the tracks inside `folder`, including subfolders if `recursive`."""
+        folder = os.path.abspath(folder)
+        if recursive:
+            rows = await self.database.fetchall(LOCALTRACKS_QUERY_TREE, _tree_values(folder))
+        else:
+            rows = await self.database.fetchall(LOCALTRACKS_QUERY_FOLDER, {"folder": folder})
+        return [row[0] for row in rows]
+
+    async def folders(self, folder: Union[Path, str], recursive: bool = False) -> List[str]:
+        """The paths of the subfolders of `folder`, including nested ones if `recursive`."""
+        folder = os.path.abspath(folder)
+        if recursive:
+            values = _tree_values(folder)
+            del values["folder"]
+            rows = await self.database.fetchall(LOCALTRACKS_FOLDERS_QUERY_TREE, values)
+        else:
+            rows = await self.database.fetchall(
+                LOCALTRACKS_FOLDERS_QUERY_CHILDREN, {"folder": folder}
+            )
+        return [row[0] for row in rows]
+
+    async def file_stats(self, paths: Iterable[str]) -> Dict[str, Tuple[int, float]]:
+        """The size and mtime of every file in `paths` that still exists."""
+        return await asyncio.get_running_loop().run_in_executor(None, _stat_files, list(paths))
+
+    async def fetch_loads(
+        self, stats: Mapping[str, Tuple[int, float]]
+    ) -> Dict[str, MutableMapping]:
+        """The cached Lavalink load results of the files in `stats` that did not change.
+
+        Parameters
+        ----------
+        stats: Mapping[str, Tuple[int, float]]
+            The size and mtime of each file, as returned by :meth:`file_stats`.
+        """
+        if not stats:
+            return {}
+        if len(stats) > _LOADS_BY_PATH_LIMIT:
+            # A folder enqueue, one range scan is cheaper than this many lookups.
+            folder = os.path.commonpath([os.path.dirname(path) for path in stats])
+            rows = await self.database.fetchall(LOCALTRACKS_LOADS_QUERY_TREE, _tree_values(folder))
+        else:
+            paths = list(stats)
+            rows = []
+            for index in range(0, len(paths), _LOADS_CHUNK_SIZE):
+                chunk = paths[index : index + _LOADS_CHUNK_SIZE]
+                statement = LOCALTRACKS_LOADS_QUERY_MANY.format(
+                    placeholders=", ".join(f":path{i}" for i in range(len(chunk)))
+                )
+                rows.extend(
+                    await self.database.fetchall(
+                        statement, {f"path{i}": path for (i, path) in enumerate(chunk)}
+                    )
+                )
+        loads = {}
+        for (path, size, mtime, data) in rows:
+            if stats.get(path) == (size, mtime):
+                with contextlib.suppress(ValueError, TypeError):
+                    loads[path] = json.loads(data)
+        return loads
+
+    async def store_load(self, path: str, stat: Tuple[int, float], data: str) -> None:
+        """Cache the Lavalink load result of `path` for as long as its size and mtime match."""
+        (size, mtime) = stat
+        await self.database.execute(
+            LOCALTRACKS_LOADS_UPSERT,
+            {
+                "path": path,
+                "folder": os.path.dirname(path),
+                "size": size,
+                "mtime": mtime,
+                "data": data,
+            },
+        )
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await self.scan()
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to scan the localtracks folder")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            if self._wakeup.is_set():
+                # Let a burst of changes settle before rescanning.
+                await asyncio.sleep(self.debounce)
+            self._wakeup.clear()
+
+    def _start_watcher(self) -> None:
+        if INotify is None or not sys.platform.startswith("linux") or self._inotify is not None:
+            return
+        try:
+            self._inotify = INotify()
+        except OSError as exc:
+            debug_exc_log(log, exc, "Failed to start watching the localtracks folder")
+            return
+        thread = threading.Thread(
+            target=self._watch,
+            args=(self._inotify, asyncio.get_running_loop()),
+            name="localtracks-watcher",
+            daemon=True,
+        )
+        thread.start()
+
+    def _watch(self, inotify, loop: asyncio.AbstractEventLoop) -> None:
+        with contextlib.suppress(OSError, ValueError):
+            while not self._closing:
+                if inotify.read(timeout=1000):
+                    loop.call_soon_threadsafe(self._wakeup.set)
+        inotify.close()
+
+    def _update_watches(self, folders: Set[str]) -> None:
+        if self._inotify is None:
+            return
+        for folder in [folder for folder in self._watches if folder not in folders]:
+            with contextlib.suppress(OSError):
+                self._inotify.rm_watch(self._watches[folder])
+            del self._watches[folder]
+        mask = (
+            inotify_flags.CREATE
+            | inotify_flags.DELETE
+            | inotify_flags.MOVED_FROM
+            | inotify_flags.MOVED_TO
+            | inotify_flags.ONLYDIR
+        )
+        for folder in folders:
+            if folder in self._watches:
+                continue
+            try:
+                self._watches[folder] = self._inotify.add_watch(folder, mask)
+            except OSError as exc:
+                # Most likely the inotify watch limit, the periodic scan still runs.
+                debug_exc_log(log, exc, "Failed to watch %s", folder)
+                break
+
+    async def close(self) -> None:
+        """Stop the background scanner, the index is kept for the next load."""
+        self._closing = True
+        self._inotify = None
+        self._watches.clear()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
@@ -4,7 +4,6 @@ from __future__ import annotations
 # Standard Library Imports
 from types import SimpleNamespace
 from typing import List, TYPE_CHECKING, Union
-import concurrent
 import logging
 import time
 
@@ -22,7 +21,6 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 # Music Imports
 from ..audio_logging import debug_exc_log
@@ -42,6 +40,7 @@ from ..sql_statements import (
     PRAGMA_SET_user_version,
 )
 from .api_utils import QueueFetchResult
+from .database_executor import DatabaseExecutor
 
 log = logging.getLogger("red.cogs.Music.api.PersistQueueWrapper")
 
@@ -58,7 +57,7 @@ class QueueInterface:
         self,
         bot: Red,
         config: Config,
-        conn: APSWConnectionWrapper,
+        conn: DatabaseExecutor,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -86,52 +85,36 @@ class QueueInterface:
 
     async def init(self) -> None:
         """Initialize the PersistQueue table"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        await self.database.execute(self.statement.pragma_temp_store)
+        await self.database.execute(self.statement.pragma_journal_mode)
+        await self.database.execute(self.statement.pragma_read_uncommitted)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
 
     async def fetch_all(self) -> List[QueueFetchResult]:
         """Fetch all playlists"""
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all,
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to complete playlist fetch from database")
-                    return []
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to complete playlist fetch from database")
+            return []
 
         async for index, row in AsyncIter(row_result).enumerate(start=1):
             output.append(QueueFetchResult(*row))
         return output
 
     async def played(self, guild_id: int, track_id: str) -> None:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_PLAYED,
-                {"guild_id": guild_id, "track_id": track_id},
-            )
+        await self.database.execute(
+            PERSIST_QUEUE_PLAYED,
+            {"guild_id": guild_id, "track_id": track_id},
+        )
 
     async def delete_scheduled(self):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PERSIST_QUEUE_DELETE_SCHEDULED)
+        await self.database.execute(PERSIST_QUEUE_DELETE_SCHEDULED)
 
     async def drop(self, guild_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute, PERSIST_QUEUE_BULK_PLAYED, ({"guild_id": guild_id})
-            )
+        await self.database.execute(PERSIST_QUEUE_BULK_PLAYED, ({"guild_id": guild_id}))
 
     async def enqueued(self, guild_id: int, room_id: int, track: lavalink.Track):
         enqueue_time = track.extras.get("enqueue_time", 0)
@@ -139,16 +122,14 @@ class QueueInterface:
             track.extras["enqueue_time"] = int(time.time())
         track_identifier = track.track_identifier
         track = self.cog.track_to_json(track)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_UPSERT,
-                {
-                    "guild_id": int(guild_id),
-                    "room_id": int(room_id),
-                    "played": False,
-                    "time": enqueue_time,
-                    "track": json.dumps(track),
-                    "track_id": track_identifier,
-                },
-            )
+        await self.database.execute(
+            PERSIST_QUEUE_UPSERT,
+            {
+                "guild_id": int(guild_id),
+                "room_id": int(room_id),
+                "played": False,
+                "time": enqueue_time,
+                "track": json.dumps(track),
+                "track_id": track_identifier,
+            },
+        )
@@ -2,10 +2,25 @@
 from __future__ import annotations
 
 # Standard Library Imports
-from typing import List, Mapping, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
+from typing import (
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Pattern,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+import asyncio
 import base64
 import contextlib
+import itertools
 import logging
+import re
 import time
 
 # Dependency Imports
@@ -25,6 +40,8 @@ from redbot.core.utils import AsyncIter
 
 # Music Imports
 from ..errors import SpotifyFetchError
+from ..utils import task_callback
+from .api_utils import MemoryCache
 
 if TYPE_CHECKING:
 
@@ -41,6 +58,12 @@ TOKEN_ENDPOINT = "https://accounts.spotify.com/api/token"
 ALBUMS_ENDPOINT = "https://api.spotify.com/v1/albums"
 TRACKS_ENDPOINT = "https://api.spotify.com/v1/tracks"
 PLAYLISTS_ENDPOINT = "https://api.spotify.com/v1/playlists"
+RATE_LIMIT_RETRIES = 5
+MAX_CONCURRENT_REQUESTS = 10
+TRACK_BATCH_SIZE = 50
+TRACK_BATCH_WINDOW = 0.05
+TRACK_CACHE_TTL = 300
+_RE_TRACK_ID: Final[Pattern] = re.compile(r"^[0-9A-Za-z]{22}$")
 
 
 class SpotifyWrapper:
@@ -62,6 +85,19 @@ class SpotifyWrapper:
         self.client_id: Optional[str] = None
         self.client_secret: Optional[str] = None
         self._token: Mapping[str, str] = {}
+        self._rate_limited_until: float = 0.0
+        self._token_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.token_refreshes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._pending_tracks: Dict[str, asyncio.Future] = {}
+        self._requested_tracks: Dict[str, asyncio.Future] = {}
+        self._track_batch_task: Optional[asyncio.Task] = None
+        self._track_cache = MemoryCache(maxsize=1000)
         self.cog = cog
 
     @staticmethod
@@ -76,6 +112,18 @@ class SpotifyWrapper:
             query = f"{PLAYLISTS_ENDPOINT}/{key}/tracks"
         return query, params
 
+    async def get_snapshot_id(self, query_type: str, key: str) -> Optional[str]:
+        """Get an identifier for the current version of a playlist or album."""
+        if query_type == "album":
+            # Albums don't change once released.
+            return "album"
+        if query_type != "playlist":
+            return None
+        result = await self.make_get_call(
+            f"{PLAYLISTS_ENDPOINT}/{key}", params={"fields": "snapshot_id"}
+        )
+        return result.get("snapshot_id")
+
     async def get_spotify_track_info(
         self, track_data: MutableMapping, ctx: Context
     ) -> Tuple[str, ...]:
@@ -110,20 +158,71 @@ class SpotifyWrapper:
         auth_header = base64.b64encode(f"{client_id}:{client_secret}".encode("ascii"))
         return {"Authorization": f"Basic {auth_header.decode('ascii')}"}
 
+    async def wait_for_rate_limit(self) -> None:
+        """Sleep until the last ``Retry-After`` given by Spotify has passed."""
+        delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _set_rate_limit(self, retry_after: Optional[str]) -> float:
+        try:
+            delay = max(float(retry_after), 1.0)
+        except (TypeError, ValueError):
+            delay = 1.0
+        self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+        return delay
+
+    def stats(self) -> MutableMapping[str, Union[int, float]]:
+        """Request counters and latency of the calls made to the Spotify API."""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "token_refreshes": self.token_refreshes,
+            "average_latency": self.total_latency / self.requests if self.requests else 0.0,
+            "max_latency": self.max_latency,
+            "rate_limited_for": max(self._rate_limited_until - time.monotonic(), 0.0),
+        }
+
     async def get(
         self, url: str, headers: MutableMapping = None, params: MutableMapping = None
     ) -> MutableMapping[str, str]:
-        """Make a GET request to the spotify API."""
+        """Make a GET request to the spotify API.
+
+        At most ``MAX_CONCURRENT_REQUESTS`` requests are in flight at once. When Spotify
+        answers with a 429 every request made through this wrapper waits for the
+        ``Retry-After`` period before the call is retried.
+        """
         if params is None:
             params = {}
-        async with self.session.request("GET", url, params=params, headers=headers) as r:
-            data = await r.json(loads=json.loads)
-            if r.status != 200:
-                log.debug("Issue making GET request to %r: [%d] %r", url, r.status, data)
-            return data
+        attempt = 0
+        while True:
+            await self.wait_for_rate_limit()
+            async with self._request_semaphore:
+                # Another request may have been throttled while this one was queued.
+                await self.wait_for_rate_limit()
+                start = time.monotonic()
+                async with self.session.request("GET", url, params=params, headers=headers) as r:
+                    latency = time.monotonic() - start
+                    self.requests += 1
+                    self.total_latency += latency
+                    self.max_latency = max(self.max_latency, latency)
+                    if r.status == 429:
+                        self.throttled += 1
+                        delay = self._set_rate_limit(r.headers.get("Retry-After"))
+                        if attempt < RATE_LIMIT_RETRIES:
+                            attempt += 1
+                            log.debug("Rate limited by Spotify on %r, retrying in %ss", url, delay)
+                            continue
+                    data = await r.json(loads=json.loads)
+                    if r.status != 200:
+                        self.errors += 1
+                        log.debug("Issue making GET request to %r: [%d] %r", url, r.status, data)
+                    return data
 
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
+        self.spotify_token = None
 
     async def get_token(self) -> None:
         """Get the stored spotify tokens."""
@@ -149,19 +248,27 @@ class SpotifyWrapper:
         return r
 
     async def get_access_token(self) -> Optional[str]:
-        """Get the access_token."""
+        """Get the access_token.
+
+        The token is refreshed once it is within a minute of expiring, concurrent callers
+        wait for that single refresh instead of each requesting a new token.
+        """
         if self.spotify_token and not await self.is_access_token_valid(self.spotify_token):
             return self.spotify_token["access_token"]
-        token = await self.request_access_token()
-        if token is None:
-            log.debug("Requested a token from Spotify, did not end up getting one.")
-        try:
-            token["expires_at"] = int(time.time()) + int(token["expires_in"])
-        except KeyError:
-            return None
-        self.spotify_token = token
-        log.debug("Created a new access token for Spotify: %s", token)
-        return self.spotify_token["access_token"]
+        async with self._token_lock:
+            if self.spotify_token and not await self.is_access_token_valid(self.spotify_token):
+                return self.spotify_token["access_token"]
+            token = await self.request_access_token()
+            if token is None:
+                log.debug("Requested a token from Spotify, did not end up getting one.")
+            try:
+                token["expires_at"] = int(time.time()) + int(token["expires_in"])
+            except KeyError:
+                return None
+            self.token_refreshes += 1
+            self.spotify_token = token
+            log.debug("Created a new access token for Spotify: %s", token)
+            return self.spotify_token["access_token"]
 
     async def post(
         self, url: str, payload: MutableMapping, headers: MutableMapping = None
@@ -178,6 +285,94 @@ class SpotifyWrapper:
         token = await self.get_access_token()
         return await self.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
 
+    async def get_track(self, track_id: str) -> MutableMapping:
+        """Get a single track.
+
+        Tracks requested within a short window of each other are fetched together
+        through the ``tracks?ids=`` endpoint, up to ``TRACK_BATCH_SIZE`` per call.
+        """
+        cached = self._track_cache.get(track_id, int(time.time()) - TRACK_CACHE_TTL)
+        if cached is not None:
+            return cached[0]
+        if not _RE_TRACK_ID.match(track_id):
+            # Never let a malformed id into a batch, it would fail every track alongside it.
+            return await self.make_get_call(f"{TRACKS_ENDPOINT}/{track_id}", params={})
+        return await asyncio.shield(self._queue_track(track_id))
+
+    def prefetch_tracks(self, track_ids: Iterable[str]) -> None:
+        """Queue tracks into the next batch so later `get_track` calls don't wait on one."""
+        for track_id in track_ids:
+            if track_id not in self._track_cache and _RE_TRACK_ID.match(track_id):
+                self._queue_track(track_id)
+
+    def _queue_track(self, track_id: str) -> asyncio.Future:
+        future = self._pending_tracks.get(track_id) or self._requested_tracks.get(track_id)
+        if future is not None:
+            return future
+        future = asyncio.get_running_loop().create_future()
+        # Mark errors as retrieved, prefetched tracks may never be awaited.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending_tracks[track_id] = future
+        if len(self._pending_tracks) >= TRACK_BATCH_SIZE:
+            self._flush_track_batches()
+        elif self._track_batch_task is None or self._track_batch_task.done():
+            self._track_batch_task = asyncio.create_task(self._track_batch_timer())
+            self._track_batch_task.add_done_callback(task_callback)
+        return future
+
+    async def _track_batch_timer(self) -> None:
+        await asyncio.sleep(TRACK_BATCH_WINDOW)
+        self._flush_track_batches()
+
+    def _flush_track_batches(self) -> None:
+        while self._pending_tracks:
+            batch = dict(itertools.islice(self._pending_tracks.items(), TRACK_BATCH_SIZE))
+            for track_id in batch:
+                del self._pending_tracks[track_id]
+            self._requested_tracks.update(batch)
+            task = asyncio.create_task(self._fetch_track_batch(batch))
+            task.add_done_callback(task_callback)
+
+    async def _fetch_track_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            result = await self.make_get_call(TRACKS_ENDPOINT, params={"ids": ",".join(batch)})
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            for track_id in batch:
+                self._requested_tracks.pop(track_id, None)
+        tracks = result.get("tracks")
+        if tracks is None:
+            if len(batch) > 1 and result.get("error", {}).get("status") in (400, 404):
+                # One bad id fails the whole request, look each track up on its own
+                # so only the bad one gets the error.
+                tracks = await asyncio.gather(
+                    *(
+                        self.make_get_call(f"{TRACKS_ENDPOINT}/{track_id}", params={})
+                        for track_id in batch
+                    ),
+                    return_exceptions=True,
+                )
+            else:
+                # An error payload, hand it to every caller like a single lookup would.
+                tracks = [result] * len(batch)
+        now = int(time.time())
+        padded = itertools.chain(tracks, itertools.repeat(None))
+        for ((track_id, future), track) in zip(batch.items(), padded):
+            if future.done():
+                continue
+            if isinstance(track, BaseException):
+                future.set_exception(track)
+                continue
+            if track is None:
+                track = {"error": {"status": 400, "message": "invalid id"}}
+            elif "error" not in track:
+                self._track_cache.set(track_id, track, now)
+            future.set_result(track)
+
     async def get_categories(self, ctx: Context = None) -> List[MutableMapping]:
         """Get the spotify categories."""
         country_code = await self.get_country_code(ctx=ctx)
@@ -0,0 +1,181 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import Iterable, List, MutableMapping, Optional, TYPE_CHECKING
+import asyncio
+import contextlib
+import logging
+import time
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from ..sql_statements import (
+    GLOBAL_UPLOAD_COUNT,
+    GLOBAL_UPLOAD_CREATE_INDEX,
+    GLOBAL_UPLOAD_CREATE_TABLE,
+    GLOBAL_UPLOAD_DELETE,
+    GLOBAL_UPLOAD_FETCH_DUE,
+    GLOBAL_UPLOAD_RESCHEDULE,
+    GLOBAL_UPLOAD_UPSERT,
+)
+from ..utils import task_callback
+from .database_executor import DatabaseExecutor
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from .global_db import GlobalCacheWrapper
+
+log = logging.getLogger("red.cogs.Music.api.GlobalUploadQueue")
+
+
+class GlobalUploadQueue:
+    """Persistent outbound queue for contributions to the Global API.
+
+    Contributions are stored in the ``global_upload`` table and a background worker
+    drains it ``batch_size`` rows at a time, posting at most ``rate`` uploads per second.
+    Failed uploads are retried with an exponential backoff and dropped after
+    ``max_attempts``, anything still queued on unload is sent after the next load.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseExecutor,
+        global_cache: GlobalCacheWrapper,
+        rate: float = 2.0,
+        batch_size: int = 50,
+        poll_interval: float = 30.0,
+        max_attempts: int = 8,
+        backoff: float = 60.0,
+        max_backoff: float = 6 * 3600.0,
+        close_timeout: float = 10.0,
+    ):
+        self.database = database
+        self.global_cache = global_cache
+        self.rate = rate
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.close_timeout = close_timeout
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.uploaded = 0
+        self.dropped = 0
+
+    async def init(self) -> None:
+        """Create the queue table."""
+        await self.database.execute(GLOBAL_UPLOAD_CREATE_TABLE)
+        await self.database.execute(GLOBAL_UPLOAD_CREATE_INDEX)
+
+    def start(self) -> None:
+        """Start the background uploader."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(task_callback)
+
+    async def pending(self) -> int:
+        """The number of contributions waiting to be uploaded."""
+        row = await self.database.fetchone(GLOBAL_UPLOAD_COUNT)
+        return row[0] if row else 0
+
+    async def put(self, tasks: Iterable[MutableMapping]) -> None:
+        """Queue contributions, each task holds the ``llresponse`` and ``query`` to post."""
+        now = int(time.time())
+        rows = []
+        for task in tasks:
+            try:
+                prepared = self.global_cache.prepare_upload(**task)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to prepare upload: %s", task.get("query"))
+                continue
+            if prepared is not None:
+                (query, data) = prepared
+                rows.append({"query": query, "data": data, "next_attempt": now})
+        if not rows:
+            return
+        await self.database.executemany(GLOBAL_UPLOAD_UPSERT, rows)
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            uploaded = 0
+            try:
+                uploaded = await self._drain_batch()
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to drain the Global API upload queue")
+            if not uploaded:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                self._wakeup.clear()
+
+    async def _drain_batch(self) -> int:
+        if (
+            not self.global_cache.cog.global_api_user.get("can_post")
+            or self.global_cache.breaker.is_open
+        ):
+            return 0
+        rows = await self.database.fetchall(
+            GLOBAL_UPLOAD_FETCH_DUE, {"now": int(time.time()), "limit": self.batch_size}
+        )
+        done: List[MutableMapping] = []
+        retry: List[MutableMapping] = []
+        try:
+            for (query, data, attempts) in rows:
+                if self._closing:
+                    break
+                status = await self.global_cache.upload(query, data)
+                if status is not None and status < 400:
+                    self.uploaded += 1
+                    done.append({"query": query})
+                elif (status is None or status == 429 or status >= 500) and (
+                    attempts + 1 < self.max_attempts
+                ):
+                    delay = min(self.backoff * 2 ** attempts, self.max_backoff)
+                    retry.append(
+                        {
+                            "query": query,
+                            "attempts": attempts + 1,
+                            "next_attempt": int(time.time() + delay),
+                        }
+                    )
+                    if status == 429:
+                        break
+                else:
+                    self.dropped += 1
+                    done.append({"query": query})
+                await asyncio.sleep(1 / self.rate)
+        finally:
+            # Runs on cancellation too, so posted rows are never uploaded twice.
+            if done:
+                await self.database.executemany(GLOBAL_UPLOAD_DELETE, done)
+            if retry:
+                await self.database.executemany(GLOBAL_UPLOAD_RESCHEDULE, retry)
+        if IS_DEBUG and rows:
+            log.debug(
+                "Finished %d and rescheduled %d Global API contributions",
+                len(done),
+                len(retry),
+            )
+        return len(done)
+
+    async def close(self) -> None:
+        """Stop the background uploader, queued contributions stay in the table.
+
+        The current batch gets ``close_timeout`` seconds to finish its upload and record
+        the result before the worker is cancelled.
+        """
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout=self.close_timeout)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+            self._task = None
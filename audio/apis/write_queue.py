@@ -0,0 +1,153 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import defaultdict
+from typing import Dict, Hashable, List, MutableMapping, Optional, Tuple, TYPE_CHECKING
+import asyncio
+import contextlib
+import datetime
+import logging
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from ..utils import task_callback
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from .local_db import BaseWrapper, LocalCacheWrapper
+    from .upload_queue import GlobalUploadQueue
+
+log = logging.getLogger("red.cogs.Music.api.WriteQueue")
+
+
+class CacheWriteQueue:
+    """Write-behind pipeline for the local cache tables.
+
+    Writes are buffered in memory and flushed in the background either every
+    ``flush_interval`` seconds or as soon as ``max_batch`` writes are pending.
+    Writes to the same key are coalesced, so a row touched a hundred times
+    between two flushes only gets a single ``UPDATE``.
+    """
+
+    def __init__(
+        self,
+        local_cache: LocalCacheWrapper,
+        uploads: GlobalUploadQueue,
+        flush_interval: float = 5.0,
+        max_batch: int = 500,
+        max_pending: int = 5000,
+    ):
+        self.local_cache = local_cache
+        self.uploads = uploads
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._inserts: Dict[str, Dict[Hashable, MutableMapping]] = defaultdict(dict)
+        self._touches: Dict[str, Dict[Hashable, MutableMapping]] = defaultdict(dict)
+        self._global: List[MutableMapping] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def pending(self) -> int:
+        """The number of writes waiting to be flushed."""
+        return (
+            sum(len(v) for v in self._inserts.values())
+            + sum(len(v) for v in self._touches.values())
+            + len(self._global)
+        )
+
+    def _table(self, table: str) -> Optional[BaseWrapper]:
+        return getattr(self.local_cache, table, None)
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(task_callback)
+
+    async def put(self, event: str, task: Tuple) -> None:
+        """Queue a write.
+
+        ``event`` is one of ``insert``, ``update`` or ``global``.
+        If the queue has fallen behind this waits for a flush before returning.
+        """
+        if event == "insert":
+            table, rows = task
+            wrapper = self._table(table)
+            if wrapper is None:
+                return
+            for row in rows:
+                key = row.get(wrapper.cache_insert_key, id(row))
+                self._inserts[table][key] = row
+        elif event == "update":
+            table, values = task
+            wrapper = self._table(table)
+            if wrapper is None:
+                return
+            values.setdefault(
+                "last_fetched", int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            )
+            self._touches[table][values.get(wrapper.cache_key)] = values
+        elif event == "global":
+            self._global.append(task)
+        else:
+            return
+
+        pending = self.pending
+        if pending >= self.max_pending:
+            if IS_DEBUG:
+                log.debug("Write queue is behind (%d pending), flushing inline", pending)
+            await self.flush()
+        elif pending >= self.max_batch:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed database writes")
+
+    async def flush(self) -> None:
+        """Write everything that is currently pending."""
+        async with self._flush_lock:
+            inserts, self._inserts = self._inserts, defaultdict(dict)
+            touches, self._touches = self._touches, defaultdict(dict)
+            global_tasks, self._global = self._global, []
+            if not (inserts or touches or global_tasks):
+                return
+            if IS_DEBUG:
+                log.debug(
+                    "Flushing %d inserts, %d updates and %d global contributions",
+                    sum(len(v) for v in inserts.values()),
+                    sum(len(v) for v in touches.values()),
+                    len(global_tasks),
+                )
+            for table, rows in inserts.items():
+                wrapper = self._table(table)
+                if wrapper is not None and rows:
+                    await wrapper.insert(list(rows.values()))
+            for table, rows in touches.items():
+                wrapper = self._table(table)
+                if wrapper is not None and rows:
+                    await wrapper.update_many(list(rows.values()))
+            if global_tasks:
+                await self.uploads.put(global_tasks)
+
+    async def close(self) -> None:
+        """Stop the background flusher and write everything still pending."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 # Standard Library Imports
-from typing import Mapping, Optional, TYPE_CHECKING, Union
+from typing import Mapping, Optional, Set, TYPE_CHECKING, Union
+import asyncio
+import datetime
+import functools
 import logging
+import time
 
 # Dependency Imports
 import aiohttp
@@ -21,6 +25,8 @@ from redbot.core.commands import Cog
 
 # Music Imports
 from ..errors import YouTubeApiError
+from ..utils import task_callback
+from .api_utils import SingleFlight
 
 if TYPE_CHECKING:
 
@@ -31,6 +37,121 @@ if TYPE_CHECKING:
 log = logging.getLogger("red.cogs.Music.api.YouTube")
 
 SEARCH_ENDPOINT = "https://www.googleapis.com/youtube/v3/search"
+SEARCH_QUOTA_COST = 100
+QUOTA_ERROR_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+
+
+class YouTubeQuota:
+    """Accounting for the YouTube Data API quota.
+
+    Units spent are counted per UTC day and saved to Config so a restart doesn't forget
+    them. Searches are paced with a token bucket and once only the reserve is left
+    ``has_budget`` returns False so callers can fall back to Lavalink's own search
+    instead of running into a 403 halfway through a playlist.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        reserve: int = 500,
+        rate: float = 5.0,
+        burst: int = 10,
+        save_delay: float = 30.0,
+    ):
+        self.config = config
+        self.reserve = reserve
+        self.rate = rate
+        self.burst = burst
+        self.save_delay = save_delay
+        self.daily_limit = 10_000
+        self.used = 0
+        self.day: Optional[str] = None
+        self._loaded = False
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._save_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def today() -> str:
+        return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    @property
+    def remaining(self) -> int:
+        """Units left for the current UTC day."""
+        self._roll_over()
+        return max(self.daily_limit - self.used, 0)
+
+    def _roll_over(self) -> None:
+        today = self.today()
+        if self.day != today:
+            self.day = today
+            self.used = 0
+
+    async def load(self) -> None:
+        """Load the units already spent today."""
+        if self._loaded:
+            return
+        data = await self.config.youtube.quota.all()
+        self.daily_limit = data["limit"]
+        self.day = data["day"]
+        self.used = data["used"]
+        self._roll_over()
+        self._loaded = True
+
+    async def save(self) -> None:
+        """Persist the units spent today."""
+        async with self.config.youtube.quota.all() as data:
+            data["day"] = self.day
+            data["used"] = self.used
+            data["limit"] = self.daily_limit
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the daily quota of the API key."""
+        await self.load()
+        self.daily_limit = limit
+        await self.save()
+
+    def has_budget(self, cost: int = SEARCH_QUOTA_COST) -> bool:
+        """Whether a call costing ``cost`` units still fits in today's budget."""
+        return self.remaining - cost >= self.reserve
+
+    async def spend(self, cost: int = SEARCH_QUOTA_COST) -> None:
+        """Wait for a token from the bucket then record ``cost`` units as spent."""
+        await self.load()
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._last_refill = time.monotonic()
+            self._tokens -= 1
+            self._roll_over()
+            self.used += cost
+        self._schedule_save()
+
+    def exhaust(self) -> None:
+        """Mark today's quota as used up, YouTube told us it is."""
+        self._roll_over()
+        self.used = max(self.used, self.daily_limit)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+            self._save_task.add_done_callback(task_callback)
+
+    async def _delayed_save(self) -> None:
+        await asyncio.sleep(self.save_delay)
+        await self.save()
+
+    async def close(self) -> None:
+        """Save any pending changes."""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+            await self.save()
 
 
 class YouTubeWrapper:
@@ -50,6 +171,8 @@ class YouTubeWrapper:
         self.config_cache = cache
         self.api_key: Optional[str] = None
         self._token: Mapping[str, str] = {}
+        self._inflight = SingleFlight()
+        self.quota = YouTubeQuota(config)
         self.cog = cog
 
     async def update_token(self, new_token: Mapping[str, str]):
@@ -65,7 +188,23 @@ class YouTubeWrapper:
         return self.api_key if self.api_key is not None else ""
 
     async def get_call(self, query: str) -> Optional[str]:
-        """Make a Get call to youtube data api."""
+        """Make a Get call to youtube data api.
+
+        Concurrent calls for the same query share a single request.
+        """
+        return await self._inflight.run(query, functools.partial(self._get_call, query))
+
+    @staticmethod
+    async def _error_reasons(response: aiohttp.ClientResponse) -> Set[str]:
+        """The ``reason`` of every error in a YouTube Data API error response."""
+        try:
+            data = await response.json(loads=json.loads)
+            return {error.get("reason") for error in data["error"].get("errors", [])}
+        except (aiohttp.ContentTypeError, ValueError, KeyError, AttributeError, TypeError):
+            return set()
+
+    async def _get_call(self, query: str) -> Optional[str]:
+        await self.quota.spend(SEARCH_QUOTA_COST)
         params = {
             "q": query,
             "part": "id",
@@ -85,6 +224,8 @@ class YouTubeWrapper:
             elif r.status == 404:
                 return None
             elif r.status == 403:
+                if await self._error_reasons(r) & QUOTA_ERROR_REASONS:
+                    self.quota.exhaust()
                 if r.reason in ["Forbidden", "quotaExceeded"]:
                     raise YouTubeApiError(
                         (
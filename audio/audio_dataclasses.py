@@ -4,6 +4,7 @@ from __future__ import annotations
 # Standard Library Imports
 from pathlib import Path, PosixPath, WindowsPath
 from typing import (
+    Any,
     AsyncIterator,
     Callable,
     Final,
@@ -16,6 +17,8 @@ from typing import (
 )
 from urllib.parse import urlparse
 import contextlib
+import copy
+import functools
 import glob
 import logging
 import ntpath
@@ -36,7 +39,11 @@ _RE_SPOTIFY_URL: Final[Pattern] = re.compile(r"(http[s]?://)?(open\.spotify\.com
 _RE_SPOTIFY_TIMESTAMP: Final[Pattern] = re.compile(r"#(\d+):(\d+)")
 _RE_SOUNDCLOUD_TIMESTAMP: Final[Pattern] = re.compile(r"#t=(\d+):(\d+)s?")
 _RE_TWITCH_TIMESTAMP: Final[Pattern] = re.compile(r"\?t=(\d+)h(\d+)m(\d+)s")
+_RE_REMOTE: Final[Pattern] = re.compile(
+    r"^(?:spotify:|[a-z][a-z0-9+.\-]*://[^/\s])", flags=re.IGNORECASE
+)
 _PATH_SEPS: Final[Tuple[str, str]] = (posixpath.sep, ntpath.sep)
+_PARSED_QUERY_CACHE_SIZE: Final[int] = 8192
 
 _FULLY_SUPPORTED_MUSIC_EXT: Final[Tuple[str, ...]] = (".mp3", ".flac", ".ogg")
 _PARTIALLY_SUPPORTED_MUSIC_EXT: Tuple[str, ...] = (
@@ -91,6 +98,8 @@ class LocalPath:
     `localtracks`.
     """
 
+    __slots__ = ("_localtrack_folder", "_path", "localtrack_folder", "path", "_hash")
+
     _all_music_ext = _FULLY_SUPPORTED_MUSIC_EXT + _PARTIALLY_SUPPORTED_MUSIC_EXT
 
     def __init__(self, path, localtrack_folder, **kwargs):
@@ -101,9 +110,8 @@ class LocalPath:
         elif path is not None:
             path = str(path)
 
-        self.cwd = Path.cwd()
-        _lt_folder = Path(self._localtrack_folder) if self._localtrack_folder else self.cwd
-        _path = Path(path) if path else self.cwd
+        _lt_folder = Path(self._localtrack_folder) if self._localtrack_folder else Path.cwd()
+        _path = Path(path) if path else Path.cwd()
         if _lt_folder.parts[-1].lower() == "localtracks" and not kwargs.get("forced"):
             self.localtrack_folder = _lt_folder
         elif kwargs.get("forced"):
@@ -126,11 +134,12 @@ class LocalPath:
                     path = path.replace(f"localtracks{sep}", "", 1)
             self.path = self.localtrack_folder.joinpath(path) if path else self.localtrack_folder
 
+    @property
+    def parent(self) -> Optional[Path]:
         try:
-            parent = self.path.parent if self.path.is_file() else self.path
-            self.parent = Path(parent)
+            return self.path.parent if self.path.is_file() else self.path
         except OSError:
-            self.parent = None
+            return None
 
     @property
     def name(self):
@@ -317,41 +326,112 @@ class LocalPath:
         return NotImplemented
 
 
+class _Flag:
+    """A boolean query attribute stored as one bit of ``Query._flags``."""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, bit: int):
+        self.mask = 1 << bit
+
+    def __get__(self, instance: Optional[Query], owner: Optional[type] = None):
+        if instance is None:
+            return self
+        return bool(instance._flags & self.mask)
+
+    def __set__(self, instance: Query, value: bool) -> None:
+        if value:
+            instance._flags |= self.mask
+        else:
+            instance._flags &= ~self.mask
+
+
+# The keyword argument setting each flag, in bit order.
+_QUERY_FLAG_KWARGS: Final[Tuple[str, ...]] = (
+    "local",
+    "spotify",
+    "youtube",
+    "soundcloud",
+    "bandcamp",
+    "vimeo",
+    "mixer",
+    "twitch",
+    "other",
+    "pornhub",
+    "playlist",
+    "album",
+    "search",
+    "stream",
+    "single",
+    "search_subfolders",
+    "is_url",
+)
+
+
 class Query:
     """Query data class.
 
     Use: Query.process_input(query, localtrack_folder) to generate the Query object.
     """
 
+    __slots__ = (
+        "_raw",
+        "_local_folder_current_path",
+        "_flags",
+        "_hash",
+        "id",
+        "invoked_from",
+        "local_name",
+        "spotify_uri",
+        "uri",
+        "start_time",
+        "track_index",
+        "local_track_path",
+        "track",
+        "lavalink_query",
+    )
+
+    is_local = _Flag(0)
+    is_spotify = _Flag(1)
+    is_youtube = _Flag(2)
+    is_soundcloud = _Flag(3)
+    is_bandcamp = _Flag(4)
+    is_vimeo = _Flag(5)
+    is_mixer = _Flag(6)
+    is_twitch = _Flag(7)
+    is_other = _Flag(8)
+    is_pornhub = _Flag(9)
+    is_playlist = _Flag(10)
+    is_album = _Flag(11)
+    is_search = _Flag(12)
+    is_stream = _Flag(13)
+    single_track = _Flag(14)
+    search_subfolders = _Flag(15)
+    is_url = _Flag(16)
+    valid = _Flag(17)
+    _HASHED_FLAGS: Final[int] = ~(is_pornhub.mask | search_subfolders.mask | is_url.mask)
+
     def __init__(self, query: Union[LocalPath, str], local_folder_current_path: Path, **kwargs):
         query = kwargs.get("queryforced", query)
         self._raw: Union[LocalPath, str] = query
         self._local_folder_current_path = local_folder_current_path
-        _localtrack: LocalPath = LocalPath(query, local_folder_current_path)
-
-        self.valid: bool = query != "InvalidQueryPlaceHolderName"
-        self.is_local: bool = kwargs.get("local", False)
-        self.is_spotify: bool = kwargs.get("spotify", False)
-        self.is_youtube: bool = kwargs.get("youtube", False)
-        self.is_soundcloud: bool = kwargs.get("soundcloud", False)
-        self.is_bandcamp: bool = kwargs.get("bandcamp", False)
-        self.is_vimeo: bool = kwargs.get("vimeo", False)
-        self.is_mixer: bool = kwargs.get("mixer", False)
-        self.is_twitch: bool = kwargs.get("twitch", False)
-        self.is_other: bool = kwargs.get("other", False)
-        self.is_pornhub: bool = kwargs.get("pornhub", False)
-        self.is_playlist: bool = kwargs.get("playlist", False)
-        self.is_album: bool = kwargs.get("album", False)
-        self.is_search: bool = kwargs.get("search", False)
-        self.is_stream: bool = kwargs.get("stream", False)
-        self.single_track: bool = kwargs.get("single", False)
+        _localtrack: Optional[LocalPath] = (
+            None
+            if isinstance(query, str) and _RE_REMOTE.match(query)
+            else LocalPath(query, local_folder_current_path)
+        )
+
+        flags = 0
+        for (bit, kwarg) in enumerate(_QUERY_FLAG_KWARGS):
+            if kwargs.get(kwarg, False):
+                flags |= 1 << bit
+        self._flags: int = flags
+        self.valid = query != "InvalidQueryPlaceHolderName"
         self.id: Optional[str] = kwargs.get("id", None)
         self.invoked_from: Optional[str] = kwargs.get("invoked_from", None)
         self.local_name: Optional[str] = kwargs.get("name", None)
-        self.search_subfolders: bool = kwargs.get("search_subfolders", False)
         self.spotify_uri: Optional[str] = kwargs.get("uri", None)
         self.uri: Optional[str] = kwargs.get("url", None)
-        self.is_url: bool = kwargs.get("is_url", False)
 
         self.start_time: int = kwargs.get("start_time", 0)
         self.track_index: Optional[int] = kwargs.get("track_index", None)
@@ -359,10 +439,14 @@ class Query:
             self.is_youtube = False
             self.is_soundcloud = True
 
-        if (_localtrack.is_file() or _localtrack.is_dir()) and _localtrack.exists():
+        if (
+            _localtrack is not None
+            and (_localtrack.is_file() or _localtrack.is_dir())
+            and _localtrack.exists()
+        ):
             self.local_track_path: Optional[LocalPath] = _localtrack
             self.track: str = str(_localtrack.absolute())
-            self.is_local: bool = True
+            self.is_local = True
             self.uri = self.track
         else:
             self.local_track_path: Optional[LocalPath] = None
@@ -372,30 +456,6 @@ class Query:
 
         if self.is_playlist or self.is_album:
             self.single_track = False
-        self._hash = hash(
-            (
-                self.valid,
-                self.is_local,
-                self.is_spotify,
-                self.is_youtube,
-                self.is_soundcloud,
-                self.is_bandcamp,
-                self.is_vimeo,
-                self.is_mixer,
-                self.is_twitch,
-                self.is_other,
-                self.is_playlist,
-                self.is_album,
-                self.is_search,
-                self.is_stream,
-                self.single_track,
-                self.id,
-                self.spotify_uri,
-                self.start_time,
-                self.track_index,
-                self.uri,
-            )
-        )
 
     def __str__(self):
         return str(self.lavalink_query)
@@ -419,10 +479,16 @@ class Query:
         -------
         Query
             Returns a parsed Query object.
+
+        Notes
+        -----
+        Remote URLs and Spotify URIs are memoised per local folder, the returned object
+        is a copy so callers are free to modify it. Anything else may be a local path,
+        whose parse depends on the filesystem, and is parsed on every call.
         """
         if not query:
             query = "InvalidQueryPlaceHolderName"
-        possible_values = {}
+        stream = None
 
         if isinstance(query, str):
             query = query.strip("<>")
@@ -437,9 +503,31 @@ class Query:
                 setattr(query, key, val)
             return query
         elif isinstance(query, lavalink.Track):
-            possible_values["stream"] = query.is_stream
+            stream = query.is_stream
             query = query.uri
 
+        if isinstance(query, str) and _RE_REMOTE.match(query):
+            try:
+                parsed = _parse_query(
+                    query, _local_folder_current_path, stream, tuple(sorted(kwargs.items()))
+                )
+            except TypeError:
+                pass
+            else:
+                return copy.copy(parsed)
+        return cls._from_input(query, _local_folder_current_path, stream, **kwargs)
+
+    @classmethod
+    def _from_input(
+        cls,
+        query: Union[LocalPath, str],
+        _local_folder_current_path: Path,
+        stream: Optional[bool],
+        **kwargs,
+    ) -> "Query":
+        possible_values = {}
+        if stream is not None:
+            possible_values["stream"] = stream
         possible_values.update(dict(**kwargs))
         possible_values.update(cls._parse(query, _local_folder_current_path, **kwargs))
         return cls(query, _local_folder_current_path, **possible_values)
@@ -487,8 +575,10 @@ class Query:
                 track = _RE_REMOVE_START.sub("", track, 1)
                 returning["queryforced"] = track
 
-            _localtrack = LocalPath(track, _local_folder_current_path)
-            if _localtrack.exists():
+            _localtrack = (
+                None if _RE_REMOTE.match(track) else LocalPath(track, _local_folder_current_path)
+            )
+            if _localtrack is not None and _localtrack.exists():
                 if _localtrack.is_file():
                     returning["local"] = True
                     returning["single"] = True
@@ -637,21 +727,7 @@ class Query:
         except AttributeError:
             self._hash = hash(
                 (
-                    self.valid,
-                    self.is_local,
-                    self.is_spotify,
-                    self.is_youtube,
-                    self.is_soundcloud,
-                    self.is_bandcamp,
-                    self.is_vimeo,
-                    self.is_mixer,
-                    self.is_twitch,
-                    self.is_other,
-                    self.is_playlist,
-                    self.is_album,
-                    self.is_search,
-                    self.is_stream,
-                    self.single_track,
+                    self._flags & self._HASHED_FLAGS,
                     self.id,
                     self.spotify_uri,
                     self.start_time,
@@ -680,3 +756,13 @@ class Query:
         if not isinstance(other, Query):
             return NotImplemented
         return self.to_string_user() >= other.to_string_user()
+
+
+@functools.lru_cache(maxsize=_PARSED_QUERY_CACHE_SIZE)
+def _parse_query(
+    query: str,
+    local_folder_current_path: Path,
+    stream: Optional[bool],
+    kwargs: Tuple[Tuple[str, Any], ...],
+) -> Query:
+    return Query._from_input(query, local_folder_current_path, stream, **dict(kwargs))
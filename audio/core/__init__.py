@@ -12,20 +12,15 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.data_manager import cog_data_path
-import aiohttp
 import discord
 
-try:
-    # Dependency Imports
-    from redbot import json
-except ImportError:
-    # Standard Library Imports
-    import json
-
 # Music Imports
-from ..utils import PlaylistScope
+from ..apis.api_utils import SingleFlight
+from ..apis.http_client import HTTPClient
+from ..utils import PlaylistScope, SearchIndex
 from . import commands, events, tasks, utilities
 from .cog_utils import CompositeMetaClass
+from .utilities.parsers import IcyMetadataPoller
 
 
 class Music(
@@ -57,6 +52,9 @@ class Music(
         self._disconnected_players = {}
         self.skip_votes = {}
         self.play_lock = {}
+        self.enqueue_jobs = {}
+        self.lyrics_inflight = SingleFlight()
+        self.local_search_index = SearchIndex()
 
         self.lavalink_connect_task = None
         self._restore_task = None
@@ -71,7 +69,9 @@ class Music(
             add_reactions=True,
         )
 
-        self.session = aiohttp.ClientSession(json_serialize=json.dumps)
+        self.http = HTTPClient()
+        self.session = self.http.session
+        self.icy_poller = IcyMetadataPoller(self.session)
         self.cog_ready_event = asyncio.Event()
         self._ws_resume = defaultdict(asyncio.Event)
         self._ws_op_codes = defaultdict(asyncio.LifoQueue)
@@ -159,6 +159,9 @@ class Music(
             lavalink__jar__stable=True,
             lavalink__nodes=default_cog_lavalink_settings,
             lavalink__managed_yaml=lavalink_yaml,
+            youtube__quota__day=None,
+            youtube__quota__used=0,
+            youtube__quota__limit=10_000,
         )
 
         default_guild: Mapping = dict(
@@ -13,7 +13,6 @@ import datetime
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.commands import Context
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 import aiohttp
 import discord
 
@@ -25,12 +24,17 @@ import lavalink
 if TYPE_CHECKING:
 
     # Music Imports
+    from ..apis.api_utils import SingleFlight
+    from ..apis.database_executor import DatabaseExecutor
+    from ..apis.http_client import HTTPClient
     from ..apis.interface import AudioAPIInterface
     from ..apis.playlist_interface import Playlist
     from ..apis.playlist_wrapper import PlaylistWrapper
     from ..audio_dataclasses import LocalPath, Query
     from ..manager import ServerManager
+    from ..utils import SearchIndex
     from .utilities import SettingCacheManager
+    from .utilities.parsers import IcyMetadataPoller
 
 
 class MixinMeta(ABC):
@@ -45,12 +49,17 @@ class MixinMeta(ABC):
     player_manager: Optional["ServerManager"]
     playlist_api: Optional["PlaylistWrapper"]
     local_folder_current_path: Optional[Path]
-    db_conn: Optional[APSWConnectionWrapper]
+    db_conn: Optional[DatabaseExecutor]
     session: aiohttp.ClientSession
+    http: HTTPClient
+    icy_poller: IcyMetadataPoller
     config_cache: SettingCacheManager
 
     skip_votes: MutableMapping[int, Set[int]]
     play_lock: MutableMapping[int, bool]
+    enqueue_jobs: MutableMapping[int, asyncio.Task]
+    lyrics_inflight: SingleFlight
+    local_search_index: SearchIndex
     _error_timer: MutableMapping[int, float]
     _disconnected_players: MutableMapping[int, bool]
     global_api_user: MutableMapping[str, Any]
@@ -101,11 +110,11 @@ class MixinMeta(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    async def maybe_run_pending_db_tasks(self, ctx: commands.Context) -> None:
+    def update_player_lock(self, ctx: commands.Context, true_or_false: bool) -> None:
         raise NotImplementedError()
 
     @abstractmethod
-    def update_player_lock(self, ctx: commands.Context, true_or_false: bool) -> None:
+    def cancel_enqueue_job(self, guild: discord.Guild) -> bool:
         raise NotImplementedError()
 
     @abstractmethod
@@ -260,6 +269,10 @@ class MixinMeta(ABC):
     async def queue_duration(self, ctx: commands.Context) -> int:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def queue_time_until(self, ctx: commands.Context, position: Optional[int]) -> int:
+        raise NotImplementedError()
+
     @abstractmethod
     async def track_remaining_duration(self, ctx: commands.Context) -> int:
         raise NotImplementedError()
@@ -414,6 +427,10 @@ class MixinMeta(ABC):
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _local_tracks_in(self, folder: "LocalPath", recursive: bool) -> List["Query"]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def _build_search_page(
         self, ctx: commands.Context, tracks: List, page_num: int
@@ -458,9 +475,13 @@ class MixinMeta(ABC):
     async def command_pause(self, ctx: commands.Context):
         raise NotImplementedError()
 
+    @abstractmethod
+    def _queue_search_title(self, track: lavalink.Track) -> str:
+        raise NotImplementedError()
+
     @abstractmethod
     async def _build_queue_search_list(
-        self, queue_list: List[lavalink.Track], search_words: str
+        self, player: lavalink.Player, search_words: str
     ) -> List[Tuple[int, str]]:
         raise NotImplementedError()
 
@@ -553,6 +574,10 @@ class MixinMeta(ABC):
     def is_slash_compatible() -> bool:
         raise NotImplementedError()
 
-    @staticmethod
-    async def get_lyrics_string(artist_song: str) -> Tuple[str, str, str, str]:
+    @abstractmethod
+    async def get_lyrics_string(self, artist_song: str) -> Tuple[str, str, str, str]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def prefetch_lyrics(self, artist_song: str) -> None:
         raise NotImplementedError()
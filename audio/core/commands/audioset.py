@@ -622,6 +622,13 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 youtube_status=ENABLED_TITLE if has_youtube_cache else DISABLED_TITLE,
                 lavalink_status=ENABLED_TITLE if has_lavalink_cache else DISABLED_TITLE,
             )
+            if self.api_interface is not None:
+                msg += "\n"
+                memory_cache_stats = self.api_interface.local_cache_api.memory_cache_stats()
+                for table, stats in memory_cache_stats.items():
+                    msg += "{table:<18}[{hits} hits, {misses} misses, {size}/{maxsize}]\n".format(
+                        table=f"{table.title()} memory:", **stats
+                    )
             await self.send_embed_msg(
                 ctx, title="Cache Settings", description=box(msg, lang="ini"), no_embed=True
             )
@@ -721,6 +728,111 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         await self.config_cache.global_api_timeout.set_global(timeout)
         await ctx.send("Request timeout set to {time} second(s)".format(time=timeout))
 
+    @command_audioset_global.command(name="youtubequota")
+    async def command_audioset_global_youtubequota(
+        self, ctx: commands.Context, daily_limit: int = None
+    ):
+        """Show the YouTube Data API quota left for today.
+
+        Each Spotify track that isn't cached costs 100 units to match on YouTube, once the
+        quota runs low tracks are searched through Lavalink instead.
+        Pass `daily_limit` to change the daily quota of your API key, the default is 10000.
+        """
+        if self.api_interface is None:
+            return await self.send_embed_msg(
+                ctx,
+                title="YouTube Quota Not Available",
+                description="Music is still starting up, try again in a moment.",
+            )
+        quota = self.api_interface.youtube_api.quota
+        await quota.load()
+        if daily_limit is not None:
+            if daily_limit < quota.reserve:
+                return await self.send_embed_msg(
+                    ctx,
+                    title="Invalid Quota",
+                    description="The daily quota must be at least {reserve} units.".format(
+                        reserve=humanize_number(quota.reserve)
+                    ),
+                )
+            await quota.set_limit(daily_limit)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        reset = datetime.datetime.combine(
+            now.date() + datetime.timedelta(days=1), datetime.time(), tzinfo=datetime.timezone.utc
+        )
+        msg = (
+            "Used:            [{used}]\n"
+            "Remaining:       [{remaining}]\n"
+            "Daily limit:     [{limit}]\n"
+            "Reserve:         [{reserve}]\n"
+            "Fallback:        [{fallback}]\n"
+            "Resets in:       [{reset}]\n"
+        ).format(
+            used=humanize_number(quota.used),
+            remaining=humanize_number(quota.remaining),
+            limit=humanize_number(quota.daily_limit),
+            reserve=humanize_number(quota.reserve),
+            fallback=ENABLED_TITLE if not quota.has_budget() else DISABLED_TITLE,
+            reset=self.get_time_string(int((reset - now).total_seconds())),
+        )
+        await self.send_embed_msg(ctx, title="YouTube API Quota", description=box(msg, lang="ini"))
+
+    @command_audioset_global.command(name="apistats")
+    async def command_audioset_global_apistats(self, ctx: commands.Context):
+        """Show request statistics for the external APIs."""
+        msg = ""
+        if self.api_interface is not None:
+            spotify_stats = self.api_interface.spotify_api.stats()
+            msg += "----" + "Spotify" + "----        \n"
+            msg += (
+                "Requests:        [{requests}]\n"
+                "Throttled:       [{throttled}]\n"
+                "Errors:          [{errors}]\n"
+                "Token refreshes: [{token_refreshes}]\n"
+                "Avg latency:     [{average_latency:.0f}ms]\n"
+                "Max latency:     [{max_latency:.0f}ms]\n"
+                "Retry after:     [{rate_limited_for:.1f}s]\n"
+            ).format(
+                requests=humanize_number(spotify_stats["requests"]),
+                throttled=humanize_number(spotify_stats["throttled"]),
+                errors=humanize_number(spotify_stats["errors"]),
+                token_refreshes=humanize_number(spotify_stats["token_refreshes"]),
+                average_latency=spotify_stats["average_latency"] * 1000,
+                max_latency=spotify_stats["max_latency"] * 1000,
+                rate_limited_for=spotify_stats["rate_limited_for"],
+            )
+            breaker = self.api_interface.global_cache_api.breaker
+            msg += "\n----" + "Global API" + "----        \n"
+            msg += (
+                "Circuit:         [{state}]\n"
+                "Error rate:      [{error_rate:.0%}]\n"
+                "Timeout:         [{timeout:.1f}s]\n"
+                "Skipped calls:   [{skipped}]\n"
+                "Queued uploads:  [{queued}]\n"
+            ).format(
+                state="Open" if breaker.is_open else "Closed",
+                error_rate=breaker.error_rate,
+                timeout=breaker.timeout(await self.config_cache.global_api_timeout.get_global()),
+                skipped=humanize_number(breaker.skipped),
+                queued=humanize_number(await self.api_interface.global_uploads.pending()),
+            )
+        for service, http_stats in sorted(self.http.stats().items()):
+            msg += "\n----" + "HTTP: {service}".format(service=service) + "----        \n"
+            msg += (
+                "Requests:        [{requests}]\n"
+                "Retries:         [{retries}]\n"
+                "Errors:          [{errors}]\n"
+                "Avg latency:     [{average_latency:.0f}ms]\n"
+                "Max latency:     [{max_latency:.0f}ms]\n"
+            ).format(
+                requests=humanize_number(http_stats["requests"]),
+                retries=humanize_number(http_stats["retries"]),
+                errors=humanize_number(http_stats["errors"]),
+                average_latency=http_stats["average_latency"] * 1000,
+                max_latency=http_stats["max_latency"] * 1000,
+            )
+        await self.send_embed_msg(ctx, title="API Statistics", description=box(msg, lang="ini"))
+
     @command_audioset_global.command(name="historicalqueue")
     async def command_audioset_global_historical_queue(self, ctx: commands.Context):
         """Toggle global daily queues.
@@ -1163,6 +1275,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if await self.config_cache.disconnect.get_global() is True:
             await self.config_cache.disconnect.set_guild(ctx.guild, True)
             await self.config_cache.autoplay.set_guild(ctx.guild, False)
+            if self.api_interface is not None:
+                self.api_interface.discard_autoplay(ctx.guild.id)
             return await self.send_embed_msg(
                 ctx,
                 title="Setting Not Changed",
@@ -1182,6 +1296,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if disconnect is not True and autoplay is True:
             msg += "\nAuto-play has been disabled."
             await self.config_cache.autoplay.set_guild(ctx.guild, False)
+            if self.api_interface is not None:
+                self.api_interface.discard_autoplay(ctx.guild.id)
 
         await self.config_cache.disconnect.set_guild(ctx.guild, not disconnect)
 
@@ -1681,6 +1797,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if await self.config_cache.disconnect.get_global() is True:
             await self.config_cache.disconnect.set_guild(ctx.guild, True)
             await self.config_cache.autoplay.set_guild(ctx.guild, False)
+            if self.api_interface is not None:
+                self.api_interface.discard_autoplay(ctx.guild.id)
             return await self.send_embed_msg(
                 ctx,
                 title="Setting Not Changed",
@@ -1698,6 +1816,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
             true_or_false=ENABLED_TITLE if not autoplay else DISABLED_TITLE
         )
         await self.config_cache.autoplay.set_guild(ctx.guild, not autoplay)
+        if self.api_interface is not None:
+            self.api_interface.discard_autoplay(ctx.guild.id)
         if autoplay is not True and repeat is True:
             msg += "\nRepeat has been disabled."
             await self.config_cache.repeat.set_guild(ctx.guild, False)
@@ -1783,6 +1903,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 )
             playlist_data = dict(enabled=True, id=playlist.id, name=playlist.name, scope=scope)
             await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+            if self.api_interface is not None:
+                self.api_interface.discard_autoplay(ctx.guild.id)
         except RuntimeError:
             return await self.send_embed_msg(
                 ctx,
@@ -1823,6 +1945,8 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         )
 
         await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+        if self.api_interface is not None:
+            self.api_interface.discard_autoplay(ctx.guild.id)
         return await self.send_embed_msg(
             ctx,
             title="Setting Changed",
@@ -3051,7 +3175,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def command_audioset_lavalink_managed_downloader_check(self, ctx: commands.Context):
         """See the latest version of Red's Lavalink server."""
 
-        name, tag, url, date = await get_latest_lavalink_release(date=True)
+        name, tag, url, date = await get_latest_lavalink_release(self.http, date=True)
         version, build = tag.split("_")
         msg = "----" + "Release Builds" + "----        \n"
         msg += "Release Version:  [{version}]\n".format(version=version)
@@ -3062,7 +3186,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if await self.config_cache.managed_lavalink_meta.get_global_stable():
             with contextlib.suppress(Exception):
                 alpha_name, alpha_tag, alpha_url, alpha_date = await get_latest_lavalink_release(
-                    False, date=True
+                    self.http, False, date=True
                 )
                 alpha_version, alpha_build = alpha_tag.split("_")
                 if int(alpha_build) > int(build):
@@ -65,6 +65,7 @@ class PlayerControllerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
 
         await self.send_embed_msg(ctx, title="Disconnecting...")
         self.bot.dispatch("red_audio_audio_disconnect", ctx.guild)
+        self.cancel_enqueue_job(ctx.guild)
         self.update_player_lock(ctx, False)
         player.queue = []
         player.store("playing_song", None)
@@ -558,8 +559,10 @@ class PlayerControllerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 description="You need the DJ role to stop the music.",
             )
         player.store("notify_channel", ctx.channel.id)
+        enqueue_cancelled = self.cancel_enqueue_job(ctx.guild)
         if (
-            player.is_playing
+            enqueue_cancelled
+            or player.is_playing
             or (not player.is_playing and player.paused)
             or player.queue
             or getattr(player.current, "extras", {}).get("autoplay")
@@ -51,6 +51,10 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         SongNth
         """
         queries: List[Query]
+        spotify_track_ids = [q.id for q in queries if q.is_spotify and q.single_track]
+        if len(spotify_track_ids) > 1 and self.api_interface is not None:
+            # Resolve every Spotify track link in as few requests as possible.
+            self.api_interface.spotify_api.prefetch_tracks(spotify_track_ids)
         for query in queries:
             query = Query.process_input(query, self.local_folder_current_path)
             restrict = await self.config_cache.url_restrict.get_context_value(ctx.guild)
@@ -291,7 +295,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     "**{suffix}** is not a fully supported format and some tracks may not play."
                 ).format(suffix=query.suffix)
             return await self.send_embed_msg(ctx, embed=embed)
-        queue_dur = await self.track_remaining_duration(ctx)
+        queue_dur = await self.queue_time_until(ctx, 1)
         index = query.track_index
         seek = 0
         if query.start_time:
@@ -853,7 +857,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "tracks may not play."
                         ).format(suffix=query.suffix)
                     return await self.send_embed_msg(ctx, embed=embed)
-                queue_dur = await self.queue_duration(ctx)
+                queue_dur = await self.queue_time_until(ctx, before_queue_length + 1)
                 queue_total_duration = self.format_time(queue_dur)
                 if await self.config_cache.dj_status.get_context_value(ctx.guild) and not can_skip:
                     return await self.send_embed_msg(
@@ -290,7 +290,7 @@ class QueueCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title="There's nothing in the queue.")
 
-        search_list = await self._build_queue_search_list(player.queue.copy(), search_words)
+        search_list = await self._build_queue_search_list(player, search_words)
         if not search_list:
             return await self.send_embed_msg(ctx, title="No matches.")
 
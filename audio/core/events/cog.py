@@ -21,7 +21,7 @@ import lavalink
 # Music Imports
 from ...apis.playlist_interface import delete_playlist, get_playlist, Playlist
 from ...audio_logging import debug_exc_log
-from ...utils import BOT_SONG_RE, PlaylistScope
+from ...utils import BOT_SONG_RE, PlaylistScope, task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -150,9 +150,15 @@ class AudioEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
         await self.config_cache.currently_playing_name.set_guild(guild, set_to=track.title)
         auto_lyrics = await self.config_cache.auto_lyrics.get_context_value(guild)
         if auto_lyrics:
-            notify_channel = lavalink.get_player(guild.id).fetch("notify_channel")
+            player = lavalink.get_player(guild.id)
+            notify_channel = player.fetch("notify_channel")
             if notify_channel:
                 notify_channel = self.bot.get_channel(notify_channel)
+                if player.queue:
+                    next_song = BOT_SONG_RE.sub("", player.queue[0].title).strip()
+                    asyncio.create_task(self.prefetch_lyrics(next_song)).add_done_callback(
+                        task_callback
+                    )
                 botsong = BOT_SONG_RE.sub("", track.title).strip()
                 title, artist, lyrics, source = await self.get_lyrics_string(botsong)
                 if all([title, artist, lyrics, source]):
@@ -179,6 +185,12 @@ class AudioEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             )
                         )
 
+    @commands.Cog.listener()
+    async def on_red_audio_audio_disconnect(self, guild: discord.Guild):
+        self.icy_poller.release(guild.id)
+        if self.api_interface is not None:
+            self.api_interface.discard_autoplay(guild.id)
+
     @commands.Cog.listener()
     async def on_red_audio_queue_end(
         self, guild: discord.Guild, track: lavalink.Track, requester: discord.Member
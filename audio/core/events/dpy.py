@@ -151,9 +151,6 @@ class DpyEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 await self.config_cache.dj_roles.set_guild(ctx.guild, None)
                 await self.send_embed_msg(ctx, title="No DJ role found. Disabling DJ mode.")
 
-    async def cog_after_invoke(self, ctx: commands.Context) -> None:
-        await self.maybe_run_pending_db_tasks(ctx)
-
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         error = getattr(error, "original", error)
         handled = False
@@ -256,8 +253,6 @@ class DpyEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
             ),
         ):
             self.update_player_lock(ctx, False)
-            if self.api_interface is not None:
-                await self.api_interface.run_tasks(ctx)
         if not handled:
             # noinspection PyArgumentList
             await self.bot.on_command_error(ctx, error, unhandled_by_cog=True)
@@ -267,7 +262,6 @@ class DpyEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return
 
         self.bot.dispatch("red_audio_unload", self)
-        self.session.detach()
         self.bot.loop.create_task(self._close_database())
         if self.player_automated_timer_task:
             self.player_automated_timer_task.cancel()
@@ -281,6 +275,11 @@ class DpyEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if self._restore_task:
             self._restore_task.cancel()
 
+        self.icy_poller.close()
+        for job in self.enqueue_jobs.values():
+            job.cancel()
+        self.enqueue_jobs.clear()
+
         lavalink.unregister_event_listener(self.lavalink_event_handler)
         lavalink.unregister_update_listener(self.lavalink_update_handler)
         self.bot.loop.create_task(lavalink.close(self.bot))
@@ -95,6 +95,13 @@ class LavalinkEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
         current_length = self.rgetattr(current_track, "length", None)
         current_thumbnail = self.rgetattr(current_track, "thumbnail", None)
         current_id = self.rgetattr(current_track, "_info", {}).get("identifier")
+        if event_type == lavalink.LavalinkEvents.TRACK_START:
+            if current_stream and current_track.uri:
+                self.icy_poller.acquire(guild_id, current_track.uri)
+            else:
+                self.icy_poller.release(guild_id)
+        elif event_type == lavalink.LavalinkEvents.QUEUE_END:
+            self.icy_poller.release(guild_id)
 
         repeat = await self.config_cache.repeat.get_context_value(guild)
         notify = await self.config_cache.notify.get_context_value(guild)
@@ -127,6 +134,10 @@ class LavalinkEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 )
             else:
                 await self.config_cache.autoplay.set_currently_in_guild(guild)
+            if not autoplay:
+                self.api_interface.discard_autoplay(guild_id)
+            elif not player.queue and self.playlist_api is not None:
+                self.api_interface.prepare_autoplay(player, self.playlist_api)
         if event_type == lavalink.LavalinkEvents.TRACK_END:
             prev_requester = player.fetch("prev_requester")
             self.bot.dispatch("red_audio_track_end", guild, prev_song, prev_requester)
@@ -53,7 +53,7 @@ class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 break
             if self.player_manager is not None:
                 await self.player_manager.shutdown()
-            self.player_manager = ServerManager(host, password, port, self.config_cache)
+            self.player_manager = ServerManager(host, password, port, self.config_cache, self.http)
             try:
                 await self.player_manager.start(java_exec)
             except ShouldAutoRecover:
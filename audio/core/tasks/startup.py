@@ -14,15 +14,16 @@ from redbot.core import Config
 from redbot.core.data_manager import cog_data_path
 from redbot.core.utils import AsyncIter
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 # My Modded Imports
 from lavalink.filters import Volume
 import lavalink
 
 # Music Imports
+from ...apis.database_executor import DatabaseExecutor
 from ...apis.interface import AudioAPIInterface
 from ...apis.playlist_wrapper import PlaylistWrapper
+from ...audio_dataclasses import LocalPath
 from ...audio_logging import debug_exc_log
 from ...errors import DatabaseError, TrackEnqueueError
 from ...utils import task_callback
@@ -82,7 +83,7 @@ class StartUpTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
         try:
             await self.maybe_migrate_from_core()
             await self.maybe_message_all_owners()
-            self.db_conn = APSWConnectionWrapper(
+            self.db_conn = DatabaseExecutor(
                 str(cog_data_path(self.bot.get_cog("Music")) / "Audio.db")
             )
             self.api_interface = AudioAPIInterface(
@@ -98,6 +99,9 @@ class StartUpTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
             )
             await self.playlist_api.init()
             await self.api_interface.initialize()
+            self.api_interface.local_tracks.start(
+                LocalPath(None, await self.config_cache.localpath.get_global()).localtrack_folder
+            )
             self.global_api_user = await self.api_interface.global_cache_api.get_perms()
             await self.data_schema_migration(
                 from_version=await self.config.schema_version(), to_version=_SCHEMA_VERSION
@@ -158,9 +158,9 @@ class FormattingUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return await ctx.invoke(self.command_play, queries=[search_choice])
 
         songembed = discord.Embed(title="Track Enqueued", description=description)
-        queue_dur = await self.queue_duration(ctx)
-        queue_total_duration = self.format_time(queue_dur)
         before_queue_length = len(player.queue)
+        queue_dur = await self.queue_time_until(ctx, before_queue_length + 1)
+        queue_total_duration = self.format_time(queue_dur)
         query = Query.process_input(search_choice, self.local_folder_current_path)
         if not await self.is_query_allowed(
             self.config_cache,
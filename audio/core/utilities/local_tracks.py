@@ -5,13 +5,12 @@ from __future__ import annotations
 from abc import ABC
 from pathlib import Path
 from typing import List, Union
-import contextlib
+import asyncio
 import logging
+import os
 
 # Dependency Imports
-from fuzzywuzzy import process
 from redbot.core import commands
-from redbot.core.utils import AsyncIter
 import discord
 
 # My Modded Imports
@@ -19,13 +18,26 @@ import lavalink
 
 # Music Imports
 from ...audio_dataclasses import LocalPath, Query
-from ...errors import TrackEnqueueError
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Music.cog.Utilities.local_tracks")
 
 
+def _build_local_tracks(paths: List[str], root: str, local_folder: Path) -> List[Query]:
+    """Turn indexed track paths into sorted queries, this runs in an executor."""
+    tracks = [
+        Query.process_input(path, local_folder) for path in paths if os.path.dirname(path) != root
+    ]
+    return sorted(tracks, key=lambda x: x.to_string_user().lower())
+
+
+def _build_local_folders(paths: List[str], local_folder: Path) -> List[LocalPath]:
+    """Turn indexed folder paths into sorted local paths, this runs in an executor."""
+    folders = [LocalPath(path, local_folder) for path in paths]
+    return sorted(folders, key=lambda x: x.to_string_user().lower())
+
+
 class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def get_localtracks_folders(
         self, ctx: commands.Context, search_subfolders: bool = True
@@ -33,11 +45,17 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         audio_data = LocalPath(None, self.local_folder_current_path)
         if not await self.localtracks_folder_exists(ctx):
             return []
-
-        return (
-            await audio_data.subfolders_in_tree()
-            if search_subfolders
-            else await audio_data.subfolders()
+        if self.api_interface is None:
+            return (
+                await audio_data.subfolders_in_tree()
+                if search_subfolders
+                else await audio_data.subfolders()
+            )
+        index = self.api_interface.local_tracks
+        await index.ready(audio_data.localtrack_folder)
+        paths = await index.folders(audio_data.path, recursive=search_subfolders)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _build_local_folders, paths, self.local_folder_current_path
         )
 
     async def get_localtrack_folder_list(self, ctx: commands.Context, query: Query) -> List[Query]:
@@ -49,11 +67,7 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return []
         if not query.local_track_path.exists():
             return []
-        return (
-            await query.local_track_path.tracks_in_tree()
-            if query.search_subfolders
-            else await query.local_track_path.tracks_in_folder()
-        )
+        return await self._local_tracks_in(query.local_track_path, query.search_subfolders)
 
     async def get_localtrack_folder_tracks(
         self, ctx, player: lavalink.player_manager.Player, query: Query
@@ -70,14 +84,9 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 return []
         except ValueError:
             return []
-        local_tracks = []
-        async for local_file in AsyncIter(await self.get_all_localtrack_folder_tracks(ctx, query)):
-            with contextlib.suppress(IndexError, TrackEnqueueError):
-                trackdata, called_api = await self.api_interface.fetch_track(
-                    ctx, player, local_file
-                )
-                local_tracks.append(trackdata.tracks[0])
-        return local_tracks
+        return await self.api_interface.fetch_local_tracks(
+            ctx, player, await self.get_all_localtrack_folder_tracks(ctx, query)
+        )
 
     async def _local_play_all(
         self, ctx: commands.Context, query: Query, from_search: bool = False
@@ -97,10 +106,17 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     ) -> List[Query]:
         if not await self.localtracks_folder_exists(ctx) or query.local_track_path is None:
             return []
-        return (
-            await query.local_track_path.tracks_in_tree()
-            if query.search_subfolders
-            else await query.local_track_path.tracks_in_folder()
+        return await self._local_tracks_in(query.local_track_path, query.search_subfolders)
+
+    async def _local_tracks_in(self, folder: LocalPath, recursive: bool) -> List[Query]:
+        """The tracks inside `folder`, read from the localtracks index when it is available."""
+        if self.api_interface is None:
+            return await (folder.tracks_in_tree() if recursive else folder.tracks_in_folder())
+        index = self.api_interface.local_tracks
+        await index.ready(folder.localtrack_folder)
+        paths = await index.tracks(folder.path, recursive=recursive)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _build_local_tracks, paths, index.root, self.local_folder_current_path
         )
 
     async def localtracks_folder_exists(self, ctx: commands.Context) -> bool:
@@ -118,19 +134,14 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def _build_local_search_list(
         self, to_search: List[Query], search_words: str
     ) -> List[str]:
-        to_search_string = {
-            i.local_track_path.name for i in to_search if i.local_track_path is not None
-        }
-        search_results = process.extract(search_words, to_search_string, limit=50)
+        tracks = {str(i.local_track_path): i for i in to_search if i.local_track_path is not None}
+        await self.local_search_index.sync(
+            {path: query.local_track_path.name for (path, query) in tracks.items()}, str
+        )
         search_list = []
-        async for track_match, percent_match in AsyncIter(search_results):
+        for (path, name, percent_match) in await self.local_search_index.search(
+            search_words, limit=50
+        ):
             if percent_match > 85:
-                search_list.extend(
-                    [
-                        discord.utils.escape_markdown(i.to_string_user())
-                        for i in to_search
-                        if i.local_track_path is not None
-                        and i.local_track_path.name == track_match
-                    ]
-                )
+                search_list.append(discord.utils.escape_markdown(tracks[path].to_string_user()))
         return search_list
@@ -3,12 +3,16 @@ from __future__ import annotations
 
 # Standard Library Imports
 from abc import ABC
-from typing import Tuple
+from typing import Final, Optional, Pattern, Tuple
 from urllib.parse import quote_plus
+import asyncio
+import functools
+import logging
+import re
+import time
 
 # Dependency Imports
 from bs4 import BeautifulSoup
-import aiohttp
 
 try:
     # Dependency Imports
@@ -17,38 +21,74 @@ except ImportError:
     import json
 
 # Music Imports
+from ...audio_logging import debug_exc_log
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
+log = logging.getLogger("red.cogs.Music.cog.Utilities.lyrics")
+
+_BOUNCER: Final[str] = "Our systems have detected unusual traffic from your computer network"
+_RE_NON_WORD: Final[Pattern] = re.compile(r"[\W_]+")
+
+
+def _normalise_title(artist_song: str) -> str:
+    return _RE_NON_WORD.sub(" ", artist_song.casefold()).strip()
+
+
+def _parse_lyrics_page(page: str) -> Optional[Tuple[str, str, str, str]]:
+    """Get the lyrics out of a Google search page, this runs in an executor."""
+    soup = BeautifulSoup(page, "html.parser")
+    try:
+        return (
+            soup.find("span", class_="BNeawe tAd8D AP7Wnd").get_text(),
+            soup.find_all("span", class_="BNeawe s3v9rd AP7Wnd")[-1].get_text(),
+            soup.find_all("div", class_="BNeawe tAd8D AP7Wnd")[-1].get_text(),
+            soup.find_all("span", class_="uEec3 AP7Wnd")[-1].get_text(),
+        )
+    except (AttributeError, IndexError):
+        return None
+
 
 class LyricUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     """Base class to hold all Lyric utility methods"""
 
-    @staticmethod
-    async def get_lyrics_string(artist_song: str) -> Tuple[str, str, str, str]:
+    async def get_lyrics_string(self, artist_song: str) -> Tuple[str, str, str, str]:
+        key = _normalise_title(artist_song)
+        if self.api_interface is not None:
+            cached = await self.api_interface.local_cache_api.lyrics.fetch_one({"key": key})
+            if cached is not None:
+                if cached.query is None:
+                    return "", "", f"Not able to find the lyrics for {artist_song}.", ""
+                (title_, artist_, lyrics_, source_) = cached.query
+                return title_, artist_, lyrics_, source_
+        return await self.lyrics_inflight.run(
+            key, functools.partial(self._fetch_lyrics, artist_song, key)
+        )
 
+    async def _fetch_lyrics(self, artist_song: str, key: str) -> Tuple[str, str, str, str]:
         searchquery = quote_plus(artist_song)
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(f"https://google.com/search?q={searchquery}+lyrics") as resp:
-                response_one = await resp.text()
-        soup = BeautifulSoup(response_one, "html.parser")
-        bouncer = "Our systems have detected unusual traffic from your computer network"
-        if bouncer in soup.get_text():
-            title_ = ""
-            artist_ = ""
-            lyrics_ = "Unable to get lyrics right now. Try again later."
-            source_ = ""
-        else:
-            try:
-                title_ = soup.find("span", class_="BNeawe tAd8D AP7Wnd").get_text()
-                artist_ = soup.find_all("span", class_="BNeawe s3v9rd AP7Wnd")[-1].get_text()
-                lyrics_ = soup.find_all("div", class_="BNeawe tAd8D AP7Wnd")[-1].get_text()
-                source_ = soup.find_all("span", class_="uEec3 AP7Wnd")[-1].get_text()
-            except AttributeError:
-                title_, artist_, lyrics_, source_ = (
-                    "",
-                    "",
-                    f"Not able to find the lyrics for {artist_song}.",
-                    "",
-                )
-        return title_, artist_, lyrics_, source_
+        async with self.http.request(
+            "GET", f"https://google.com/search?q={searchquery}+lyrics", service="lyrics"
+        ) as resp:
+            response_one = await resp.text()
+        if _BOUNCER in response_one:
+            return "", "", "Unable to get lyrics right now. Try again later.", ""
+        loop = asyncio.get_running_loop()
+        lyrics = await loop.run_in_executor(None, _parse_lyrics_page, response_one)
+        if self.api_interface is not None:
+            time_now = int(time.time())
+            self.api_interface.local_cache_api.lyrics.remember(key, lyrics, time_now)
+            data = json.dumps(lyrics) if lyrics is not None else None
+            await self.api_interface.append_task(
+                "insert", ("lyrics", [{"key": key, "data": data, "last_updated": time_now}])
+            )
+        if lyrics is None:
+            return "", "", f"Not able to find the lyrics for {artist_song}.", ""
+        return lyrics
+
+    async def prefetch_lyrics(self, artist_song: str) -> None:
+        """Warm the lyrics cache for a song that is about to play."""
+        try:
+            await self.get_lyrics_string(artist_song)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to prefetch lyrics for %s", artist_song)
@@ -3,11 +3,23 @@ from __future__ import annotations
 
 # Standard Library Imports
 from abc import ABC
-from typing import Any, cast, Final, Mapping, MutableMapping, Optional, Pattern, Union
+from typing import (
+    Any,
+    cast,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Pattern,
+    Union,
+)
 import asyncio
 import contextlib
 import datetime
 import functools
+import itertools
 import logging
 import re
 import struct
@@ -43,6 +55,151 @@ _RE_TIME_CONVERTER: Final[Pattern] = re.compile(r"(?:(\d+):)?([0-5]?[0-9]):([0-5
 _prefer_lyrics_cache = {}
 
 
+def _track_duration(track: lavalink.Track) -> int:
+    return 0 if track.is_stream else track.length
+
+
+class TimedQueue(list):
+    """A player queue which keeps the total duration of its tracks up to date.
+
+    Streams count as zero. Prefix sums of the durations are built on the first lookup,
+    kept as they are when tracks are added to the end or taken off either end, and
+    dropped on any other change, so the wait for a queue position is usually a lookup.
+    """
+
+    __slots__ = ("_total", "_prefix", "_base")
+
+    def __init__(self, tracks: Iterable[lavalink.Track] = ()):
+        super().__init__(tracks)
+        self._total: int = sum(map(_track_duration, self))
+        self._prefix: Optional[List[int]] = None
+        self._base: int = 0
+
+    @classmethod
+    def of(cls, player: lavalink.Player) -> TimedQueue:
+        """The queue of `player`, wrapped again whenever it was replaced by a plain list."""
+        queue = player.queue
+        if not isinstance(queue, cls):
+            queue = player.queue = cls(queue)
+        return queue
+
+    @property
+    def duration(self) -> int:
+        return self._total
+
+    def duration_before(self, index: int) -> int:
+        """The total duration of the tracks in front of `index`."""
+        if index >= len(self):
+            return self._total
+        index = max(0, index)
+        if self._prefix is None:
+            self._prefix = [0]
+            self._prefix.extend(itertools.accumulate(map(_track_duration, self)))
+            self._base = 0
+        return self._prefix[self._base + index] - self._prefix[self._base]
+
+    def _push(self, duration: int) -> None:
+        if self._prefix is not None:
+            self._prefix.append(self._prefix[-1] + duration)
+
+    def append(self, track: lavalink.Track) -> None:
+        super().append(track)
+        duration = _track_duration(track)
+        self._total += duration
+        self._push(duration)
+
+    def extend(self, tracks: Iterable[lavalink.Track]) -> None:
+        tracks = list(tracks)
+        super().extend(tracks)
+        for track in tracks:
+            duration = _track_duration(track)
+            self._total += duration
+            self._push(duration)
+
+    def __iadd__(self, tracks: Iterable[lavalink.Track]) -> TimedQueue:
+        self.extend(tracks)
+        return self
+
+    def insert(self, index: int, track: lavalink.Track) -> None:
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        super().insert(index, track)
+        duration = _track_duration(track)
+        self._total += duration
+        if self._prefix is None:
+            return
+        if index >= length:
+            self._push(duration)
+        elif index == 0 and self._base:
+            self._base -= 1
+            self._prefix[self._base] = self._prefix[self._base + 1] - duration
+        else:
+            self._prefix = None
+
+    def pop(self, index: int = -1) -> lavalink.Track:
+        length = len(self)
+        track = super().pop(index)
+        if index < 0:
+            index += length
+        self._total -= _track_duration(track)
+        if self._prefix is None:
+            return track
+        if index == length - 1:
+            self._prefix.pop()
+        elif index == 0:
+            self._base += 1
+            if self._base > length:
+                del self._prefix[: self._base]
+                self._base = 0
+        else:
+            self._prefix = None
+        return track
+
+    def remove(self, track: lavalink.Track) -> None:
+        self.pop(self.index(track))
+
+    def clear(self) -> None:
+        super().clear()
+        self._total = 0
+        self._prefix = None
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            old = self[index]
+            super().__setitem__(index, value)
+            self._total += sum(map(_track_duration, value)) - sum(map(_track_duration, old))
+        else:
+            old = self[index]
+            super().__setitem__(index, value)
+            self._total += _track_duration(value) - _track_duration(old)
+        self._prefix = None
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            old = self[index]
+            super().__delitem__(index)
+            self._total -= sum(map(_track_duration, old))
+            self._prefix = None
+        else:
+            self.pop(index)
+
+    def __imul__(self, times: int) -> TimedQueue:
+        super().__imul__(times)
+        self._total = sum(map(_track_duration, self))
+        self._prefix = None
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._prefix = None
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._prefix = None
+
+
 class MiscellaneousUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def _clear_react(
         self, message: discord.Message, emoji: MutableMapping = None
@@ -133,14 +290,12 @@ class MiscellaneousUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         perms = channel.permissions_for(channel.guild.me)
         return all((perms.send_messages, perms.embed_links))
 
-    async def maybe_run_pending_db_tasks(self, ctx: commands.Context) -> None:
-        if self.api_interface is not None:
-            await self.api_interface.run_tasks(ctx)
-
     async def _close_database(self) -> None:
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
-            self.api_interface.close()
+            await self.api_interface.youtube_api.quota.close()
+            await self.api_interface.close()
+        await self.http.close()
 
     async def _check_api_tokens(self) -> MutableMapping:
         spotify = await self.bot.get_shared_api_tokens("spotify")
@@ -229,14 +384,16 @@ class MiscellaneousUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 return 0
 
     async def queue_duration(self, ctx: commands.Context) -> int:
+        return await self.queue_time_until(ctx, None)
+
+    async def queue_time_until(self, ctx: commands.Context, position: Optional[int]) -> int:
+        """The time until track #`position` of the queue plays, the whole queue for None."""
         player = lavalink.get_player(ctx.guild.id)
-        dur = [
-            i.length
-            async for i in AsyncIter(player.queue, steps=50).filter(lambda x: not x.is_stream)
-        ]
-        queue_dur = sum(dur)
-        if not player.queue:
-            queue_dur = 0
+        queue = TimedQueue.of(player)
+        if position is None:
+            queue_dur = queue.duration
+        else:
+            queue_dur = queue.duration_before(position - 1)
         try:
             if not player.current.is_stream:
                 remain = player.current.length - player.position
@@ -3,38 +3,182 @@ from __future__ import annotations
 
 # Standard Library Imports
 from abc import ABC
-from typing import Final, Optional
+from typing import Dict, Final, Optional, Set, Tuple
+import asyncio
 import logging
 import re
 import struct
+import time
 
 # Dependency Imports
 import aiohttp
 
 # Music Imports
+from ...audio_logging import debug_exc_log
+from ...utils import task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Music.cog.Utilities.Parsing")
 
 STREAM_TITLE: Final[re.Pattern] = re.compile(br"StreamTitle='([^']*)';")
+_MAX_POLL_DELAY: Final[float] = 300.0
+
+
+class NoIcyMetadata(Exception):
+    """The stream answered without an ``icy-metaint`` header."""
+
+
+async def read_icy_title(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """Read the current ``StreamTitle`` from the first metadata blocks of a stream.
+
+    Raises :class:`NoIcyMetadata` when the server does not send ICY metadata at all.
+    """
+    try:
+        async with session.get(url, headers={"Icy-MetaData": "1"}) as resp:
+            try:
+                metaint = int(resp.headers["icy-metaint"])
+            except (KeyError, ValueError):
+                raise NoIcyMetadata(url)
+            for _ in range(5):
+                await resp.content.readexactly(metaint)
+                metadata_length = struct.unpack("B", await resp.content.readexactly(1))[0] * 16
+                metadata = await resp.content.readexactly(metadata_length)
+                m = re.search(STREAM_TITLE, metadata.rstrip(b"\0"))
+                if not m:
+                    return None
+                title = m.group(1)
+                if title:
+                    title = title.decode("utf-8", errors="replace")
+                    return title
+    except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError):
+        return None
+
+
+class IcyMetadataPoller:
+    """Keep the current title of live streams in memory.
+
+    Every stream URL played by at least one player gets a single background task that
+    re-reads its metadata every ``interval`` seconds, players sharing a station share
+    the task. Titles are served from memory and are dropped after ``ttl`` seconds
+    without a successful read, so rendering a stream never waits on stream I/O.
+    Expired titles of streams nobody polls are purged whenever another title is read.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, interval: float = 15.0, ttl: float = 45.0):
+        self._session = session
+        self.interval = interval
+        self.ttl = ttl
+        self._titles: Dict[str, Tuple[Optional[str], float]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._users: Dict[str, Set[int]] = {}
+        self._guild_urls: Dict[int, str] = {}
+
+    def get(self, url: str) -> Optional[str]:
+        """The cached title of `url`, a background read is started when there is none."""
+        entry = self._titles.get(url)
+        if entry is not None:
+            (title, fetched_at) = entry
+            if time.monotonic() - fetched_at < self.ttl:
+                return title
+            del self._titles[url]
+        if url not in self._pollers and url not in self._refreshes:
+            task = asyncio.create_task(self._refresh(url))
+            task.add_done_callback(task_callback)
+            self._refreshes[url] = task
+        return None
+
+    def acquire(self, guild_id: int, url: str) -> None:
+        """Poll `url` for as long as the player of `guild_id` is playing it."""
+        if self._guild_urls.get(guild_id) == url:
+            return
+        self.release(guild_id)
+        self._guild_urls[guild_id] = url
+        self._users.setdefault(url, set()).add(guild_id)
+        if url not in self._pollers:
+            task = asyncio.create_task(self._poll(url))
+            task.add_done_callback(task_callback)
+            self._pollers[url] = task
+
+    def release(self, guild_id: int) -> None:
+        """Stop polling the stream of `guild_id` once no other player uses it."""
+        url = self._guild_urls.pop(guild_id, None)
+        if url is None:
+            return
+        users = self._users.get(url)
+        if users is not None:
+            users.discard(guild_id)
+            if users:
+                return
+            del self._users[url]
+        task = self._pollers.pop(url, None)
+        if task is not None:
+            task.cancel()
+        self._titles.pop(url, None)
+
+    async def _refresh(self, url: str) -> None:
+        title = None
+        try:
+            title = await asyncio.wait_for(
+                read_icy_title(self._session, url), timeout=self.interval
+            )
+        except (asyncio.TimeoutError, NoIcyMetadata):
+            pass
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to read the stream title of %s", url)
+        finally:
+            self._refreshes.pop(url, None)
+        now = time.monotonic()
+        self._purge_expired(now)
+        self._titles[url] = (title, now)
+
+    def _purge_expired(self, now: float) -> None:
+        # Titles read once through `get` are otherwise only dropped when asked for again.
+        expired = [
+            url
+            for (url, (_title, fetched_at)) in self._titles.items()
+            if now - fetched_at >= self.ttl and url not in self._pollers
+        ]
+        for url in expired:
+            del self._titles[url]
+
+    async def _poll(self, url: str) -> None:
+        delay = self.interval
+        try:
+            while True:
+                try:
+                    title = await asyncio.wait_for(
+                        read_icy_title(self._session, url), timeout=self.interval
+                    )
+                except NoIcyMetadata:
+                    # Not an ICY stream (e.g. a YouTube or Twitch live), only check back rarely.
+                    self._titles[url] = (None, time.monotonic())
+                    delay = _MAX_POLL_DELAY
+                except asyncio.TimeoutError:
+                    delay = min(delay * 2, _MAX_POLL_DELAY)
+                except Exception as exc:
+                    debug_exc_log(log, exc, "Failed to read the stream title of %s", url)
+                    delay = min(delay * 2, _MAX_POLL_DELAY)
+                else:
+                    self._titles[url] = (title, time.monotonic())
+                    delay = self.interval
+                await asyncio.sleep(delay)
+        finally:
+            if self._pollers.get(url) is asyncio.current_task():
+                del self._pollers[url]
+
+    def close(self) -> None:
+        """Cancel every background read."""
+        for task in [*self._pollers.values(), *self._refreshes.values()]:
+            task.cancel()
+        self._pollers.clear()
+        self._refreshes.clear()
+        self._users.clear()
+        self._guild_urls.clear()
+        self._titles.clear()
 
 
 class ParsingUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def icyparser(self, url: str) -> Optional[str]:
-        try:
-            async with self.session.get(url, headers={"Icy-MetaData": "1"}) as resp:
-                metaint = int(resp.headers["icy-metaint"])
-                for _ in range(5):
-                    await resp.content.readexactly(metaint)
-                    metadata_length = struct.unpack("B", await resp.content.readexactly(1))[0] * 16
-                    metadata = await resp.content.readexactly(metadata_length)
-                    m = re.search(STREAM_TITLE, metadata.rstrip(b"\0"))
-                    if not m:
-                        return None
-                    title = m.group(1)
-                    if title:
-                        title = title.decode("utf-8", errors="replace")
-                        return title
-        except (KeyError, aiohttp.ClientConnectionError, aiohttp.ClientResponseError):
-            return None
+        return self.icy_poller.get(url)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC
 from typing import List, Optional, Tuple, Union
 import asyncio
+import functools
 import logging
 import time
 
@@ -25,7 +26,7 @@ import lavalink
 from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query
 from ...audio_logging import debug_exc_log, IS_DEBUG
 from ...errors import QueryUnauthorized, SpotifyFetchError, TrackEnqueueError
-from ...utils import Notifier
+from ...utils import Notifier, task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -338,6 +339,10 @@ class PlayerUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 self.update_player_lock(ctx, False)
                 raise e
         elif query.is_album or query.is_playlist:
+            if enqueue_tracks:
+                return await self.start_enqueue_job(
+                    ctx, "album" if query.is_album else "playlist", query, forced=forced
+                )
             try:
                 self.update_player_lock(ctx, True)
                 track_list = await self.fetch_spotify_playlist(
@@ -436,9 +441,9 @@ class PlayerUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 return await self.send_embed_msg(ctx, embed=embed)
         else:
             tracks = query
-        queue_dur = await self.queue_duration(ctx)
-        queue_total_duration = self.format_time(queue_dur)
         before_queue_length = len(player.queue)
+        queue_dur = await self.queue_time_until(ctx, before_queue_length + 1)
+        queue_total_duration = self.format_time(queue_dur)
 
         if not first_track_only and len(tracks) > 1:
             # a list of Tracks where all should be enqueued
@@ -631,6 +636,59 @@ class PlayerUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         message = await self.send_embed_msg(ctx, embed=embed)
         return single_track or message
 
+    async def start_enqueue_job(
+        self, ctx: commands.Context, stype: str, query: Query, forced: bool = False
+    ) -> Union[discord.Message, List[lavalink.Track]]:
+        """Enqueue a Spotify playlist or album in the background.
+
+        Returns once the first track has been added to the queue, the rest of the playlist
+        keeps resolving in a per guild job which can be cancelled with `cancel_enqueue_job`.
+        """
+        job = self.enqueue_jobs.get(ctx.guild.id)
+        if job is not None and not job.done():
+            return await self.send_embed_msg(
+                ctx,
+                title="Unable To Get Tracks",
+                description="Wait until the playlist has finished loading.",
+            )
+        started = asyncio.Event()
+        self.update_player_lock(ctx, True)
+        job = asyncio.create_task(
+            self.fetch_spotify_playlist(
+                ctx, stype, query, enqueue=True, forced=forced, started=started
+            )
+        )
+        job.add_done_callback(task_callback)
+        job.add_done_callback(functools.partial(self._enqueue_job_done, ctx.guild.id))
+        self.enqueue_jobs[ctx.guild.id] = job
+        started_task = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait({job, started_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            started_task.cancel()
+        if job.done() and not job.cancelled():
+            if job.exception() is not None:
+                # Surface errors raised before the first track to the command error handler.
+                raise job.exception()
+            return job.result()
+        return []
+
+    def _enqueue_job_done(self, guild_id: int, job: asyncio.Task) -> None:
+        if self.enqueue_jobs.get(guild_id) is job:
+            del self.enqueue_jobs[guild_id]
+            self.play_lock[guild_id] = False
+
+    def cancel_enqueue_job(self, guild: discord.Guild) -> bool:
+        """Cancel the background playlist enqueue running for `guild`, if any."""
+        job = self.enqueue_jobs.pop(guild.id, None)
+        if job is None or job.done():
+            return False
+        if IS_DEBUG:
+            log.debug("Cancelling playlist enqueue in %r (%d)", guild.name, guild.id)
+        job.cancel()
+        self.play_lock[guild.id] = False
+        return True
+
     async def fetch_spotify_playlist(
         self,
         ctx: commands.Context,
@@ -638,6 +696,7 @@ class PlayerUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         query: Query,
         enqueue: bool = False,
         forced: bool = False,
+        started: Optional[asyncio.Event] = None,
     ):
         player = lavalink.get_player(ctx.guild.id)
         try:
@@ -663,6 +722,7 @@ class PlayerUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 notifier=notifier,
                 forced=forced,
                 query_global=self.global_api_user.get("can_read"),
+                started=started,
             )
         except SpotifyFetchError as error:
             self.update_player_lock(ctx, False)
@@ -14,7 +14,6 @@ import time
 
 # Dependency Imports
 from discord.embeds import EmptyEmbed
-import aiohttp
 import discord
 
 # My Modded Imports
@@ -696,22 +695,23 @@ class PlaylistUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return str(ctx) if ctx else "the User" if the else "User"
 
     async def _get_bundled_playlist_tracks(self):
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(
-                CURRATED_DATA + f"?timestamp={int(time.time())}",
-                headers={"content-type": "application/json"},
-            ) as response:
-                if response.status != 200:
-                    return 0, []
-                try:
-                    data = json.loads(await response.read())
-                except Exception:
-                    log.exception("Curated playlist couldn't be parsed, report this error.")
-                    data = {}
-                web_version = data.get("version", 0)
-                entries = data.get("entries", [])
-                if entries:
-                    random.shuffle(entries)
+        async with self.http.request(
+            "GET",
+            CURRATED_DATA + f"?timestamp={int(time.time())}",
+            service="curated",
+            headers={"content-type": "application/json"},
+        ) as response:
+            if response.status != 200:
+                return 0, []
+            try:
+                data = json.loads(await response.read())
+            except Exception:
+                log.exception("Curated playlist couldn't be parsed, report this error.")
+                data = {}
+            web_version = data.get("version", 0)
+            entries = data.get("entries", [])
+            if entries:
+                random.shuffle(entries)
         tracks = []
         async for entry in AsyncIter(entries, steps=25):
             with contextlib.suppress(Exception):
@@ -8,7 +8,6 @@ import logging
 import math
 
 # Dependency Imports
-from fuzzywuzzy import process
 from redbot.core import commands
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import humanize_number
@@ -19,6 +18,7 @@ import lavalink
 
 # Music Imports
 from ...audio_dataclasses import LocalPath, Query
+from ...utils import SearchIndex
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -110,32 +110,36 @@ class QueueUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         embed.set_footer(text=text)
         return embed
 
+    def _queue_search_title(self, track: lavalink.Track) -> str:
+        if self.match_url(track.uri):
+            return track.title
+        query = Query.process_input(track, self.local_folder_current_path)
+        if (
+            query.is_local
+            and query.local_track_path is not None
+            and track.title == "Unknown title"
+        ):
+            return query.local_track_path.to_string_user()
+        return "{} - {}".format(track.author, track.title)
+
     async def _build_queue_search_list(
-        self, queue_list: List[lavalink.Track], search_words: str
+        self, player: lavalink.Player, search_words: str
     ) -> List[Tuple[int, str]]:
-        track_list = []
-        async for queue_idx, track in AsyncIter(queue_list).enumerate(start=1):
-            if not self.match_url(track.uri):
-                query = Query.process_input(track, self.local_folder_current_path)
-                if (
-                    query.is_local
-                    and query.local_track_path is not None
-                    and track.title == "Unknown title"
-                ):
-                    track_title = query.local_track_path.to_string_user()
-                else:
-                    track_title = "{} - {}".format(track.author, track.title)
-            else:
-                track_title = track.title
-
-            song_info = {str(queue_idx): track_title}
-            track_list.append(song_info)
-        search_results = process.extract(search_words, track_list, limit=50)
+        # The index lives on the player and only describes tracks added since the last search.
+        index = player.fetch("queue_search_index")
+        if index is None:
+            index = SearchIndex()
+            player.store("queue_search_index", index)
+        positions = {}
+        async for queue_idx, track in AsyncIter(player.queue.copy()).enumerate(start=1):
+            positions[id(track)] = (queue_idx, track)
+        await index.sync(
+            {key: track for (key, (_, track)) in positions.items()}, self._queue_search_title
+        )
         search_list = []
-        async for search, percent_match in AsyncIter(search_results):
-            async for queue_position, title in AsyncIter(search.items()):
-                if percent_match > 89:
-                    search_list.append((queue_position, title))
+        for (key, title, percent_match) in await index.search(search_words, limit=50):
+            if percent_match > 89:
+                search_list.append((positions[key][0], title))
         return search_list
 
     async def _build_queue_search_page(
@@ -37,6 +37,8 @@ __all__ = [
     "YOUTUBE_QUERY_ALL",
     "YOUTUBE_DELETE_OLD_ENTRIES",
     "YOUTUBE_QUERY_LAST_FETCHED_RANDOM",
+    "YOUTUBE_QUERY_MANY",
+    "YOUTUBE_QUERY_MANY_TEMP",
     # Spotify table statements
     "SPOTIFY_DROP_TABLE",
     "SPOTIFY_CREATE_INDEX",
@@ -47,6 +49,21 @@ __all__ = [
     "SPOTIFY_UPDATE",
     "SPOTIFY_DELETE_OLD_ENTRIES",
     "SPOTIFY_QUERY_LAST_FETCHED_RANDOM",
+    "SPOTIFY_QUERY_MANY",
+    "SPOTIFY_QUERY_MANY_TEMP",
+    # Spotify collection table statements
+    "SPOTIFY_COLLECTION_DROP_TABLE",
+    "SPOTIFY_COLLECTION_CREATE_TABLE",
+    "SPOTIFY_COLLECTION_UPSERT",
+    "SPOTIFY_COLLECTION_UPDATE",
+    "SPOTIFY_COLLECTION_QUERY",
+    "SPOTIFY_COLLECTION_DELETE_OLD_ENTRIES",
+    # Lyrics table statements
+    "LYRICS_DROP_TABLE",
+    "LYRICS_CREATE_TABLE",
+    "LYRICS_UPSERT",
+    "LYRICS_QUERY",
+    "LYRICS_DELETE_OLD_ENTRIES",
     # Lavalink table statements
     "LAVALINK_DROP_TABLE",
     "LAVALINK_CREATE_TABLE",
@@ -58,6 +75,45 @@ __all__ = [
     "LAVALINK_QUERY_LAST_FETCHED_RANDOM",
     "LAVALINK_DELETE_OLD_ENTRIES",
     "LAVALINK_FETCH_ALL_ENTRIES_GLOBAL",
+    "LAVALINK_FETCH_ENTRIES_GLOBAL_CHUNK",
+    "LAVALINK_QUERY_MANY",
+    "LAVALINK_QUERY_MANY_TEMP",
+    # Global upload queue statements
+    "GLOBAL_UPLOAD_DROP_TABLE",
+    "GLOBAL_UPLOAD_CREATE_TABLE",
+    "GLOBAL_UPLOAD_CREATE_INDEX",
+    "GLOBAL_UPLOAD_UPSERT",
+    "GLOBAL_UPLOAD_FETCH_DUE",
+    "GLOBAL_UPLOAD_DELETE",
+    "GLOBAL_UPLOAD_RESCHEDULE",
+    "GLOBAL_UPLOAD_COUNT",
+    # Local tracks index statements
+    "LOCALTRACKS_DROP_TABLE",
+    "LOCALTRACKS_CREATE_TABLE",
+    "LOCALTRACKS_CREATE_INDEX",
+    "LOCALTRACKS_INSERT",
+    "LOCALTRACKS_DELETE_FOLDER",
+    "LOCALTRACKS_QUERY_FOLDER",
+    "LOCALTRACKS_QUERY_TREE",
+    "LOCALTRACKS_FOLDERS_DROP_TABLE",
+    "LOCALTRACKS_FOLDERS_CREATE_TABLE",
+    "LOCALTRACKS_FOLDERS_UPSERT",
+    "LOCALTRACKS_FOLDERS_DELETE",
+    "LOCALTRACKS_FOLDERS_QUERY_ALL",
+    "LOCALTRACKS_FOLDERS_QUERY_CHILDREN",
+    "LOCALTRACKS_FOLDERS_QUERY_TREE",
+    "LOCALTRACKS_LOADS_DROP_TABLE",
+    "LOCALTRACKS_LOADS_CREATE_TABLE",
+    "LOCALTRACKS_LOADS_CREATE_INDEX",
+    "LOCALTRACKS_LOADS_UPSERT",
+    "LOCALTRACKS_LOADS_QUERY_MANY",
+    "LOCALTRACKS_LOADS_QUERY_TREE",
+    "LOCALTRACKS_LOADS_DELETE_FOLDER",
+    "LOCALTRACKS_LOADS_DELETE_MISSING",
+    # Temporary lookup key statements
+    "TEMP_LOOKUP_CREATE_TABLE",
+    "TEMP_LOOKUP_INSERT",
+    "TEMP_LOOKUP_CLEAR",
     # Persisting Queue statements
     "PERSIST_QUEUE_DROP_TABLE",
     "PERSIST_QUEUE_CREATE_TABLE",
@@ -374,6 +430,27 @@ LIMIT 100
 ;
 """
 
+YOUTUBE_QUERY_MANY: Final[
+    str
+] = """
+SELECT track_info, youtube_url, last_updated
+FROM youtube
+WHERE
+    track_info IN ({placeholders})
+    AND last_updated > :maxage
+;
+"""
+YOUTUBE_QUERY_MANY_TEMP: Final[
+    str
+] = """
+SELECT youtube.track_info, youtube.youtube_url, youtube.last_updated
+FROM youtube
+INNER JOIN temp.lookup_keys ON youtube.track_info = temp.lookup_keys.key
+WHERE
+    youtube.last_updated > :maxage
+;
+"""
+
 # Spotify table statements
 SPOTIFY_DROP_TABLE: Final[
     str
@@ -471,6 +548,147 @@ LIMIT 100
 ;
 """
 
+SPOTIFY_QUERY_MANY: Final[
+    str
+] = """
+SELECT uri, track_info, last_updated
+FROM spotify
+WHERE
+    uri IN ({placeholders})
+    AND last_updated > :maxage
+;
+"""
+SPOTIFY_QUERY_MANY_TEMP: Final[
+    str
+] = """
+SELECT spotify.uri, spotify.track_info, spotify.last_updated
+FROM spotify
+INNER JOIN temp.lookup_keys ON spotify.uri = temp.lookup_keys.key
+WHERE
+    spotify.last_updated > :maxage
+;
+"""
+
+# Spotify collection table statements
+SPOTIFY_COLLECTION_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS spotify_collection;
+"""
+SPOTIFY_COLLECTION_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS spotify_collection(
+    uri TEXT PRIMARY KEY,
+    snapshot_id TEXT,
+    tracks JSON,
+    last_updated INTEGER,
+    last_fetched INTEGER
+);
+"""
+SPOTIFY_COLLECTION_UPSERT: Final[
+    str
+] = """INSERT INTO
+spotify_collection
+  (
+    uri, snapshot_id, tracks, last_updated, last_fetched
+  )
+VALUES
+  (
+    :uri, :snapshot_id, :tracks, :last_updated, :last_fetched
+  )
+ON CONFLICT
+  (
+    uri
+  )
+DO UPDATE
+  SET
+    snapshot_id = excluded.snapshot_id,
+    tracks = excluded.tracks,
+    last_updated = excluded.last_updated;
+"""
+SPOTIFY_COLLECTION_UPDATE: Final[
+    str
+] = """
+UPDATE spotify_collection
+SET last_fetched=:last_fetched
+WHERE uri=:uri;
+"""
+SPOTIFY_COLLECTION_QUERY: Final[
+    str
+] = """
+SELECT tracks, last_updated
+FROM spotify_collection
+WHERE
+    uri=:uri
+    AND snapshot_id=:snapshot_id
+    AND last_updated > :maxage
+LIMIT 1;
+"""
+SPOTIFY_COLLECTION_DELETE_OLD_ENTRIES: Final[
+    str
+] = """
+DELETE FROM spotify_collection
+WHERE
+    last_updated < :maxage
+    ;
+"""
+
+# Lyrics table statements
+# A NULL data column records that no lyrics were found, those rows expire sooner.
+LYRICS_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS lyrics;
+"""
+LYRICS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS lyrics(
+    key TEXT PRIMARY KEY,
+    data JSON,
+    last_updated INTEGER
+);
+"""
+LYRICS_UPSERT: Final[
+    str
+] = """INSERT INTO
+lyrics
+  (
+    key, data, last_updated
+  )
+VALUES
+  (
+    :key, :data, :last_updated
+  )
+ON CONFLICT
+  (
+    key
+  )
+DO UPDATE
+  SET
+    data = excluded.data,
+    last_updated = excluded.last_updated;
+"""
+LYRICS_QUERY: Final[
+    str
+] = """
+SELECT data, last_updated
+FROM lyrics
+WHERE
+    key=:key
+    AND last_updated > (CASE WHEN data IS NULL THEN :negative_maxage ELSE :maxage END)
+LIMIT 1;
+"""
+LYRICS_DELETE_OLD_ENTRIES: Final[
+    str
+] = """
+DELETE FROM lyrics
+WHERE
+    last_updated < :maxage
+    ;
+"""
+
 # Lavalink table statements
 LAVALINK_DROP_TABLE: Final[
     str
@@ -568,6 +786,345 @@ LAVALINK_FETCH_ALL_ENTRIES_GLOBAL: Final[
 SELECT query, data
 FROM lavalink
 """
+LAVALINK_FETCH_ENTRIES_GLOBAL_CHUNK: Final[
+    str
+] = """
+SELECT query, data
+FROM lavalink
+WHERE
+    query > :last_query
+ORDER BY query
+LIMIT :limit
+;
+"""
+
+LAVALINK_QUERY_MANY: Final[
+    str
+] = """
+SELECT query, data, last_updated
+FROM lavalink
+WHERE
+    query IN ({placeholders})
+    AND last_updated > :maxage
+;
+"""
+LAVALINK_QUERY_MANY_TEMP: Final[
+    str
+] = """
+SELECT lavalink.query, lavalink.data, lavalink.last_updated
+FROM lavalink
+INNER JOIN temp.lookup_keys ON lavalink.query = temp.lookup_keys.key
+WHERE
+    lavalink.last_updated > :maxage
+;
+"""
+
+# Global upload queue statements
+# Contributions waiting to be posted to the Global API, drained by a background worker.
+GLOBAL_UPLOAD_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS global_upload;
+"""
+GLOBAL_UPLOAD_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS global_upload(
+    query TEXT PRIMARY KEY,
+    data JSON,
+    attempts INTEGER DEFAULT 0,
+    next_attempt INTEGER
+);
+"""
+GLOBAL_UPLOAD_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_global_upload_next_attempt
+ON global_upload (next_attempt);
+"""
+GLOBAL_UPLOAD_UPSERT: Final[
+    str
+] = """INSERT INTO
+global_upload
+  (
+    query, data, attempts, next_attempt
+  )
+VALUES
+  (
+    :query, :data, 0, :next_attempt
+  )
+ON CONFLICT
+  (
+    query
+  )
+DO UPDATE
+  SET
+    data = excluded.data;
+"""
+GLOBAL_UPLOAD_FETCH_DUE: Final[
+    str
+] = """
+SELECT query, data, attempts
+FROM global_upload
+WHERE
+    next_attempt <= :now
+ORDER BY next_attempt
+LIMIT :limit
+;
+"""
+GLOBAL_UPLOAD_DELETE: Final[
+    str
+] = """
+DELETE FROM global_upload
+WHERE query = :query
+;
+"""
+GLOBAL_UPLOAD_RESCHEDULE: Final[
+    str
+] = """
+UPDATE global_upload
+SET
+    attempts = :attempts,
+    next_attempt = :next_attempt
+WHERE query = :query
+;
+"""
+GLOBAL_UPLOAD_COUNT: Final[
+    str
+] = """
+SELECT COUNT(*)
+FROM global_upload
+;
+"""
+
+# Local tracks index statements
+# Every music file under the localtracks folder, kept up to date by a background scanner.
+# Trees are matched with a range on the folder path so the folder index is used,
+# :lower is the folder followed by the path separator and :upper the character after it.
+LOCALTRACKS_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS localtracks;
+"""
+LOCALTRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS localtracks(
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    extension TEXT
+);
+"""
+LOCALTRACKS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_localtracks_folder
+ON localtracks (folder, path);
+"""
+LOCALTRACKS_INSERT: Final[
+    str
+] = """INSERT OR REPLACE INTO
+localtracks
+  (
+    path, folder, size, mtime, extension
+  )
+VALUES
+  (
+    :path, :folder, :size, :mtime, :extension
+  )
+;
+"""
+LOCALTRACKS_DELETE_FOLDER: Final[
+    str
+] = """
+DELETE FROM localtracks
+WHERE folder = :folder
+;
+"""
+LOCALTRACKS_QUERY_FOLDER: Final[
+    str
+] = """
+SELECT path
+FROM localtracks
+WHERE folder = :folder
+;
+"""
+LOCALTRACKS_QUERY_TREE: Final[
+    str
+] = """
+SELECT path
+FROM localtracks
+WHERE
+    folder = :folder
+    OR (folder > :lower AND folder < :upper)
+;
+"""
+LOCALTRACKS_FOLDERS_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS localtracks_folders;
+"""
+LOCALTRACKS_FOLDERS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS localtracks_folders(
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime REAL
+);
+"""
+LOCALTRACKS_FOLDERS_UPSERT: Final[
+    str
+] = """INSERT INTO
+localtracks_folders
+  (
+    path, parent, mtime
+  )
+VALUES
+  (
+    :path, :parent, :mtime
+  )
+ON CONFLICT
+  (
+    path
+  )
+DO UPDATE
+  SET
+    parent = excluded.parent,
+    mtime = excluded.mtime;
+"""
+LOCALTRACKS_FOLDERS_DELETE: Final[
+    str
+] = """
+DELETE FROM localtracks_folders
+WHERE path = :path
+;
+"""
+LOCALTRACKS_FOLDERS_QUERY_ALL: Final[
+    str
+] = """
+SELECT path, parent, mtime
+FROM localtracks_folders
+;
+"""
+LOCALTRACKS_FOLDERS_QUERY_CHILDREN: Final[
+    str
+] = """
+SELECT path
+FROM localtracks_folders
+WHERE parent = :folder
+;
+"""
+LOCALTRACKS_FOLDERS_QUERY_TREE: Final[
+    str
+] = """
+SELECT path
+FROM localtracks_folders
+WHERE path > :lower AND path < :upper
+;
+"""
+# Lavalink load results of local files, only valid while the size and mtime still match.
+LOCALTRACKS_LOADS_DROP_TABLE: Final[
+    str
+] = """
+DROP TABLE IF EXISTS localtracks_loads;
+"""
+LOCALTRACKS_LOADS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS localtracks_loads(
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    data JSON
+);
+"""
+LOCALTRACKS_LOADS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_localtracks_loads_folder
+ON localtracks_loads (folder, path);
+"""
+LOCALTRACKS_LOADS_UPSERT: Final[
+    str
+] = """INSERT INTO
+localtracks_loads
+  (
+    path, folder, size, mtime, data
+  )
+VALUES
+  (
+    :path, :folder, :size, :mtime, :data
+  )
+ON CONFLICT
+  (
+    path
+  )
+DO UPDATE
+  SET
+    size = excluded.size,
+    mtime = excluded.mtime,
+    data = excluded.data;
+"""
+LOCALTRACKS_LOADS_QUERY_MANY: Final[
+    str
+] = """
+SELECT path, size, mtime, data
+FROM localtracks_loads
+WHERE path IN ({placeholders})
+;
+"""
+LOCALTRACKS_LOADS_QUERY_TREE: Final[
+    str
+] = """
+SELECT path, size, mtime, data
+FROM localtracks_loads
+WHERE
+    folder = :folder
+    OR (folder > :lower AND folder < :upper)
+;
+"""
+LOCALTRACKS_LOADS_DELETE_FOLDER: Final[
+    str
+] = """
+DELETE FROM localtracks_loads
+WHERE folder = :folder
+;
+"""
+LOCALTRACKS_LOADS_DELETE_MISSING: Final[
+    str
+] = """
+DELETE FROM localtracks_loads
+WHERE
+    folder = :folder
+    AND path NOT IN (SELECT path FROM localtracks WHERE folder = :folder)
+;
+"""
+
+# Temporary lookup key statements
+# Used by the bulk lookups when a batch is too large for a single IN (...) clause.
+# They live in the temp schema of the connection running them, so concurrent
+# readers never see each other's keys.
+TEMP_LOOKUP_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TEMP TABLE IF NOT EXISTS lookup_keys(
+    key TEXT PRIMARY KEY
+);
+"""
+TEMP_LOOKUP_INSERT: Final[
+    str
+] = """
+INSERT OR IGNORE INTO temp.lookup_keys (key) VALUES (:key);
+"""
+TEMP_LOOKUP_CLEAR: Final[
+    str
+] = """
+DELETE FROM temp.lookup_keys;
+"""
 
 # Persisting Queue statements
 PERSIST_QUEUE_DROP_TABLE: Final[
@@ -2,19 +2,22 @@
 from __future__ import annotations
 
 # Standard Library Imports
+from collections import Counter, defaultdict
 from enum import Enum, unique
-from functools import wraps
+from functools import partial, wraps
 from shutil import copyfile
-from typing import MutableMapping
+from typing import Any, Callable, Dict, Hashable, List, Mapping, MutableMapping, Set, Tuple
 import asyncio
 import contextlib
 import datetime
 import logging
+import math
 import re
 import time
 
 # Dependency Imports
 from async_lru import alru_cache
+from fuzzywuzzy import process
 from redbot.core import commands, data_manager
 import discord
 
@@ -24,6 +27,7 @@ BOT_SONG_RE = re.compile(
     r"((\[)|(\()).*(of?ficial|feat\.?|" r"ft\.?|audio|video|lyrics?|remix|HD).*(?(2)]|\))",
     flags=re.I,
 )
+_RE_NON_WORD = re.compile(r"[\W_]+")
 
 
 class CacheLevel:
@@ -258,3 +262,94 @@ def timed_alru_cache(seconds: int, maxsize: int = 128):
         return wrapped_func
 
     return wrapper_cache
+
+
+def _trigrams(text: str) -> Set[str]:
+    text = f" {_RE_NON_WORD.sub(' ', text.casefold()).strip()} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Trigram index narrowing fuzzy searches down to plausible candidates.
+
+    :meth:`sync` keeps the index in line with the searched collection and only describes
+    the items it has not indexed yet. :meth:`search` scores the entries sharing at least
+    ``min_overlap`` of the query's trigrams with ``fuzzywuzzy``, in an executor.
+    """
+
+    __slots__ = ("min_overlap", "_items", "_texts", "_grams", "_postings")
+
+    def __init__(self, min_overlap: float = 0.5):
+        self.min_overlap = min_overlap
+        self._items: Dict[Hashable, Any] = {}
+        self._texts: Dict[Hashable, str] = {}
+        self._grams: Dict[Hashable, Set[str]] = {}
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: Hashable, text: str, item: Any = None) -> None:
+        """Index `text` under `key`, replacing any previous entry."""
+        self._add(key, text, item, _trigrams(text))
+
+    def _add(self, key: Hashable, text: str, item: Any, grams: Set[str]) -> None:
+        self.discard(key)
+        self._items[key] = item
+        self._texts[key] = text
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def discard(self, key: Hashable) -> None:
+        grams = self._grams.pop(key, None)
+        if grams is None:
+            return
+        del self._items[key]
+        del self._texts[key]
+        for gram in grams:
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+    async def sync(self, items: Mapping[Hashable, Any], describe: Callable[[Any], str]) -> None:
+        """Index exactly `items`, calling `describe` for the new or replaced ones only.
+
+        The trigrams of the new entries are computed in an executor.
+        """
+        for key in [key for key in self._items if key not in items]:
+            self.discard(key)
+        changed = [
+            (key, item, describe(item))
+            for (key, item) in items.items()
+            if key not in self._items or self._items[key] != item
+        ]
+        if not changed:
+            return
+        grams = await asyncio.get_running_loop().run_in_executor(
+            None, partial(list, map(_trigrams, [text for (_, _, text) in changed]))
+        )
+        for ((key, item, text), item_grams) in zip(changed, grams):
+            self._add(key, text, item, item_grams)
+
+    def candidates(self, query: str) -> Dict[Hashable, str]:
+        """The entries sharing enough trigrams with `query` to be worth scoring."""
+        grams = _trigrams(query)
+        if not grams:
+            return dict(self._texts)
+        counts: Counter = Counter()
+        for gram in grams:
+            counts.update(self._postings.get(gram, ()))
+        needed = max(1, math.ceil(len(grams) * self.min_overlap))
+        return {key: self._texts[key] for (key, count) in counts.items() if count >= needed}
+
+    async def search(self, query: str, limit: int = 50) -> List[Tuple[Hashable, str, int]]:
+        """The best `limit` matches for `query` as ``(key, text, score)``, best first."""
+        choices = self.candidates(query)
+        if not choices:
+            return []
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, partial(process.extract, query, choices, limit=limit)
+        )
+        return [(key, text, score) for (text, score, key) in results]